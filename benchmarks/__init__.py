@@ -0,0 +1 @@
+# Pacote benchmarks - Gerador de catálogo sintético e medições de desempenho da Vitrine Acadêmica
@@ -0,0 +1,122 @@
+"""Benchmarks da Vitrine Acadêmica.
+
+Uso:
+
+    python -m benchmarks                                  # 1k, 10k e 100k TCCs
+    python -m benchmarks --tamanhos 1000 --saida base.json
+    python -m benchmarks.comparar base.json novo.json     # compara duas execuções
+
+Cada tamanho roda num processo separado, com um banco temporário populado
+pelo gerador sintético (mesma semente = mesmo catálogo). O resultado é um
+JSON com os tempos de cada cenário em milissegundos.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from vitrine.armazenamento import DIRETORIO_RAIZ
+
+TAMANHOS_PADRAO = (1_000, 10_000, 100_000)
+SENHA_BENCHMARK = "senha-benchmark"
+
+
+def total_usuarios(total_tccs):
+    """Quantas contas criar para um catálogo (cada cadastro custa um hash de senha)"""
+    return max(10, min(200, total_tccs // 500))
+
+
+def executar_tamanho(total_tccs, semente, repeticoes, repeticoes_paginas):
+    """Popula um banco temporário e mede todos os cenários (roda no processo atual)"""
+    from benchmarks.cenarios import medir_carga_indices, medir_cenarios
+    from benchmarks.gerador import popular
+    from benchmarks.paginas import medir_paginas, medir_partida
+    from vitrine.armazenamento import obter_armazenamento
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        # A página usa o armazenamento compartilhado do processo, então ele precisa apontar para o banco temporário
+        os.environ["VITRINE_DB"] = os.path.join(diretorio, "vitrine.db")
+        # O banco sintético não publica catálogo (nem disputa CPU com as medidas gerando um)
+        os.environ["VITRINE_CATALOGO_PUBLICO"] = "0"
+        armazenamento = obter_armazenamento()
+
+        inicio = time.perf_counter()
+        usuarios = popular(armazenamento, total_tccs, total_usuarios(total_tccs), SENHA_BENCHMARK, semente)
+        resultado = {
+            "tccs": total_tccs,
+            "usuarios": len(usuarios),
+            "populacao_s": time.perf_counter() - inicio,
+        }
+        # Antes de tudo que importa as telas, para medir a partida a frio de verdade
+        if repeticoes_paginas:
+            resultado["partida"] = medir_partida(repeticoes_paginas)
+        resultado["carga_indices"] = medir_carga_indices(armazenamento)
+        resultado["cenarios"] = medir_cenarios(armazenamento, usuarios, SENHA_BENCHMARK, repeticoes)
+        if repeticoes_paginas:
+            resultado["paginas"] = medir_paginas(armazenamento, usuarios[0], repeticoes_paginas)
+        armazenamento.fechar()
+    return resultado
+
+
+def _versao():
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"], cwd=DIRETORIO_RAIZ,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    """Ponto de entrada da linha de comando"""
+    parser = argparse.ArgumentParser(description="Mede o desempenho da Vitrine Acadêmica com dados sintéticos")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=TAMANHOS_PADRAO, help="quantidades de TCCs")
+    parser.add_argument("--semente", type=int, default=42, help="semente do gerador sintético")
+    parser.add_argument("--repeticoes", type=int, default=20, help="repetições de cada cenário")
+    parser.add_argument("--repeticoes-paginas", type=int, default=5,
+                        help="repetições da renderização das páginas (0 desliga)")
+    parser.add_argument("--saida", help="arquivo JSON de saída (padrão: benchmarks/resultados/<data>.json)")
+    parser.add_argument("--processo-unico", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.processo_unico:
+        # Execução filha: um único tamanho, resultado em JSON na saída padrão
+        resultado = executar_tamanho(args.tamanhos[0], args.semente, args.repeticoes, args.repeticoes_paginas)
+        json.dump(resultado, sys.stdout)
+        return 0
+
+    relatorio = {
+        "versao": _versao(),
+        "data": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "semente": args.semente,
+        "tamanhos": {},
+    }
+    for total_tccs in args.tamanhos:
+        print(f"Medindo {total_tccs} TCCs...", file=sys.stderr)
+        filho = subprocess.run(
+            [sys.executable, "-m", "benchmarks", "--processo-unico", "--tamanhos", str(total_tccs),
+             "--semente", str(args.semente), "--repeticoes", str(args.repeticoes),
+             "--repeticoes-paginas", str(args.repeticoes_paginas)],
+            cwd=DIRETORIO_RAIZ, stdout=subprocess.PIPE, check=True,
+        )
+        relatorio["tamanhos"][str(total_tccs)] = json.loads(filho.stdout)
+
+    saida = args.saida or os.path.join(
+        DIRETORIO_RAIZ, "benchmarks", "resultados", datetime.datetime.now().strftime("%Y%m%d-%H%M%S") + ".json")
+    os.makedirs(os.path.dirname(os.path.abspath(saida)), exist_ok=True)
+    with open(saida, "w", encoding="utf-8") as arquivo:
+        json.dump(relatorio, arquivo, ensure_ascii=False, indent=2)
+    print(f"Resultados gravados em {saida}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+import itertools
+import statistics
+import time
+
+from vitrine.analises import obter_painel
+from vitrine.busca import obter_indice_busca
+from vitrine.consultas import filtrar_ids, obter_cache_consultas
+from vitrine.facetas import obter_indice_facetas
+from vitrine.ordenacao import obter_indice_ordenacao
+from vitrine.registros import obter_catalogo
+from vitrine.similares import obter_indice_similares
+from vitrine.tags import obter_indice_tags
+from vitrine.vocabulario import obter_indice_vocabulario
+
+# Consultas de busca textual: termo comum, termo raro, prefixo (usuário digitando) e várias palavras
+CONSULTAS_BUSCA = {
+    "termo_comum": "estudo",
+    "termo_raro": "fotovoltaica",
+    "prefixo": "apren",
+    "varias_palavras": "saude mental trabalho",
+}
+
+
+def resumir(tempos):
+    """Resume uma lista de tempos (em segundos) em milissegundos"""
+    ordenados = sorted(tempos)
+    return {
+        "repeticoes": len(ordenados),
+        "min_ms": ordenados[0] * 1000,
+        "mediana_ms": statistics.median(ordenados) * 1000,
+        "p95_ms": ordenados[min(len(ordenados) - 1, int(len(ordenados) * 0.95))] * 1000,
+        "max_ms": ordenados[-1] * 1000,
+    }
+
+
+def medir(funcao, repeticoes):
+    """Executa `funcao` `repeticoes` vezes e retorna o resumo dos tempos"""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return resumir(tempos)
+
+
+def medir_carga_indices(armazenamento):
+    """Mede a montagem (a frio) de cada índice em memória a partir do banco"""
+    resultado = {}
+    indices = (
+        ("busca", obter_indice_busca),
+        ("facetas", obter_indice_facetas),
+        ("catalogo", obter_catalogo),
+        ("tags", obter_indice_tags),
+        ("ordenacao", obter_indice_ordenacao),
+        ("vocabulario", obter_indice_vocabulario),
+    )
+    for nome, obter in indices:
+        inicio = time.perf_counter()
+        obter(armazenamento)
+        resultado[nome] = resumir([time.perf_counter() - inicio])
+    # A matriz TF-IDF dos similares é montada na primeira consulta, então entra na medida
+    inicio = time.perf_counter()
+    similares = obter_indice_similares(armazenamento)
+    similares.relacionados(1)
+    resultado["similares"] = resumir([time.perf_counter() - inicio])
+    return resultado
+
+
+def medir_cenarios(armazenamento, usuarios, senha, repeticoes=20):
+    """Mede login, checagens do cadastro, geração de ID, filtros, busca e estatísticas do dashboard"""
+    # Importado aqui: a página depende do Streamlit, que só precisa existir para este cenário
+    from telas.enviartcc import generate_id
+
+    usuario = usuarios[len(usuarios) // 2]
+    facetas = obter_indice_facetas(armazenamento)
+    curso = max(facetas.contagens("curso").items(), key=lambda item: item[1])[0]
+    ano = max(facetas.contagens("ano"))
+    cenarios = {}
+
+    # Login e cadastro
+    cenarios["login_ok"] = medir(lambda: armazenamento.autenticar(usuario["usuario"], senha), repeticoes)
+    cenarios["login_senha_errada"] = medir(lambda: armazenamento.autenticar(usuario["usuario"], "errada"), repeticoes)
+    cenarios["login_usuario_inexistente"] = medir(lambda: armazenamento.autenticar("ninguem", senha), repeticoes)
+    cenarios["cadastro_usuario_duplicado"] = medir(
+        lambda: armazenamento.obter_usuario(usuario["usuario"].upper()), repeticoes)
+    cenarios["cadastro_email_duplicado"] = medir(
+        lambda: armazenamento.email_cadastrado(usuario["email"].upper()), repeticoes)
+    cenarios["cadastro_usuario_novo"] = medir(lambda: armazenamento.obter_usuario("conta.nova"), repeticoes)
+    cenarios["generate_id"] = medir(generate_id, repeticoes)
+
+    # Todas as combinações de filtro da listagem
+    for dono, com_curso, com_ano in itertools.product(("todos", "meus", "outros"), (False, True), (False, True)):
+        filtros = {
+            "usuario_id": usuario["usuario"] if dono == "meus" else None,
+            "excluir_usuario_id": usuario["usuario"] if dono == "outros" else None,
+            "curso": curso if com_curso else None,
+            "ano": ano if com_ano else None,
+        }
+        nome = f"filtro_{dono}" + ("_curso" if com_curso else "") + ("_ano" if com_ano else "")
+        cenarios[nome] = medir(lambda: filtrar_ids(armazenamento, usar_cache=False, **filtros), repeticoes)
+
+    # Busca textual, sozinha e combinada com filtro
+    for nome, consulta in CONSULTAS_BUSCA.items():
+        cenarios[f"busca_{nome}"] = medir(
+            lambda: filtrar_ids(armazenamento, busca=consulta, usar_cache=False), repeticoes)
+    cenarios["busca_termo_comum_curso"] = medir(
+        lambda: filtrar_ids(armazenamento, curso=curso, busca=CONSULTAS_BUSCA["termo_comum"], usar_cache=False),
+        repeticoes)
+
+    # Filtro por palavras-chave: uma tag (a mais usada) e as duas mais usadas juntas
+    contagem_tags = obter_indice_tags(armazenamento).contagens()
+    tags = sorted(contagem_tags, key=contagem_tags.get, reverse=True)[:2]
+    cenarios["filtro_tag"] = medir(lambda: filtrar_ids(armazenamento, tags=tags[:1], usar_cache=False), repeticoes)
+    cenarios["filtro_duas_tags"] = medir(lambda: filtrar_ids(armazenamento, tags=tags, usar_cache=False), repeticoes)
+    cenarios["nuvem_tags"] = medir(obter_indice_tags(armazenamento).nuvem, repeticoes)
+
+    # Ordenação da lista inteira e de um resultado filtrado (pelas listas pré-ordenadas)
+    cenarios["ordenar_titulo"] = medir(
+        lambda: filtrar_ids(armazenamento, ordenar_por="titulo", usar_cache=False), repeticoes)
+    cenarios["ordenar_recentes_curso"] = medir(
+        lambda: filtrar_ids(armazenamento, curso=curso, ordenar_por="cadastro", decrescente=True, usar_cache=False),
+        repeticoes)
+    cenarios["ordenar_busca_autor"] = medir(
+        lambda: filtrar_ids(armazenamento, busca=CONSULTAS_BUSCA["termo_raro"], ordenar_por="autor", usar_cache=False),
+        repeticoes)
+
+    # Mesma consulta repetida (rerun sem mudar filtros nem dados): sai do cache de consultas
+    filtrar_ids(armazenamento, curso=curso, busca=CONSULTAS_BUSCA["termo_comum"])
+    cenarios["consulta_em_cache"] = medir(
+        lambda: filtrar_ids(armazenamento, curso=curso, busca=CONSULTAS_BUSCA["termo_comum"]), repeticoes)
+
+    # Trabalhos relacionados de TCCs diferentes a cada repetição (sem o cache de relacionados)
+    similares = obter_indice_similares(armazenamento)
+    ids = itertools.count(1)
+    cenarios["relacionados_top5"] = medir(
+        lambda: similares.relacionados(next(ids) * 37 % len(similares) + 1, limite=5), repeticoes)
+
+    # Sugestões de curso e orientador enquanto o usuário digita (um prefixo diferente a cada repetição)
+    vocabulario = obter_indice_vocabulario(armazenamento)
+    prefixos = itertools.cycle(["e", "en", "eng", "ci", "cie", "di", "sis", "a", "ad", "p", "ps"])
+    cenarios["sugestoes_curso"] = medir(lambda: vocabulario.sugerir("curso", next(prefixos)), repeticoes)
+    prefixos_orientador = itertools.cycle(["a", "an", "ana", "l", "lu", "luc", "s", "si", "sil", "prof m"])
+    cenarios["sugestoes_orientador"] = medir(
+        lambda: vocabulario.sugerir("orientador", next(prefixos_orientador)), repeticoes)
+
+    # Números e séries exibidos por show_dashboard, lidos da tabela de agregados (com o cache esvaziado antes)
+    cache = obter_cache_consultas(armazenamento)
+
+    def painel_sem_cache():
+        cache.limpar()
+        obter_painel(armazenamento, usuario["usuario"])
+
+    cenarios["estatisticas_dashboard"] = medir(painel_sem_cache, repeticoes)
+    cenarios["estatisticas_lista"] = medir(lambda: facetas.estatisticas(usuario["usuario"]), repeticoes)
+
+    # Editar um TCC e voltar à lista ordenada por título (por último: altera o banco). O resultado em
+    # cache é remendado com a edição em vez de recalculado, então o custo não cresce com o catálogo
+    editados = itertools.cycle(filtrar_ids(armazenamento)[:repeticoes])
+    filtrar_ids(armazenamento, ordenar_por="titulo")
+
+    def editar_e_listar():
+        tcc_id = next(editados)
+        armazenamento.atualizar_tcc(tcc_id, {"titulo": f"Título revisado {tcc_id}"})
+        filtrar_ids(armazenamento, ordenar_por="titulo")
+
+    cenarios["editar_e_listar"] = medir(editar_e_listar, repeticoes)
+    return cenarios
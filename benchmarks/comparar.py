@@ -0,0 +1,61 @@
+"""Compara duas execuções dos benchmarks.
+
+    python -m benchmarks.comparar base.json novo.json [--limite 1.2]
+
+Para cada tamanho e cenário presentes nos dois arquivos, mostra a mediana
+antes e depois e a razão entre elas. Sai com código 1 se algum cenário
+ficou mais lento que o limite.
+"""
+import argparse
+import json
+import sys
+
+# Abaixo disso as variações são ruído de medição
+MEDIANA_MINIMA_MS = 0.05
+
+
+def _medianas(relatorio):
+    medianas = {}
+    for tamanho, resultado in relatorio["tamanhos"].items():
+        for grupo in ("partida", "carga_indices", "cenarios", "paginas"):
+            for nome, tempos in resultado.get(grupo, {}).items():
+                medianas[(int(tamanho), f"{grupo}.{nome}")] = tempos["mediana_ms"]
+    return medianas
+
+
+def comparar(base, novo, limite=1.2):
+    """Retorna [(tamanho, cenário, mediana base, mediana nova, razão, regrediu)]"""
+    medianas_base = _medianas(base)
+    medianas_novo = _medianas(novo)
+    linhas = []
+    for chave in sorted(medianas_base.keys() & medianas_novo.keys()):
+        antes, depois = medianas_base[chave], medianas_novo[chave]
+        razao = depois / antes if antes else float("inf")
+        regrediu = razao > limite and depois > MEDIANA_MINIMA_MS
+        linhas.append((*chave, antes, depois, razao, regrediu))
+    return linhas
+
+
+def main(argv=None):
+    """Ponto de entrada da linha de comando"""
+    parser = argparse.ArgumentParser(description="Compara dois resultados de benchmark")
+    parser.add_argument("base", help="JSON da execução de referência")
+    parser.add_argument("novo", help="JSON da execução a comparar")
+    parser.add_argument("--limite", type=float, default=1.2, help="razão a partir da qual conta como regressão")
+    args = parser.parse_args(argv)
+
+    with open(args.base, encoding="utf-8") as arquivo:
+        base = json.load(arquivo)
+    with open(args.novo, encoding="utf-8") as arquivo:
+        novo = json.load(arquivo)
+
+    print(f"{base.get('versao')} -> {novo.get('versao')}")
+    linhas = comparar(base, novo, args.limite)
+    for tamanho, cenario, antes, depois, razao, regrediu in linhas:
+        marca = "  <-- mais lento" if regrediu else ""
+        print(f"{tamanho:>8} {cenario:<45} {antes:10.3f} ms {depois:10.3f} ms {razao:6.2f}x{marca}")
+    return 1 if any(linha[-1] for linha in linhas) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+import datetime
+import random
+import unicodedata
+
+NOMES = [
+    "Ana", "Beatriz", "Bruno", "Camila", "Carlos", "Daniela", "Eduardo", "Fernanda", "Gabriel", "Helena",
+    "Igor", "Juliana", "Larissa", "Lucas", "Mariana", "Mateus", "Natália", "Otávio", "Paula", "Rafael",
+    "Renata", "Rodrigo", "Sabrina", "Thiago", "Vanessa", "Vinícius", "Yasmin", "João", "Letícia", "Pedro",
+]
+SOBRENOMES = [
+    "Almeida", "Araújo", "Barbosa", "Cardoso", "Carvalho", "Costa", "Dias", "Ferreira", "Gomes", "Lima",
+    "Martins", "Melo", "Oliveira", "Pereira", "Ribeiro", "Rocha", "Santos", "Silva", "Souza", "Teixeira",
+]
+INSTITUICOES = ["UFMS", "UEMS", "IFMS", "UCDB", "UFGD", "UNIDERP", "USP", "UNICAMP", "UFPR", "UFSC"]
+
+# Curso -> temas típicos dos trabalhos daquele curso
+TEMAS_POR_CURSO = {
+    "Ciência da Computação": ["aprendizado de máquina", "redes neurais", "computação em nuvem", "segurança da informação",
+                              "processamento de linguagem natural", "sistemas distribuídos", "visão computacional"],
+    "Sistemas de Informação": ["gestão de projetos ágeis", "sistemas ERP", "governança de TI", "experiência do usuário",
+                               "mineração de dados", "transformação digital", "aplicativos móveis"],
+    "Engenharia Civil": ["concreto de alto desempenho", "drenagem urbana", "estruturas metálicas", "pavimentação asfáltica",
+                         "reaproveitamento de resíduos da construção", "conforto térmico em edificações"],
+    "Engenharia Elétrica": ["geração fotovoltaica", "qualidade de energia", "redes inteligentes", "eficiência energética",
+                            "veículos elétricos", "proteção de sistemas elétricos"],
+    "Direito": ["proteção de dados pessoais", "direito do consumidor", "mediação de conflitos", "direito ambiental",
+                "reforma trabalhista", "execução penal"],
+    "Administração": ["empreendedorismo feminino", "gestão de pessoas", "cadeia de suprimentos", "marketing digital",
+                      "cooperativas agrícolas", "responsabilidade social empresarial"],
+    "Pedagogia": ["alfabetização", "educação inclusiva", "tecnologias na sala de aula", "educação do campo",
+                  "formação de professores", "ludicidade na educação infantil"],
+    "Enfermagem": ["atenção básica", "saúde da mulher", "cuidados paliativos", "segurança do paciente",
+                   "saúde mental", "vacinação infantil"],
+    "Agronomia": ["manejo integrado de pragas", "plantio direto", "irrigação de precisão", "fertilidade do solo",
+                  "integração lavoura-pecuária", "cultivo de soja"],
+    "Psicologia": ["ansiedade em universitários", "psicologia organizacional", "desenvolvimento infantil",
+                   "luto", "saúde mental no trabalho", "avaliação psicológica"],
+}
+CURSOS = list(TEMAS_POR_CURSO)
+
+INICIOS_TITULO = [
+    "Análise de", "Um estudo sobre", "Impactos de", "Desafios de", "Contribuições para", "Avaliação de",
+    "Proposta de modelo para", "Perspectivas sobre", "Estudo de caso sobre", "Aplicação de",
+]
+CONTEXTOS = [
+    "em Mato Grosso do Sul", "no ensino superior", "em pequenas empresas", "na rede pública",
+    "no contexto pós-pandemia", "em municípios do interior", "no Brasil", "em comunidades rurais",
+    "em Campo Grande", "na região Centro-Oeste",
+]
+FRASES_RESUMO = [
+    "Este trabalho investiga {tema} {contexto}.",
+    "O objetivo é compreender como {tema} influencia a realidade observada.",
+    "Foi realizada uma revisão bibliográfica seguida de pesquisa de campo.",
+    "A metodologia adotada combina abordagens qualitativas e quantitativas.",
+    "Os dados foram coletados por meio de questionários e entrevistas semiestruturadas.",
+    "Os resultados indicam avanços relevantes, mas também limitações importantes.",
+    "Conclui-se que {tema} demanda políticas e práticas mais consistentes.",
+    "Por fim, são apresentadas sugestões para trabalhos futuros.",
+    "A análise considerou o período entre {ano_inicio} e {ano}.",
+    "O estudo contou com a participação de {participantes} pessoas.",
+]
+
+
+def _sem_acentos(texto):
+    decomposto = unicodedata.normalize("NFKD", texto)
+    return "".join(c for c in decomposto if not unicodedata.combining(c)).lower()
+
+
+def gerar_usuarios(quantidade, semente=42):
+    """Gera `quantidade` contas sintéticas (dicionários no formato do cadastro)"""
+    aleatorio = random.Random(semente)
+    usuarios = []
+    for i in range(quantidade):
+        nome = aleatorio.choice(NOMES)
+        sobrenome = aleatorio.choice(SOBRENOMES)
+        login = f"{_sem_acentos(nome)}.{_sem_acentos(sobrenome)}{i}"
+        usuarios.append({
+            "usuario": login,
+            "nome_completo": f"{nome} {aleatorio.choice(SOBRENOMES)} {sobrenome}",
+            "email": f"{login}@exemplo.edu.br",
+            "instituicao": aleatorio.choice(INSTITUICOES),
+            "curso": aleatorio.choice(CURSOS),
+        })
+    return usuarios
+
+
+def gerar_tccs(quantidade, usuarios, semente=42):
+    """Gera `quantidade` TCCs sintéticos distribuídos entre os usuários informados"""
+    aleatorio = random.Random(semente)
+    for _ in range(quantidade):
+        curso = aleatorio.choice(CURSOS)
+        tema = aleatorio.choice(TEMAS_POR_CURSO[curso])
+        contexto = aleatorio.choice(CONTEXTOS)
+        # Anos recentes são mais comuns
+        ano = 2025 - min(int(aleatorio.expovariate(0.25)), 25)
+        dono = aleatorio.choice(usuarios)
+        frases = [FRASES_RESUMO[0]] + aleatorio.sample(FRASES_RESUMO[1:], 4)
+        resumo = " ".join(frases).format(
+            tema=tema, contexto=contexto, ano=ano, ano_inicio=ano - aleatorio.randint(2, 10),
+            participantes=aleatorio.randint(12, 400),
+        )
+        yield {
+            "titulo": f"{aleatorio.choice(INICIOS_TITULO)} {tema} {contexto}",
+            "autor": f"{aleatorio.choice(NOMES)} {aleatorio.choice(SOBRENOMES)}",
+            "curso": curso,
+            "ano": ano,
+            "orientador": f"Prof. Dr. {aleatorio.choice(NOMES)} {aleatorio.choice(SOBRENOMES)}",
+            "resumo": resumo,
+            "palavras_chave": ", ".join(aleatorio.sample(TEMAS_POR_CURSO[curso], 3)),
+            "instituicao": aleatorio.choice(INSTITUICOES),
+            "data_cadastro": datetime.datetime(
+                ano, aleatorio.randint(1, 12), aleatorio.randint(1, 28),
+                aleatorio.randint(0, 23), aleatorio.randint(0, 59), aleatorio.randint(0, 59),
+            ).isoformat(),
+            "usuario_cadastro": dono["nome_completo"],
+            "usuario_id": dono["usuario"],
+        }
+
+
+def popular(armazenamento, total_tccs, total_usuarios, senha, semente=42, tamanho_lote=1000):
+    """Cadastra usuários e TCCs sintéticos no armazenamento; retorna a lista de usuários"""
+    usuarios = gerar_usuarios(total_usuarios, semente)
+    for usuario in usuarios:
+        armazenamento.inserir_usuario(usuario, senha)
+    lote = []
+    for tcc in gerar_tccs(total_tccs, usuarios, semente):
+        lote.append(tcc)
+        if len(lote) >= tamanho_lote:
+            armazenamento.inserir_tccs(lote)
+            lote = []
+    if lote:
+        armazenamento.inserir_tccs(lote)
+    return usuarios
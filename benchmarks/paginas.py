@@ -0,0 +1,110 @@
+import os
+import subprocess
+import sys
+import time
+
+from benchmarks.cenarios import CONSULTAS_BUSCA, resumir
+from vitrine.armazenamento import DIRETORIO_RAIZ
+from vitrine.facetas import obter_indice_facetas
+
+ARQUIVO_APP = os.path.join(DIRETORIO_RAIZ, "streamlit_app.py")
+TEMPO_LIMITE_RENDER = 300
+
+
+# Roda num interpretador novo: importa o Streamlit e depois mede só a importação do app
+SCRIPT_IMPORTACAO = """
+import sys, time
+import streamlit
+inicio = time.perf_counter()
+import streamlit_app
+print(time.perf_counter() - inicio)
+"""
+
+
+def _app_novo():
+    # Importado aqui para que o resto do pacote funcione sem o Streamlit instalado
+    from streamlit.testing.v1 import AppTest
+
+    return AppTest.from_file(ARQUIVO_APP, default_timeout=TEMPO_LIMITE_RENDER)
+
+
+def _app_logado(registro_usuario, pagina):
+    app = _app_novo()
+    app.session_state["logged_in"] = True
+    app.session_state["usuario"] = registro_usuario["nome_completo"]
+    app.session_state["usuario_logado"] = registro_usuario
+    app.session_state["current_page"] = pagina
+    return app
+
+
+def _executar(acao):
+    inicio = time.perf_counter()
+    app = acao()
+    duracao = time.perf_counter() - inicio
+    if app.exception:
+        raise RuntimeError(f"Erro ao renderizar a página: {app.exception[0].value}")
+    return duracao
+
+
+def medir_partida(repeticoes=5):
+    """Mede a partida a frio: importação do app num processo novo e a primeira execução de cada sessão.
+
+    Deve rodar antes de qualquer outra medição que use as telas, para que
+    "primeira_sessao_fria" inclua a importação dos módulos no processo.
+    """
+    importacao = []
+    for _ in range(repeticoes):
+        saida = subprocess.run(
+            [sys.executable, "-c", SCRIPT_IMPORTACAO], cwd=DIRETORIO_RAIZ,
+            capture_output=True, text=True, check=True,
+        ).stdout
+        importacao.append(float(saida.split()[-1]))
+
+    # Visitante anônimo abrindo o app (cai na tela de login)
+    fria = [_executar(_app_novo().run)]
+    sessoes = [_executar(_app_novo().run) for _ in range(repeticoes)]
+    return {
+        "importacao_app": resumir(importacao),
+        "primeira_sessao_fria": resumir(fria),
+        "primeira_sessao": resumir(sessoes),
+    }
+
+
+def medir_paginas(armazenamento, usuario, repeticoes=5):
+    """Mede a renderização completa das páginas pelo AppTest (sem navegador).
+
+    Cada repetição abre uma sessão nova; "primeira_renderizacao" inclui a
+    montagem da sessão, as demais medem reruns dentro da mesma sessão.
+    """
+    registro = armazenamento.obter_usuario(usuario["usuario"])
+    contagem_cursos = obter_indice_facetas(armazenamento).contagens("curso")
+    curso = max(contagem_cursos, key=contagem_cursos.get)
+    tempos = {
+        "dashboard": [],
+        "lista_primeira_renderizacao": [],
+        "lista_rerun": [],
+        "lista_filtro_curso": [],
+        "lista_busca": [],
+        "lista_proxima_pagina": [],
+        "lista_modo_tabela": [],
+    }
+    for _ in range(repeticoes):
+        tempos["dashboard"].append(_executar(_app_logado(registro, "inicio").run))
+
+        app = _app_logado(registro, "exibirtccs")
+        tempos["lista_primeira_renderizacao"].append(_executar(app.run))
+        tempos["lista_rerun"].append(_executar(app.run))
+
+        tempos["lista_filtro_curso"].append(_executar(app.selectbox(key="filtro_curso").set_value(curso).run))
+        app.selectbox(key="filtro_curso").set_value("Todos").run()
+
+        busca = app.text_input[0].set_value(CONSULTAS_BUSCA["termo_comum"])
+        tempos["lista_busca"].append(_executar(busca.run))
+        app.text_input[0].set_value("").run()
+
+        proxima = [botao for botao in app.button if botao.label == "Próxima"]
+        if proxima:
+            tempos["lista_proxima_pagina"].append(_executar(proxima[0].click().run))
+
+        tempos["lista_modo_tabela"].append(_executar(app.radio(key="modo_exibicao").set_value("Tabela").run))
+    return {nome: resumir(valores) for nome, valores in tempos.items() if valores}
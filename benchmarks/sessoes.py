@@ -0,0 +1,285 @@
+"""Teste de carga: várias sessões simultâneas fazendo o caminho de um aluno.
+
+Uso:
+
+    python -m benchmarks.sessoes                                   # 1, 2, 4 e 8 clientes
+    python -m benchmarks.sessoes --tccs 10000 --clientes 1 4 16 --sessoes 5
+
+Cada cliente é um processo que abre `--sessoes` sessões pelo AppTest, uma
+depois da outra, e mantém todas abertas (como o servidor mantém as sessões
+de quem está com a página aberta). Cada sessão se cadastra, entra, envia um
+TCC e filtra, busca e pagina a lista. Todos os clientes usam o mesmo banco
+temporário e começam juntos, depois de aquecer (importar o app e montar os
+índices). O resultado traz, para cada quantidade de clientes, a vazão, os
+percentis do tempo de cada rerun e a memória residente que cada sessão
+aberta acrescenta ao processo.
+"""
+import argparse
+import datetime
+import gc
+import json
+import multiprocessing
+import os
+import queue
+import random
+import sys
+import tempfile
+import time
+
+from benchmarks.__main__ import SENHA_BENCHMARK, total_usuarios
+from benchmarks.cenarios import CONSULTAS_BUSCA, resumir
+from benchmarks.gerador import CURSOS, INSTITUICOES
+from vitrine.armazenamento import DIRETORIO_RAIZ
+
+CLIENTES_PADRAO = (1, 2, 4, 8)
+# Tempo máximo de espera por um cliente (aquecimento incluído) antes de desistir da medição
+TEMPO_LIMITE_CLIENTE = 1800
+
+
+def _percentil(ordenados, fracao):
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * fracao))] * 1000
+
+
+def resumir_latencias(tempos):
+    """Como `resumir`, com o p99 (percentis altos importam mais com muitas sessões)"""
+    return {**resumir(tempos), "p99_ms": _percentil(sorted(tempos), 0.99)}
+
+
+def memoria_residente():
+    """Memória residente do processo atual, em bytes"""
+    try:
+        with open("/proc/self/statm") as arquivo:
+            return int(arquivo.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Fora do Linux: o pico, que só cresce, mas serve de aproximação
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+
+def _botao(conteiner, rotulo):
+    return next(botao for botao in conteiner.button if botao.label == rotulo)
+
+
+def _campo(widgets, rotulo):
+    return next(widget for widget in widgets if widget.label == rotulo)
+
+
+def _etapa(latencias, nome, acao):
+    inicio = time.perf_counter()
+    app = acao()
+    latencias.append((nome, time.perf_counter() - inicio))
+    if app.exception:
+        raise RuntimeError(f"Erro na etapa {nome}: {app.exception[0].value}")
+    return app
+
+
+def _sugestao(latencias, app, chave, prefixo):
+    # Digita o prefixo no campo e clica na primeira sugestão (cada passo redesenha só o campo)
+    _etapa(latencias, "digitar_sugestao", app.text_input(key=chave).set_value(prefixo).run)
+    sugestoes = next(widget for widget in app.get("button_group") if widget.key == f"{chave}_sugestoes")
+    _etapa(latencias, "escolher_sugestao", sugestoes.set_value(sugestoes.options[0]).run)
+    return app.text_input(key=chave).value
+
+
+def simular_sessao(usuario, rng, latencias):
+    """Faz o caminho de um aluno numa sessão nova e retorna o AppTest (a sessão continua aberta).
+
+    Cadastro, login, envio de um TCC e lista: filtro por curso, busca,
+    limpar a busca e ir para a próxima página. Cada rerun entra em
+    `latencias` como (etapa, segundos).
+    """
+    from benchmarks.paginas import _app_novo
+
+    app = _etapa(latencias, "abrir", _app_novo().run)
+    _etapa(latencias, "ir_cadastro", _botao(app.sidebar, "Cadastrar-se").click().run)
+    # Curso, instituição e orientador sugerem os valores já usados: a sessão digita o começo e escolhe um
+    # (antes dos campos do formulário, que se perdem num rerun antes do envio)
+    _sugestao(latencias, app, "cadastro_instituicao", rng.choice(INSTITUICOES)[:2].lower())
+    campos = {
+        "Nome Completo *": f"Aluno {usuario}",
+        "E-mail *": f"{usuario}@exemplo.com",
+        "Nome de Usuário *": usuario,
+        "Senha *": SENHA_BENCHMARK,
+        "Confirmar Senha *": SENHA_BENCHMARK,
+    }
+    for rotulo, valor in campos.items():
+        _campo(app.text_input, rotulo).set_value(valor)
+    app.checkbox[0].check()
+    _etapa(latencias, "cadastro", _botao(app, "Criar Conta").click().run)
+    if not app.session_state["cadastro_realizado"]:
+        raise RuntimeError(f"Cadastro de {usuario} recusado: {[erro.value for erro in app.error]}")
+
+    _etapa(latencias, "ir_login", _botao(app, "Ir para Login").click().run)
+    _campo(app.text_input, "Usuário:").set_value(usuario)
+    _campo(app.text_input, "Senha:").set_value(SENHA_BENCHMARK)
+    _etapa(latencias, "login", _botao(app, "Entrar").click().run)
+    if not app.session_state["logged_in"]:
+        raise RuntimeError(f"Login de {usuario} recusado: {[erro.value for erro in app.error]}")
+
+    _etapa(latencias, "ir_enviar_tcc", _botao(app.sidebar, "Enviar TCC").click().run)
+    curso = _sugestao(latencias, app, "tcc_curso", rng.choice(CURSOS)[:3].lower())
+    _campo(app.text_input, "Título do TCC *").set_value(f"Estudo de carga {usuario}")
+    _campo(app.text_input, "Autor *").set_value(f"Aluno {usuario}")
+    _campo(app.text_area, "Resumo *").set_value("Trabalho enviado pelo teste de carga da vitrine.")
+    _campo(app.text_input, "Palavras-chave").set_value("carga, desempenho")
+    _etapa(latencias, "enviar_tcc", _botao(app, "Salvar TCC").click().run)
+    if not app.success:
+        raise RuntimeError(f"Envio do TCC de {usuario} recusado: {[erro.value for erro in app.error]}")
+
+    _etapa(latencias, "ir_lista", _botao(app.sidebar, "Listar TCCs").click().run)
+    _etapa(latencias, "filtrar_curso", app.selectbox(key="filtro_curso").set_value(curso).run)
+    termo = rng.choice(list(CONSULTAS_BUSCA.values()))
+    _etapa(latencias, "buscar", _campo(app.text_input, "Buscar:").set_value(termo).run)
+    _etapa(latencias, "limpar_busca", _campo(app.text_input, "Buscar:").set_value("").run)
+    proxima = [botao for botao in app.button if botao.label == "Próxima" and not botao.disabled]
+    if proxima:
+        _etapa(latencias, "proxima_pagina", proxima[0].click().run)
+    return app
+
+
+def _aquecer(usuario):
+    # Importa o Streamlit e o app e monta os índices do processo, que o servidor já teria prontos
+    from benchmarks.paginas import _app_logado, _app_novo
+    from vitrine.armazenamento import obter_armazenamento
+
+    _app_novo().run()
+    _app_logado(obter_armazenamento().obter_usuario(usuario), "exibirtccs").run()
+
+
+def _cliente(cliente, prefixo, sessoes, usuario_aquecimento, semente, barreira, fila):
+    """Processo de um cliente: aquece, espera os outros e roda as sessões, mandando o resultado pela fila"""
+    try:
+        _aquecer(usuario_aquecimento)
+        gc.collect()
+        memoria_inicial = memoria_residente()
+        barreira.wait(TEMPO_LIMITE_CLIENTE)
+
+        rng = random.Random(semente * 1000 + cliente)
+        latencias = []
+        abertas = []
+        inicio = time.time()
+        for numero in range(sessoes):
+            abertas.append(simular_sessao(f"{prefixo}c{cliente}s{numero}", rng, latencias))
+        fim = time.time()
+        gc.collect()
+        fila.put((cliente, {
+            "inicio": inicio,
+            "fim": fim,
+            "latencias": latencias,
+            "memoria_inicial": memoria_inicial,
+            "memoria_final": memoria_residente(),
+        }))
+    except BaseException as erro:
+        barreira.abort()
+        fila.put((cliente, {"erro": f"{type(erro).__name__}: {erro}"}))
+
+
+def medir_concorrencia(clientes, sessoes, usuario_aquecimento, semente, rodada=0):
+    """Roda `clientes` processos ao mesmo tempo, cada um com `sessoes` sessões, e resume as medidas.
+
+    `rodada` entra no nome das contas criadas, para que várias medições no
+    mesmo banco não tentem cadastrar o mesmo usuário.
+    """
+    contexto = multiprocessing.get_context("spawn")
+    barreira = contexto.Barrier(clientes)
+    fila = contexto.Queue()
+    prefixo = f"carga{rodada}_"
+    processos = [
+        contexto.Process(target=_cliente, args=(cliente, prefixo, sessoes, usuario_aquecimento, semente, barreira, fila))
+        for cliente in range(clientes)
+    ]
+    for processo in processos:
+        processo.start()
+    try:
+        resultados = [fila.get(timeout=TEMPO_LIMITE_CLIENTE)[1] for _ in processos]
+    except queue.Empty:
+        raise RuntimeError(f"Os clientes não terminaram em {TEMPO_LIMITE_CLIENTE} s") from None
+    finally:
+        for processo in processos:
+            processo.join(10)
+            if processo.is_alive():
+                processo.terminate()
+
+    erros = [resultado["erro"] for resultado in resultados if "erro" in resultado]
+    if erros:
+        raise RuntimeError(f"Falha em {len(erros)} cliente(s): {erros[0]}")
+
+    latencias = [segundos for resultado in resultados for _, segundos in resultado["latencias"]]
+    por_etapa = {}
+    for resultado in resultados:
+        for etapa, segundos in resultado["latencias"]:
+            por_etapa.setdefault(etapa, []).append(segundos)
+    duracao = max(resultado["fim"] for resultado in resultados) - min(resultado["inicio"] for resultado in resultados)
+    por_sessao = [(resultado["memoria_final"] - resultado["memoria_inicial"]) / sessoes for resultado in resultados]
+    return {
+        "clientes": clientes,
+        "sessoes": clientes * sessoes,
+        "reruns": len(latencias),
+        "duracao_s": duracao,
+        "reruns_por_s": len(latencias) / duracao,
+        "sessoes_por_min": clientes * sessoes * 60 / duracao,
+        "latencia": resumir_latencias(latencias),
+        "etapas": {etapa: resumir_latencias(tempos) for etapa, tempos in por_etapa.items()},
+        "memoria": {
+            "processo_aquecido_mib": sum(resultado["memoria_inicial"] for resultado in resultados)
+                                     / len(resultados) / 2 ** 20,
+            "por_sessao_kib": sum(por_sessao) / len(por_sessao) / 1024,
+            "total_mib": sum(resultado["memoria_final"] for resultado in resultados) / 2 ** 20,
+        },
+    }
+
+
+def main(argv=None):
+    """Ponto de entrada da linha de comando"""
+    parser = argparse.ArgumentParser(description="Mede a Vitrine Acadêmica com várias sessões simultâneas")
+    parser.add_argument("--tccs", type=int, default=1_000, help="tamanho do catálogo sintético")
+    parser.add_argument("--clientes", type=int, nargs="+", default=CLIENTES_PADRAO,
+                        help="quantidades de clientes simultâneos (um processo cada)")
+    parser.add_argument("--sessoes", type=int, default=3, help="sessões abertas por cliente")
+    parser.add_argument("--semente", type=int, default=42, help="semente do gerador sintético")
+    parser.add_argument("--saida", help="arquivo JSON de saída (padrão: benchmarks/resultados/sessoes-<data>.json)")
+    args = parser.parse_args(argv)
+
+    from benchmarks.gerador import popular
+    from vitrine.armazenamento import obter_armazenamento
+
+    relatorio = {
+        "data": datetime.datetime.now().isoformat(timespec="seconds"),
+        "tccs": args.tccs,
+        "sessoes_por_cliente": args.sessoes,
+        "processadores": os.cpu_count(),
+        "concorrencia": {},
+    }
+    with tempfile.TemporaryDirectory() as diretorio:
+        # Os clientes herdam a variável e abrem o mesmo banco
+        os.environ["VITRINE_DB"] = os.path.join(diretorio, "vitrine.db")
+        # Sem gerador do catálogo público: ele sobrescreveria a fotografia real e roubaria CPU das sessões
+        os.environ["VITRINE_CATALOGO_PUBLICO"] = "0"
+        armazenamento = obter_armazenamento()
+        print(f"Populando {args.tccs} TCCs...", file=sys.stderr)
+        usuarios = popular(armazenamento, args.tccs, total_usuarios(args.tccs), SENHA_BENCHMARK, args.semente)
+        armazenamento.fechar()
+
+        for rodada, clientes in enumerate(args.clientes):
+            print(f"Medindo {clientes} cliente(s) x {args.sessoes} sessão(ões)...", file=sys.stderr)
+            resultado = medir_concorrencia(clientes, args.sessoes, usuarios[0]["usuario"], args.semente, rodada)
+            relatorio["concorrencia"][str(clientes)] = resultado
+            latencia = resultado["latencia"]
+            print(f"  {resultado['reruns_por_s']:.1f} reruns/s, {resultado['sessoes_por_min']:.1f} sessões/min; "
+                  f"rerun p50 {latencia['mediana_ms']:.0f} ms, p95 {latencia['p95_ms']:.0f} ms, "
+                  f"p99 {latencia['p99_ms']:.0f} ms; {resultado['memoria']['por_sessao_kib']:.0f} KiB por sessão",
+                  file=sys.stderr)
+
+    saida = args.saida or os.path.join(
+        DIRETORIO_RAIZ, "benchmarks", "resultados",
+        "sessoes-" + datetime.datetime.now().strftime("%Y%m%d-%H%M%S") + ".json")
+    os.makedirs(os.path.dirname(os.path.abspath(saida)), exist_ok=True)
+    with open(saida, "w", encoding="utf-8") as arquivo:
+        json.dump(relatorio, arquivo, ensure_ascii=False, indent=2)
+    print(f"Resultados gravados em {saida}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1 +0,0 @@
-# Pasta pages - Contém as diferentes telas da aplicação Vitrine Acadêmica 
\ No newline at end of file
@@ -1,11 +1,5 @@
-import sys
-import os
-
-# Adicionar o diretório pages ao path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'pages'))
-
-# Importar e executar a função principal do login
-from login import main
+# Ponto de entrada: as telas ficam no pacote telas e são importadas sob demanda (ver telas/rotas.py)
+from telas.login import main
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -0,0 +1 @@
+# Pacote telas - Contém as diferentes telas da aplicação Vitrine Acadêmica
@@ -0,0 +1,44 @@
+import streamlit as st
+
+from vitrine.armazenamento import obter_armazenamento
+
+# De quantos em quantos segundos as páginas abertas conferem se o catálogo mudou
+INTERVALO_ATUALIZACAO = 10
+
+
+def versao_catalogo():
+    """Versão atual do catálogo, já com as escritas feitas por outros processos"""
+    armazenamento = obter_armazenamento()
+    armazenamento.sincronizar()
+    return armazenamento.versao
+
+
+def marcar_exibida(regiao, versao):
+    """Guarda a versão do catálogo que a região (chave de um fragmento) está mostrando"""
+    st.session_state[f"versao_{regiao}"] = versao
+
+
+def catalogo_mudou(regiao, versao):
+    """Indica se o catálogo mudou desde que a região foi desenhada"""
+    exibida = st.session_state.get(f"versao_{regiao}")
+    return exibida is not None and exibida != versao
+
+
+def _redesenhar(regioes):
+    st.rerun(list(regioes))
+
+
+def mostrar_aviso_novidades(regiao, versao, mensagem, origem):
+    """Se o catálogo mudou, mostra um botão que redesenha só a região e o fragmento `origem` (o do aviso).
+
+    A região é redesenhada a pedido, não sozinha: o Streamlit não deixa um
+    fragmento disparar outro, e assim a lista não muda debaixo de quem está lendo.
+    """
+    if not catalogo_mudou(regiao, versao):
+        return
+    col1, col2 = st.columns([4, 1])
+    with col1:
+        st.info(mensagem)
+    with col2:
+        st.button("Atualizar", key=f"atualizar_{regiao}", on_click=_redesenhar, args=((regiao, origem),),
+                  use_container_width=True)
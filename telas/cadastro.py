@@ -1,6 +1,11 @@
 import streamlit as st
-import datetime
 
+from telas.sugestoes import campo_com_sugestoes, canonizar
+from vitrine import perfil
+from vitrine.armazenamento import obter_armazenamento
+from vitrine.datas import agora_iso
+
+@perfil.cronometrado("pagina.cadastro")
 def show_cadastro():
     """Exibe a página de cadastro de usuário"""
     st.title("Cadastro de Usuário")
@@ -13,7 +18,7 @@ def show_cadastro():
         st.balloons()
         
         # Informações do cadastro
-        ultimo_usuario = st.session_state.usuarios[-1] if st.session_state.usuarios else {}
+        ultimo_usuario = st.session_state.get("ultimo_cadastro") or {}
         st.info(f"""
         **Parabéns!** Sua conta foi criada com sucesso.
         
@@ -39,6 +44,14 @@ def show_cadastro():
                 st.session_state.cadastro_realizado = False
                 st.rerun()
     else:
+        # Fora do formulário: as sugestões precisam redesenhar o campo enquanto o usuário digita
+        col1, col2 = st.columns(2)
+        with col1:
+            campo_com_sugestoes("Instituição *", "instituicao", key="cadastro_instituicao",
+                                placeholder="Nome da sua instituição")
+        with col2:
+            campo_com_sugestoes("Curso", "curso", key="cadastro_curso", placeholder="Seu curso (opcional)")
+        
         # Formulário de cadastro
         with st.form("cadastro_form", clear_on_submit=True):
             col1, col2 = st.columns(2)
@@ -46,11 +59,9 @@ def show_cadastro():
             with col1:
                 nome_completo = st.text_input("Nome Completo *", placeholder="Digite seu nome completo")
                 email = st.text_input("E-mail *", placeholder="exemplo@email.com")
-                usuario = st.text_input("Nome de Usuário *", placeholder="Digite um nome de usuário")
                 
             with col2:
-                instituicao = st.text_input("Instituição *", placeholder="Nome da sua instituição")
-                curso = st.text_input("Curso", placeholder="Seu curso (opcional)")
+                usuario = st.text_input("Nome de Usuário *", placeholder="Digite um nome de usuário")
             
             col3, col4 = st.columns(2)
             with col3:
@@ -65,6 +76,11 @@ def show_cadastro():
             submitted = st.form_submit_button("Criar Conta", type="primary", use_container_width=True)
             
             if submitted:
+                usuario = usuario.strip()
+                email = email.strip()
+                instituicao = canonizar("instituicao", st.session_state.cadastro_instituicao)
+                curso = canonizar("curso", st.session_state.cadastro_curso)
+                
                 # Validação
                 erros = []
                 
@@ -84,14 +100,11 @@ def show_cadastro():
                     erros.append("Digite um e-mail válido")
                 
                 # Verificar se usuário já existe
-                if "usuarios" in st.session_state:
-                    for user in st.session_state.usuarios:
-                        if user.get("usuario") == usuario:
-                            erros.append("Nome de usuário já existe! Escolha outro.")
-                            break
-                        if user.get("email") == email:
-                            erros.append("E-mail já cadastrado! Use outro e-mail.")
-                            break
+                armazenamento = obter_armazenamento()
+                if usuario and armazenamento.obter_usuario(usuario) is not None:
+                    erros.append("Nome de usuário já existe! Escolha outro.")
+                if email and armazenamento.email_cadastrado(email):
+                    erros.append("E-mail já cadastrado! Use outro e-mail.")
                 
                 if erros:
                     for erro in erros:
@@ -102,20 +115,19 @@ def show_cadastro():
                         "nome_completo": nome_completo,
                         "email": email,
                         "usuario": usuario,
-                        "senha": senha,
                         "instituicao": instituicao,
                         "curso": curso,
-                        "data_cadastro": datetime.datetime.now().strftime("%d/%m/%Y %H:%M")
+                        "data_cadastro": agora_iso()
                     }
                     
-                    # Salvar no session_state
-                    if "usuarios" not in st.session_state:
-                        st.session_state.usuarios = []
-                    st.session_state.usuarios.append(novo_usuario)
-                    
-                    # Marcar que o cadastro foi realizado
-                    st.session_state.cadastro_realizado = True
-                    st.rerun()
+                    # Salvar no banco (a senha é gravada apenas como hash)
+                    if armazenamento.inserir_usuario(novo_usuario, senha):
+                        # Marcar que o cadastro foi realizado
+                        st.session_state.ultimo_cadastro = novo_usuario
+                        st.session_state.cadastro_realizado = True
+                        st.rerun()
+                    else:
+                        st.error("Nome de usuário ou e-mail já cadastrado! Tente novamente.")
         
         # Link para login
         st.markdown("---")
@@ -0,0 +1,61 @@
+import streamlit as st
+
+from vitrine import perfil
+from vitrine.armazenamento import obter_armazenamento
+from vitrine.consultas import obter_cache_consultas
+
+def mostrar_painel_desempenho(execucao_anterior):
+    """Exibe o painel de desempenho (somente administradores)"""
+    with st.expander("Painel de desempenho (admin)"):
+        coletando = st.toggle("Coletar tempos", value=perfil.ativo(), key="perfil_coletar",
+                              help="Vale para todas as sessões deste processo")
+        if coletando != perfil.ativo():
+            perfil.definir_ativo(coletando)
+            st.rerun()
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("Perfilar próxima execução (cProfile)", key="perfil_proximo", use_container_width=True):
+                st.session_state.perfilar_proximo_rerun = True
+                st.rerun()
+        with col2:
+            if st.button("Limpar medições", key="perfil_limpar", use_container_width=True):
+                perfil.limpar()
+                st.rerun()
+        
+        cache = obter_cache_consultas(obter_armazenamento()).estatisticas()
+        consultas = cache["acertos"] + cache["faltas"]
+        taxa = f" ({cache['acertos'] / consultas:.0%} de acerto)" if consultas else ""
+        st.caption(f"Cache de consultas: {cache['acertos']} acertos, {cache['faltas']} faltas{taxa}, "
+                   f"{cache['remendos']} remendadas · {cache['itens']}/{cache['capacidade']} itens")
+        
+        # Medições acumuladas de todas as sessões (janela das últimas execuções de cada trecho)
+        estatisticas = perfil.estatisticas()
+        if estatisticas:
+            st.markdown("**Trechos (p50/p95 das medições recentes):**")
+            st.dataframe(estatisticas, hide_index=True)
+        elif not perfil.ativo():
+            st.caption("A coleta está desligada.")
+        
+        if not execucao_anterior:
+            return
+        
+        # Trechos da execução anterior desta sessão (a atual ainda está em andamento)
+        if execucao_anterior["trechos"]:
+            st.markdown("**Execução anterior:**")
+            st.dataframe(
+                [{"trecho": "· " * t["profundidade"] + t["nome"],
+                  "início (ms)": round(t["inicio_ms"], 2),
+                  "duração (ms)": round(t["duracao_ms"], 2)}
+                 for t in sorted(execucao_anterior["trechos"], key=lambda t: t["inicio_ms"])],
+                hide_index=True
+            )
+            st.download_button("Baixar trechos (JSON Lines)", perfil.trechos_jsonl(execucao_anterior["trechos"]),
+                               file_name="trechos.jsonl", mime="application/x-ndjson", key="perfil_baixar_trechos")
+        
+        if execucao_anterior["perfil"]:
+            st.markdown("**cProfile da execução anterior:**")
+            st.code(execucao_anterior["perfil_texto"], language=None)
+            st.download_button("Baixar perfil (.prof)", execucao_anterior["perfil"],
+                               file_name="execucao.prof", mime="application/octet-stream",
+                               key="perfil_baixar_prof")
@@ -0,0 +1,123 @@
+import streamlit as st
+import datetime
+
+from telas.sugestoes import campo_com_sugestoes, canonizar
+from vitrine import perfil
+from vitrine.armazenamento import obter_armazenamento
+from vitrine.arquivos import TAMANHO_MAXIMO_PDF_MB, armazenar_pdf, validar_pdf
+from vitrine.datas import agora_iso
+from vitrine.processamento import obter_processador
+from vitrine.validacao import ANO_MINIMO, ano_maximo, validar_tcc
+
+# Chaves dos campos com sugestões (curso, orientador, instituição), lidos no envio do formulário
+CHAVES_SUGESTOES = ("tcc_curso", "tcc_orientador", "tcc_instituicao")
+
+@perfil.cronometrado("pagina.enviartcc")
+def show_enviar_tcc():
+    """Exibe a página de cadastro de TCCs"""
+    st.title("Cadastrar Novo TCC")
+    
+    # Verifica se está logado
+    if not st.session_state.get("logged_in", False):
+        st.warning("Você precisa fazer login para acessar esta página.")
+        return
+    
+    st.markdown("### Preencha as informações do seu TCC:")
+    
+    # Depois de um cadastro a página é redesenhada (para limpar os campos com sugestões) e mostra o resultado
+    avisos = st.session_state.pop("avisos_envio_tcc", None)
+    if avisos is not None:
+        for chave in CHAVES_SUGESTOES:
+            st.session_state[chave] = ""
+    
+    # Fora do formulário: as sugestões precisam redesenhar o campo enquanto o usuário digita
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        campo_com_sugestoes("Curso *", "curso", key="tcc_curso", placeholder="Nome do curso")
+    with col2:
+        campo_com_sugestoes("Orientador", "orientador", key="tcc_orientador", placeholder="Nome do orientador (opcional)")
+    with col3:
+        campo_com_sugestoes("Instituição", "instituicao", key="tcc_instituicao", placeholder="Nome da instituição")
+    
+    with st.form("form_tcc", clear_on_submit=True):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            titulo = st.text_input("Título do TCC *", placeholder="Digite o título do trabalho")
+            autor = st.text_input("Autor *", placeholder="Nome do autor")
+            
+        with col2:
+            ano = st.number_input("Ano *", 
+                                min_value=ANO_MINIMO, 
+                                max_value=ano_maximo(), 
+                                value=datetime.datetime.now().year)
+        
+        resumo = st.text_area("Resumo *", 
+                            height=150, 
+                            placeholder="Escreva um resumo do seu trabalho...")
+        
+        # Campos adicionais
+        palavras_chave = st.text_input("Palavras-chave", 
+                                     placeholder="Separadas por vírgula")
+        
+        # O servidor do Streamlit recusa arquivos acima do limite antes de chegarem aqui
+        pdf = st.file_uploader(f"PDF do trabalho (opcional, até {TAMANHO_MAXIMO_PDF_MB} MB)",
+                               type=["pdf"], max_upload_size=TAMANHO_MAXIMO_PDF_MB)
+        
+        st.markdown("---")
+        submitted = st.form_submit_button("Salvar TCC", type="primary", use_container_width=True)
+        
+        if submitted:
+            # Variantes de um valor já usado ("eng. civil") viram a grafia mais comum ("Engenharia Civil")
+            digitados = curso, orientador, instituicao = tuple(st.session_state[chave] for chave in CHAVES_SUGESTOES)
+            curso = canonizar("curso", curso)
+            orientador = canonizar("orientador", orientador)
+            instituicao = canonizar("instituicao", instituicao)
+            # Validação (as mesmas regras da importação em lote)
+            erros = validar_tcc({"titulo": titulo, "autor": autor, "curso": curso, "resumo": resumo, "ano": ano})
+            if pdf is not None:
+                erros += validar_pdf(pdf)
+            if erros:
+                for erro in erros:
+                    st.error(erro)
+            else:
+                # O PDF é copiado do upload para o disco em pedaços e guardado pelo hash do conteúdo
+                pdf_hash = armazenar_pdf(pdf) if pdf is not None else None
+                new_tcc = {
+                    "id": generate_id(),
+                    "titulo": titulo,
+                    "autor": autor,
+                    "curso": curso,
+                    "ano": ano,
+                    "orientador": orientador,
+                    "resumo": resumo,
+                    "palavras_chave": palavras_chave,
+                    "instituicao": instituicao,
+                    "data_cadastro": agora_iso(),
+                    "usuario_cadastro": st.session_state.get("usuario", "Desconhecido"),
+                    "usuario_id": st.session_state.get("usuario_logado", {}).get("usuario", "Desconhecido"),
+                    "pdf_hash": pdf_hash
+                }
+                obter_armazenamento().inserir_tcc(new_tcc)
+                if pdf_hash:
+                    # Texto, páginas e miniatura são extraídos em segundo plano
+                    obter_processador(obter_armazenamento()).acordar()
+                grafias = [(digitado.strip(), nome) for digitado, nome in zip(digitados, (curso, orientador, instituicao))
+                           if " ".join(digitado.split()) != nome]
+                st.session_state.avisos_envio_tcc = {"pdf": bool(pdf_hash), "grafias": grafias}
+                st.rerun()
+    
+    if avisos is not None:
+        if avisos["pdf"]:
+            st.info("O PDF está sendo processado; a miniatura e o texto para a busca aparecem em instantes.")
+        st.success("TCC cadastrado com sucesso!")
+        for digitado, nome in avisos["grafias"]:
+            st.caption(f"\"{digitado}\" foi gravado como \"{nome}\", a grafia já usada em outros TCCs.")
+        st.balloons()
+
+def generate_id():
+    """Gera um ID único para o TCC (nunca reaproveita IDs de TCCs excluídos)"""
+    return obter_armazenamento().ids_tcc.proximo()
+
+if __name__ == "__main__":
+    show_enviar_tcc() 
\ No newline at end of file
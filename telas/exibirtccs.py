@@ -0,0 +1,537 @@
+import streamlit as st
+import datetime
+import html
+import math
+
+from telas.atualizacao import (INTERVALO_ATUALIZACAO, catalogo_mudou, marcar_exibida, mostrar_aviso_novidades,
+                               versao_catalogo)
+from telas.sugestoes import campo_com_sugestoes, canonizar
+from vitrine import perfil
+from vitrine.armazenamento import obter_armazenamento
+from vitrine.arquivos import nome_download, url_miniatura, url_pdf
+from vitrine.consultas import filtrar_ids
+from vitrine.datas import formatar_data
+from vitrine.facetas import obter_indice_facetas
+from vitrine.registros import obter_catalogo
+from vitrine.tags import obter_indice_tags
+from vitrine.vocabulario import CAMPOS_VOCABULARIO
+
+TAMANHOS_PAGINA = [10, 20, 50, 100]
+MODOS_EXIBICAO = ["Cartões", "Tabela"]
+# Opções de ordenação: critério de vitrine.ordenacao e se é decrescente (None = ordem padrão)
+ORDENACOES = {
+    "Padrão (relevância na busca)": None,
+    "Mais recentes": ("cadastro", True),
+    "Mais antigos": ("cadastro", False),
+    "Título (A–Z)": ("titulo", False),
+    "Título (Z–A)": ("titulo", True),
+    "Autor (A–Z)": ("autor", False),
+    "Ano (mais novo)": ("ano", True),
+    "Ano (mais antigo)": ("ano", False),
+}
+COLUNAS_TABELA = ["id", "titulo", "autor", "curso", "ano", "orientador", "instituicao"]
+QUANTIDADE_RELACIONADOS = 5
+# Chave do fragmento da lista (também usada para guardar a versão do catálogo que ele mostra)
+REGIAO_LISTA = "lista_tccs"
+# Campos do formulário de edição e os que não podem ficar vazios
+CAMPOS_EDICAO = ("titulo", "autor", "curso", "ano", "orientador", "resumo", "palavras_chave", "instituicao")
+CAMPOS_OBRIGATORIOS_EDICAO = ("titulo", "autor", "curso", "resumo")
+MENSAGEM_CONFLITO = ("Este TCC foi alterado ou excluído por outra pessoa enquanto você o via. "
+                     "O cartão foi recarregado; confira os dados e tente de novo.")
+
+@perfil.cronometrado("pagina.exibirtccs")
+def show_exibir_tccs():
+    """Exibe a página de listagem e gerenciamento de TCCs"""
+    st.title("Lista de TCCs Cadastrados")
+    
+    # Verifica se está logado
+    if not st.session_state.get("logged_in", False):
+        st.warning("Você precisa fazer login para acessar esta página.")
+        return
+    
+    # Inicialização do estado da sessão
+    if "edicoes" not in st.session_state:
+        st.session_state.edicoes = {}      # tcc_id -> versão que estava na tela quando a edição começou
+    if "pagina_tccs" not in st.session_state:
+        st.session_state.pagina_tccs = 1
+    if "tamanho_pagina" not in st.session_state:
+        st.session_state.tamanho_pagina = TAMANHOS_PAGINA[1]
+    if "modo_exibicao" not in st.session_state:
+        st.session_state.modo_exibicao = MODOS_EXIBICAO[0]
+    
+    armazenamento = obter_armazenamento()
+    facetas = obter_indice_facetas(armazenamento)
+    usuario_id = st.session_state.get("usuario_logado", {}).get("usuario", "")
+    # Versão do catálogo com que a página é desenhada; o fragmento das estatísticas a confere periodicamente
+    marcar_exibida(REGIAO_LISTA, versao_catalogo())
+    with perfil.trecho("lista.estatisticas"):
+        estatisticas = facetas.estatisticas(usuario_id)
+    
+    # Estatísticas
+    mostrar_estatisticas(usuario_id, lista_vazia=not estatisticas["total"])
+    if estatisticas["total"]:
+        mostrar_nuvem_tags(obter_indice_tags(armazenamento))
+        st.markdown("---")
+    
+    # Filtros
+    if estatisticas["total"]:
+        st.markdown("### Filtros:")
+        col1, col2, col3, col4 = st.columns(4)
+        
+        # Contagens de cada opção vêm do índice de facetas
+        contagem_propriedade = {
+            "Todos os TCCs": estatisticas["total"],
+            "Apenas meus TCCs": estatisticas["meus_tccs"],
+            "TCCs de outros": estatisticas["total"] - estatisticas["meus_tccs"],
+        }
+        contagem_cursos = facetas.contagens("curso")
+        contagem_anos = facetas.contagens("ano")
+        
+        with col1:
+            filtro_propriedade = st.selectbox(
+                "Filtrar por proprietário:",
+                ["Todos os TCCs", "Apenas meus TCCs", "TCCs de outros"],
+                key="filtro_propriedade",
+                format_func=lambda opcao: f"{opcao} ({contagem_propriedade[opcao]})"
+            )
+        
+        with col2:
+            filtro_curso = st.selectbox(
+                "Filtrar por curso:",
+                ["Todos"] + sorted(contagem_cursos),
+                key="filtro_curso",
+                format_func=lambda curso: curso if curso == "Todos" else f"{curso} ({contagem_cursos.get(curso, 0)})"
+            )
+        
+        with col3:
+            anos_disponiveis = sorted(contagem_anos, reverse=True)
+            filtro_ano = st.selectbox(
+                "Filtrar por ano:",
+                ["Todos"] + anos_disponiveis,
+                key="filtro_ano",
+                format_func=lambda ano: ano if ano == "Todos" else f"{ano} ({contagem_anos.get(ano, 0)})"
+            )
+        
+        with col4:
+            busca_texto = st.text_input("Buscar:", placeholder="Título, resumo, autor, orientador...")
+        
+        # Opções das tags pela chave normalizada, das mais usadas para as menos usadas
+        indice_tags = obter_indice_tags(armazenamento)
+        contagem_tags = indice_tags.contagens()
+        filtro_tags = st.multiselect(
+            "Filtrar por palavras-chave (todas as escolhidas):",
+            sorted(contagem_tags, key=lambda chave: (-contagem_tags[chave], chave)),
+            key="filtro_tags",
+            format_func=lambda chave: f"{indice_tags.nome(chave)} ({contagem_tags.get(chave, 0)})",
+            placeholder="Escolha uma ou mais palavras-chave"
+        )
+        
+        col1, col2, col3 = st.columns([1, 1, 2])
+        with col1:
+            ordenacao = st.selectbox("Ordenar por:", list(ORDENACOES), key="ordenacao_tccs")
+        with col2:
+            st.selectbox("Itens por página:", TAMANHOS_PAGINA, key="tamanho_pagina")
+        with col3:
+            st.radio("Modo de exibição:", MODOS_EXIBICAO, key="modo_exibicao", horizontal=True)
+        
+        st.markdown("---")
+    
+    # Lista de TCCs
+    if not estatisticas["total"]:
+        st.info("Nenhum TCC cadastrado ainda.")
+        if st.button("Cadastrar primeiro TCC"):
+            st.session_state.current_page = "enviartcc"
+            st.rerun()
+    else:
+        mostrar_lista(usuario_id, (filtro_propriedade, filtro_curso, filtro_ano, busca_texto, tuple(filtro_tags),
+                                   ordenacao))
+
+@st.fragment(run_every=INTERVALO_ATUALIZACAO, key="estatisticas_tccs")
+@perfil.cronometrado("lista.vigia")
+def mostrar_estatisticas(usuario_id, lista_vazia):
+    """Exibe os números do catálogo e confere, a cada INTERVALO_ATUALIZACAO, se ele mudou.
+    
+    Cada rodada custa uma consulta ao registro de alterações e redesenha só
+    as métricas; a lista é redesenhada quando o usuário pede (ver
+    telas/atualizacao.py).
+    """
+    versao = versao_catalogo()
+    if lista_vazia:
+        # A página foi desenhada sem lista: quando chegar o primeiro TCC ela é redesenhada inteira (uma vez)
+        if catalogo_mudou(REGIAO_LISTA, versao):
+            st.rerun()
+        return
+    
+    estatisticas = obter_indice_facetas(obter_armazenamento()).estatisticas(usuario_id)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total de TCCs", estatisticas["total"])
+    with col2:
+        st.metric("Ano mais recente", estatisticas["ano_mais_recente"] or "N/A")
+    with col3:
+        st.metric("Cursos únicos", estatisticas["cursos_unicos"])
+    mostrar_aviso_novidades(REGIAO_LISTA, versao, "Há TCCs novos ou alterados desde que a lista foi carregada.",
+                            origem="estatisticas_tccs")
+
+@st.fragment(key=REGIAO_LISTA)
+def mostrar_lista(usuario_id, filtros):
+    """Exibe a página atual da lista filtrada.
+    
+    É um fragmento: a paginação e o aviso de novidades redesenham só a
+    lista, e cada cartão é um fragmento dentro dela (ver mostrar_cartao).
+    """
+    armazenamento = obter_armazenamento()
+    marcar_exibida(REGIAO_LISTA, versao_catalogo())
+    filtro_propriedade, filtro_curso, filtro_ano, busca_texto, filtro_tags, ordenacao = filtros
+    
+    # Mesmo pipeline de filtros usado pela exportação (facetas + busca textual + ordenação);
+    # reruns com os mesmos filtros e sem alterações nos dados saem do cache de consultas
+    ordenar_por, decrescente = ORDENACOES[ordenacao] or (None, False)
+    with perfil.trecho("lista.filtros"):
+        ids_filtrados = filtrar_ids(
+            armazenamento,
+            usuario_id=usuario_id if filtro_propriedade == "Apenas meus TCCs" else None,
+            excluir_usuario_id=usuario_id if filtro_propriedade == "TCCs de outros" else None,
+            curso=filtro_curso if filtro_curso != "Todos" else None,
+            ano=filtro_ano if filtro_ano != "Todos" else None,
+            busca=busca_texto,
+            tags=filtro_tags,
+            ordenar_por=ordenar_por,
+            decrescente=decrescente
+        )
+    
+    # Voltar para a primeira página sempre que os filtros mudarem
+    chave_filtros = filtros + (st.session_state.tamanho_pagina,)
+    if st.session_state.get("filtros_tccs") != chave_filtros:
+        st.session_state.filtros_tccs = chave_filtros
+        st.session_state.pagina_tccs = 1
+    
+    # Paginação: a página é uma janela sobre os IDs filtrados, sem copiar registros
+    total = len(ids_filtrados)
+    tamanho = st.session_state.tamanho_pagina
+    total_paginas = max(1, math.ceil(total / tamanho))
+    st.session_state.pagina_tccs = min(max(1, st.session_state.pagina_tccs), total_paginas)
+    inicio = (st.session_state.pagina_tccs - 1) * tamanho
+    tccs_pagina = obter_catalogo(armazenamento).visao(ids_filtrados)[inicio:inicio + tamanho]
+    
+    st.markdown(f"### Exibindo {total} TCC(s):")
+    if tccs_pagina:
+        st.caption(f"Mostrando {inicio + 1}–{inicio + len(tccs_pagina)} de {total} "
+                   f"(página {st.session_state.pagina_tccs} de {total_paginas})")
+        mostrar_exportacao(armazenamento, ids_filtrados, filtros)
+    
+    if st.session_state.modo_exibicao == "Tabela":
+        with perfil.trecho("lista.tabela"):
+            mostrar_tabela_tccs(tccs_pagina)
+        mostrar_paginacao(total_paginas)
+        return
+    
+    # Mostrar TCCs da página atual (o resumo só é lido do banco para os cartões visíveis)
+    with perfil.trecho("lista.cartoes"):
+        resumos = armazenamento.obter_resumos(tccs_pagina.ids())
+        estados_pdf = armazenamento.estados_pdf(registro.id for registro in tccs_pagina if registro.pdf_hash)
+        for registro in tccs_pagina:
+            mostrar_cartao(registro.como_dict(resumo=resumos.get(registro.id, ""),
+                                              estado_pdf=estados_pdf.get(registro.id)), usuario_id)
+    
+    mostrar_paginacao(total_paginas)
+
+@st.fragment
+def mostrar_cartao(tcc, usuario_id):
+    """Exibe um TCC da lista, em visualização ou edição.
+    
+    É um fragmento: Editar, Excluir, Salvar e Cancelar redesenham só este
+    cartão. Numa dessas reexecuções o TCC recebido é o da última vez que a
+    lista foi desenhada, então ele é relido do catálogo se mudou.
+    """
+    tcc_id = tcc["id"]
+    tcc = recarregar_tcc(tcc)
+    aviso = st.session_state.pop(f"aviso_tcc_{tcc_id}", None)
+    if aviso:
+        tipo, mensagem = aviso
+        if tipo == "sucesso":
+            st.success(mensagem)
+        else:
+            st.error(mensagem)
+    if tcc is None:
+        if not aviso:
+            st.caption("Este TCC foi excluído.")
+        return
+    
+    with st.container():
+        if tcc_id in st.session_state.edicoes:
+            # Verificar se o usuário pode editar este TCC
+            if tcc.get('usuario_id') == usuario_id:
+                # Modo edição
+                mostrar_edicao_tcc(tcc)
+            else:
+                st.error("Você só pode editar seus próprios TCCs!")
+                del st.session_state.edicoes[tcc_id]
+                mostrar_tcc(tcc)
+        else:
+            # Modo visualização
+            mostrar_tcc(tcc)
+
+def recarregar_tcc(tcc):
+    """Retorna o TCC como está agora no catálogo (o próprio `tcc` se não mudou, None se foi excluído)"""
+    armazenamento = obter_armazenamento()
+    registro = obter_catalogo(armazenamento).obter(tcc["id"])
+    if registro is None:
+        return None
+    if registro.versao == tcc["versao"]:
+        return tcc
+    resumo = armazenamento.obter_resumos([registro.id]).get(registro.id, "")
+    estado_pdf = armazenamento.estados_pdf([registro.id]).get(registro.id) if registro.pdf_hash else None
+    return registro.como_dict(resumo=resumo, estado_pdf=estado_pdf)
+
+def gravar_pelo_cartao(tcc_id, escrita, mensagem_sucesso):
+    """Executa a escrita de um cartão e guarda o resultado para o cartão exibir.
+    
+    Se a lista estava em dia antes, continua marcada como em dia: a
+    alteração aparece no próprio cartão e não precisa do aviso de novidades.
+    """
+    em_dia = not catalogo_mudou(REGIAO_LISTA, versao_catalogo())
+    gravado = escrita()
+    if gravado and em_dia:
+        marcar_exibida(REGIAO_LISTA, obter_armazenamento().versao)
+    st.session_state[f"aviso_tcc_{tcc_id}"] = ("sucesso", mensagem_sucesso) if gravado else ("erro", MENSAGEM_CONFLITO)
+    return gravado
+
+def mostrar_nuvem_tags(indice_tags):
+    """Exibe as palavras-chave mais usadas, com o tamanho da fonte proporcional ao uso"""
+    nuvem = indice_tags.nuvem()
+    if not nuvem:
+        return
+    
+    with st.expander("Nuvem de palavras-chave"):
+        palavras = [
+            f"<span title='{quantidade} TCC(s)' style='font-size: {0.8 + 1.2 * peso:.2f}em; "
+            f"margin-right: 0.6em'>{html.escape(nome)}</span>"
+            for _, nome, quantidade, peso in nuvem
+        ]
+        st.markdown(f"<div style='line-height: 2'>{' '.join(palavras)}</div>", unsafe_allow_html=True)
+        st.caption("Use o filtro de palavras-chave abaixo para ver os TCCs de cada uma.")
+
+def mostrar_paginacao(total_paginas):
+    """Exibe os botões de navegação entre as páginas da lista"""
+    if total_paginas <= 1:
+        return
+    
+    # Os botões mudam a página num callback: o clique já redesenha o fragmento da lista com ela
+    pagina = st.session_state.pagina_tccs
+    col1, col2, col3, col4, col5 = st.columns([1, 1, 2, 1, 1])
+    with col1:
+        st.button("Primeira", key="pag_primeira", disabled=pagina == 1, use_container_width=True,
+                  on_click=ir_para_pagina, args=(1,))
+    with col2:
+        st.button("Anterior", key="pag_anterior", disabled=pagina == 1, use_container_width=True,
+                  on_click=ir_para_pagina, args=(pagina - 1,))
+    with col3:
+        st.markdown(f"<div style='text-align: center'>Página <b>{pagina}</b> de <b>{total_paginas}</b></div>",
+                    unsafe_allow_html=True)
+    with col4:
+        st.button("Próxima", key="pag_proxima", disabled=pagina == total_paginas, use_container_width=True,
+                  on_click=ir_para_pagina, args=(pagina + 1,))
+    with col5:
+        st.button("Última", key="pag_ultima", disabled=pagina == total_paginas, use_container_width=True,
+                  on_click=ir_para_pagina, args=(total_paginas,))
+
+def ir_para_pagina(pagina):
+    """Muda a página atual da lista"""
+    st.session_state.pagina_tccs = pagina
+
+def mostrar_exportacao(armazenamento, ids_filtrados, chave_filtros):
+    """Exibe a opção de baixar o resultado filtrado em CSV, JSONL ou Parquet"""
+    # Importado aqui: só quem chega a ver a lista precisa da exportação
+    from vitrine.exportacao import FORMATOS_EXPORTACAO, URL_EXPORTACOES, exportar_para_arquivo
+    
+    with st.expander("Exportar resultado"):
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            formato = st.radio("Formato:", list(FORMATOS_EXPORTACAO), key="formato_exportacao", horizontal=True)
+        with col2:
+            gerar = st.button("Gerar arquivo", key="gerar_exportacao", use_container_width=True)
+        
+        # O arquivo é gravado em disco aos pedaços e baixado por link, sem passar pela memória da sessão
+        chave = (chave_filtros, formato)
+        if gerar:
+            with st.spinner(f"Exportando {len(ids_filtrados)} TCC(s)..."):
+                nome = exportar_para_arquivo(armazenamento, ids_filtrados, FORMATOS_EXPORTACAO[formato])
+            st.session_state.exportacao_tccs = (chave, nome)
+        
+        exportacao = st.session_state.get("exportacao_tccs")
+        if exportacao and exportacao[0] == chave:
+            extensao = FORMATOS_EXPORTACAO[formato]
+            st.markdown(f'<a href="{URL_EXPORTACOES}/{exportacao[1]}" download="tccs.{extensao}">'
+                        f'Baixar tccs.{extensao}</a>', unsafe_allow_html=True)
+            st.caption("O link vale por uma hora.")
+
+def mostrar_tabela_tccs(tccs):
+    """Exibe os TCCs da página em uma tabela compacta (somente leitura)"""
+    st.dataframe(
+        [{coluna: tcc.get(coluna) for coluna in COLUNAS_TABELA} for tcc in tccs],
+        hide_index=True
+    )
+    st.caption("Use o modo Cartões para ver o resumo completo ou editar seus TCCs.")
+
+def mostrar_tcc(tcc):
+    """Exibe um TCC em modo de visualização"""
+    # Verificar se é TCC do usuário logado
+    usuario_id = st.session_state.get("usuario_logado", {}).get("usuario", "")
+    eh_meu_tcc = tcc.get('usuario_id') == usuario_id
+    
+    # Usar identificação diferente para TCCs do usuário logado
+    if eh_meu_tcc:
+        titulo_expandir = f"{tcc['titulo']} - {tcc['autor']} ({tcc['ano']}) - SEU TCC"
+    else:
+        titulo_expandir = f"{tcc['titulo']} - {tcc['autor']} ({tcc['ano']})"
+    
+    with st.expander(titulo_expandir, expanded=False):
+        if eh_meu_tcc:
+            st.info("Este é um TCC cadastrado por você.")
+        
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            st.write(f"**Curso:** {tcc['curso']}")
+            if tcc.get("orientador"):
+                st.write(f"**Orientador:** {tcc['orientador']}")
+            if tcc.get("instituicao"):
+                st.write(f"**Instituição:** {tcc['instituicao']}")
+            if tcc.get("palavras_chave"):
+                st.write(f"**Palavras-chave:** {tcc['palavras_chave']}")
+            st.write(f"**Cadastrado em:** {formatar_data(tcc['data_cadastro'])}")
+            if tcc.get("usuario_cadastro"):
+                st.write(f"**Cadastrado por:** {tcc['usuario_cadastro']}")
+        
+        st.markdown("**Resumo:**")
+        st.write(tcc['resumo'])
+        
+        if tcc.get("pdf_hash"):
+            mostrar_pdf(tcc)
+        
+        # Calculados só a pedido: o interruptor redesenha apenas este cartão
+        if st.toggle("Ver trabalhos relacionados", key=f"relacionados_{tcc['id']}"):
+            with perfil.trecho("lista.relacionados"):
+                mostrar_relacionados(tcc)
+        
+        # Botões de ação - só mostrar editar/excluir para o próprio usuário
+        if eh_meu_tcc:
+            col1, col2, col3 = st.columns([1, 1, 3])
+            # Os callbacks recebem a versão que estava na tela quando o usuário clicou
+            with col1:
+                st.button("Editar", key=f"edit_btn_{tcc['id']}",
+                          on_click=iniciar_edicao, args=(tcc["id"], tcc["versao"]))
+            with col2:
+                st.button("Excluir", key=f"del_btn_{tcc['id']}",
+                          on_click=excluir_tcc, args=(tcc["id"], tcc["versao"]))
+        else:
+            st.caption("Você só pode editar/excluir seus próprios TCCs.")
+
+def mostrar_relacionados(tcc):
+    """Lista os TCCs mais parecidos com este pelo título, palavras-chave e resumo"""
+    # Importado aqui: o índice de similares traz o numpy, e só quem liga "Ver trabalhos relacionados" precisa dele
+    from vitrine.similares import obter_indice_similares
+    
+    armazenamento = obter_armazenamento()
+    relacionados = obter_indice_similares(armazenamento).relacionados(tcc["id"], QUANTIDADE_RELACIONADOS)
+    if not relacionados:
+        st.caption("Nenhum trabalho parecido encontrado.")
+        return
+    
+    catalogo = obter_catalogo(armazenamento)
+    linhas = []
+    for tcc_id, similaridade in relacionados:
+        outro = catalogo.obter(tcc_id)
+        if outro is not None:
+            linhas.append(f"- {outro['titulo']} - {outro['autor']} ({outro['ano']}) · {similaridade:.0%}")
+    if linhas:
+        st.markdown("**Trabalhos relacionados:**")
+        st.markdown("\n".join(linhas))
+
+def iniciar_edicao(tcc_id, versao):
+    """Abre o TCC para edição, guardando a versão que o usuário está editando"""
+    st.session_state.edicoes[tcc_id] = versao
+
+def excluir_tcc(tcc_id, versao):
+    """Exclui o TCC se ele ainda estiver na versão exibida"""
+    gravar_pelo_cartao(tcc_id, lambda: obter_armazenamento().excluir_tcc(tcc_id, versao=versao), "TCC excluído!")
+
+def mostrar_pdf(tcc):
+    """Exibe a miniatura, o estado do processamento e o link para baixar o PDF do TCC"""
+    col1, col2 = st.columns([1, 5])
+    with col1:
+        if tcc.get("pdf_paginas") is not None:
+            st.markdown(f'<img src="{url_miniatura(tcc["pdf_hash"])}" width="120" '
+                        f'alt="Primeira página do PDF">', unsafe_allow_html=True)
+    with col2:
+        # Link direto para o arquivo servido pelo Streamlit (o PDF não passa pela sessão)
+        st.markdown(f'<a href="{url_pdf(tcc["pdf_hash"])}" download="{nome_download(tcc["titulo"])}">'
+                    f'Baixar PDF do trabalho</a>', unsafe_allow_html=True)
+        estado = tcc.get("estado_pdf")
+        if tcc.get("pdf_paginas") is not None:
+            st.badge(f"{tcc['pdf_paginas']} página(s)", color="green")
+        elif estado == "falhou":
+            st.badge("Não foi possível processar o PDF", color="red")
+        elif estado in ("pendente", "executando"):
+            st.badge("Processando PDF...", color="orange")
+
+def mostrar_edicao_tcc(tcc):
+    """Exibe um TCC em modo de edição"""
+    tcc_id = tcc["id"]
+    st.subheader("Editando TCC")
+    if tcc["versao"] != st.session_state.edicoes[tcc_id]:
+        st.warning("Outra pessoa alterou este TCC depois que você começou a editar. "
+                   "Cancele e abra a edição de novo para não sobrescrever as mudanças dela.")
+    
+    # Os campos têm chave para os callbacks de Salvar lerem os valores; os com sugestões ficam
+    # fora do formulário, que não deixa redesenhar nada enquanto o usuário digita
+    chave = lambda campo: f"edit_{tcc_id}_{campo}"
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        campo_com_sugestoes("Curso", "curso", valor=tcc["curso"], key=chave("curso"))
+    with col2:
+        campo_com_sugestoes("Orientador", "orientador", valor=tcc.get("orientador") or "", key=chave("orientador"))
+    with col3:
+        campo_com_sugestoes("Instituição", "instituicao", valor=tcc.get("instituicao") or "", key=chave("instituicao"))
+    
+    with st.form(f"edit_{tcc_id}"):
+        col1, col2 = st.columns(2)
+        with col1:
+            st.text_input("Título", value=tcc["titulo"], key=chave("titulo"))
+            st.text_input("Autor", value=tcc["autor"], key=chave("autor"))
+        with col2:
+            st.number_input("Ano", 
+                            min_value=2000, 
+                            max_value=datetime.datetime.now().year + 1, 
+                            value=tcc["ano"],
+                            key=chave("ano"))
+            st.text_input("Palavras-chave", value=tcc.get("palavras_chave", ""), key=chave("palavras_chave"))
+        
+        st.text_area("Resumo", value=tcc["resumo"], height=100, key=chave("resumo"))
+        
+        # Os botões agem em callbacks: o envio do formulário já redesenha só este cartão
+        col1, col2 = st.columns(2)
+        with col1:
+            st.form_submit_button("Salvar", type="primary", on_click=salvar_edicao, args=(tcc_id,))
+        with col2:
+            st.form_submit_button("Cancelar", on_click=cancelar_edicao, args=(tcc_id,))
+
+def salvar_edicao(tcc_id):
+    """Grava a edição do TCC, só se ninguém o alterou desde que a edição começou"""
+    campos = {campo: st.session_state[f"edit_{tcc_id}_{campo}"] for campo in CAMPOS_EDICAO}
+    for campo in CAMPOS_VOCABULARIO:
+        campos[campo] = canonizar(campo, campos[campo])
+    if not all(campos[campo] for campo in CAMPOS_OBRIGATORIOS_EDICAO):
+        st.session_state[f"aviso_tcc_{tcc_id}"] = ("erro", "Preencha todos os campos obrigatórios")
+        return
+    versao = st.session_state.edicoes.pop(tcc_id)
+    gravar_pelo_cartao(tcc_id, lambda: obter_armazenamento().atualizar_tcc(tcc_id, campos, versao=versao),
+                       "TCC atualizado!")
+
+def cancelar_edicao(tcc_id):
+    """Fecha a edição do TCC sem gravar"""
+    st.session_state.edicoes.pop(tcc_id, None)
+
+if __name__ == "__main__":
+    show_exibir_tccs() 
\ No newline at end of file
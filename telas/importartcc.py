@@ -0,0 +1,77 @@
+import streamlit as st
+
+from vitrine import perfil
+from vitrine.armazenamento import obter_armazenamento
+from vitrine.importacao import (
+    CAMPOS_IMPORTACAO,
+    abrir_texto,
+    formato_do_arquivo,
+    importar_tccs,
+    ler_registros,
+)
+
+@perfil.cronometrado("pagina.importartcc")
+def show_importar_tcc():
+    """Exibe a página de importação de TCCs em lote"""
+    st.title("Importar TCCs em Lote")
+    
+    # Verifica se está logado
+    if not st.session_state.get("logged_in", False):
+        st.warning("Você precisa fazer login para acessar esta página.")
+        return
+    
+    st.markdown("### Envie um arquivo CSV ou JSONL com os TCCs:")
+    st.caption(
+        "Colunas aceitas: " + ", ".join(CAMPOS_IMPORTACAO) + ". "
+        "Título, autor, curso, ano e resumo são obrigatórios, como no cadastro individual."
+    )
+    
+    arquivo = st.file_uploader("Arquivo", type=["csv", "jsonl", "ndjson"])
+    if arquivo is None:
+        return
+    
+    if st.button("Importar", type="primary", use_container_width=True):
+        usuario_logado = st.session_state.get("usuario_logado", {})
+        barra = st.progress(0.0, text="Importando...")
+        
+        def mostrar_progresso(resultado):
+            # Progresso medido pelos bytes já lidos do arquivo
+            fracao = min(arquivo.tell() / arquivo.size, 1.0) if arquivo.size else 1.0
+            barra.progress(fracao, text=f"{resultado['importados']} TCC(s) importados...")
+        
+        arquivo.seek(0)
+        texto = abrir_texto(arquivo)
+        resultado = importar_tccs(
+            obter_armazenamento(),
+            ler_registros(texto, formato_do_arquivo(arquivo.name)),
+            usuario_id=usuario_logado.get("usuario", "Desconhecido"),
+            usuario_cadastro=st.session_state.get("usuario", "Desconhecido"),
+            ao_progresso=mostrar_progresso
+        )
+        barra.progress(1.0, text="Importação concluída")
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Importados", resultado["importados"])
+        with col2:
+            st.metric("Com erro", resultado["com_erro"])
+        with col3:
+            taxa = resultado["linhas"] / resultado["segundos"] if resultado["segundos"] else 0
+            st.metric("Registros por segundo", f"{taxa:,.0f}")
+        
+        if resultado["importados"]:
+            st.success(f"{resultado['importados']} TCC(s) importados com sucesso!")
+        if texto.linhas_convertidas:
+            st.warning(f"{texto.linhas_convertidas} linha(s) do arquivo não estavam em UTF-8 e foram lidas como "
+                       "Windows-1252 (Latin-1). Confira acentos nos TCCs importados.")
+        if resultado["erros"]:
+            st.error("Alguns registros não foram importados:")
+            st.dataframe(
+                [{"Registro": numero, "Erros": "; ".join(erros)} for numero, erros in resultado["erros"]],
+                hide_index=True
+            )
+            if resultado["com_erro"] > len(resultado["erros"]):
+                st.caption(f"Mostrando os primeiros {len(resultado['erros'])} de {resultado['com_erro']} erros.")
+
+if __name__ == "__main__":
+    show_importar_tcc()
@@ -0,0 +1,358 @@
+import streamlit as st
+
+from telas.atualizacao import (INTERVALO_ATUALIZACAO, catalogo_mudou, marcar_exibida, mostrar_aviso_novidades,
+                               versao_catalogo)
+from telas.rotas import obter_rota
+from vitrine import perfil
+from vitrine.armazenamento import obter_armazenamento
+from vitrine.usuarios import eh_admin
+
+# Chave do fragmento dos gráficos do dashboard (também usada para guardar a versão do catálogo que ele mostra)
+REGIAO_GRAFICOS = "graficos_dashboard"
+
+def inicializar_sessao():
+    """Configura a página e inicializa o estado da sessão (roda a cada execução do script)"""
+    # Configuração da página
+    st.set_page_config(
+        page_title="Vitrine Acadêmica de TCCs", 
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    
+    # Inicialização do estado da sessão
+    if "logged_in" not in st.session_state:
+        st.session_state.logged_in = False
+    if "usuario" not in st.session_state:
+        st.session_state.usuario = None
+    if "usuario_logado" not in st.session_state:
+        st.session_state.usuario_logado = None
+    if "current_page" not in st.session_state:
+        # Se não há usuários cadastrados, direcionar para cadastro
+        if not obter_armazenamento().contar_usuarios():
+            st.session_state.current_page = "cadastro"
+        else:
+            st.session_state.current_page = "login"
+    
+    # Importados aqui, como as páginas (ver telas.rotas): o módulo é carregado em toda execução
+    from vitrine.processamento import obter_processador
+    from vitrine.publico import obter_gerador_catalogo
+    
+    # Fila de PDFs: a thread de fundo é criada uma vez por processo e retoma o que ficou pendente
+    obter_processador(obter_armazenamento())
+    # Catálogo público em HTML estático, regenerado em segundo plano depois das escritas (só o banco
+    # padrão publica, a não ser que VITRINE_CATALOGO_PUBLICO diga outra pasta; ver vitrine.publico)
+    obter_gerador_catalogo(obter_armazenamento())
+
+@perfil.cronometrado("barra_lateral")
+def show_sidebar():
+    """Exibe a barra lateral com navegação"""
+    from vitrine.publico import URL_CATALOGO_PUBLICO, catalogo_publicado
+    
+    with st.sidebar:
+        st.title("Vitrine Acadêmica")
+        st.markdown("---")
+        
+        if not st.session_state.logged_in:
+            # Menu para usuários não logados
+            st.markdown("### Acesso")
+            
+            if st.button("Login", use_container_width=True):
+                st.session_state.current_page = "login"
+                st.rerun()
+            
+            if st.button("Cadastrar-se", use_container_width=True):
+                st.session_state.current_page = "cadastro"
+                st.rerun()
+
+            if catalogo_publicado():
+                st.markdown("---")
+                st.link_button("Ver catálogo público", URL_CATALOGO_PUBLICO, use_container_width=True)
+                
+        else:
+            # Menu para usuários logados
+            st.success(f"Olá, {st.session_state.usuario}!")
+            st.markdown("---")
+            
+            st.markdown("### Navegação")
+            
+            if st.button("Enviar TCC", use_container_width=True):
+                st.session_state.current_page = "enviartcc"
+                st.rerun()
+            
+            if st.button("Listar TCCs", use_container_width=True):
+                st.session_state.current_page = "exibirtccs"
+                st.rerun()
+            
+            if st.button("Importar TCCs", use_container_width=True):
+                st.session_state.current_page = "importartcc"
+                st.rerun()
+            
+            st.markdown("---")
+            st.markdown("### Conta")
+            
+            if st.button("Logout", use_container_width=True):
+                st.session_state.logged_in = False
+                st.session_state.usuario = None
+                st.session_state.usuario_logado = None
+                st.session_state.current_page = "login"
+                st.success("Logout realizado com sucesso!")
+                st.rerun()
+        
+        # Informações do sistema
+        st.markdown("---")
+        st.markdown("### Sobre")
+        st.info("""
+        **Vitrine Acadêmica de TCCs**
+        
+        Sistema para cadastro e exibição de Trabalhos de Conclusão de Curso.
+        
+        Desenvolvido com Streamlit
+        """)
+
+@perfil.cronometrado("roteador")
+def show_main_content():
+    """Exibe o conteúdo principal baseado na página atual"""
+    
+    # Roteamento de páginas (ver telas/rotas.py); páginas desconhecidas caem no dashboard
+    mostrar_pagina, exige_login = obter_rota(st.session_state.current_page)
+    if exige_login and not st.session_state.logged_in:
+        st.warning("Você precisa fazer login para acessar esta página.")
+        st.session_state.current_page = "login"
+        st.rerun()
+    
+    mostrar_pagina()
+
+@perfil.cronometrado("pagina.dashboard")
+def show_dashboard():
+    """Exibe o dashboard principal"""
+    st.title("Bem-vindo à Vitrine Acadêmica de TCCs")
+    
+    if not st.session_state.logged_in:
+        st.markdown("""
+        ### O que é a Vitrine Acadêmica?
+        
+        A **Vitrine Acadêmica de TCCs** é uma plataforma dedicada ao cadastro, organização e exibição de Trabalhos de Conclusão de Curso (TCCs).
+        
+        ### Funcionalidades:
+        
+        - **Cadastro de TCCs**: Registre seus trabalhos acadêmicos com todas as informações relevantes
+        - **Listagem Organizada**: Visualize todos os TCCs cadastrados de forma organizada
+        - **Busca e Filtros**: Encontre trabalhos por curso, ano, palavras-chave
+        - **Edição**: Atualize informações dos seus TCCs quando necessário
+        - **Gestão de Usuários**: Sistema de login e cadastro de usuários
+        
+        ### Como começar:
+        
+        1. **Faça seu cadastro** ou **entre com sua conta**
+        2. **Cadastre seus TCCs** com todas as informações
+        3. **Explore** os trabalhos de outros usuários
+        4. **Gerencie** seus trabalhos acadêmicos
+        
+        ---
+        **Use o menu lateral para navegar pelo sistema!**
+        """)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("Fazer Login", type="primary", use_container_width=True):
+                st.session_state.current_page = "login"
+                st.rerun()
+        
+        with col2:
+            if st.button("Criar Conta", use_container_width=True):
+                st.session_state.current_page = "cadastro"
+                st.rerun()
+    
+    else:
+        # Dashboard para usuários logados
+        st.markdown(f"### Bem-vindo(a), {st.session_state.usuario}!")
+        
+        # Estatísticas (lidas da tabela de agregados, mantida pelo banco a cada escrita)
+        from vitrine.analises import obter_painel
+        usuario_id = st.session_state.get("usuario_logado", {}).get("usuario", "")
+        # Versão do catálogo com que o painel é desenhado; o fragmento das métricas a confere periodicamente
+        marcar_exibida(REGIAO_GRAFICOS, versao_catalogo())
+        with perfil.trecho("dashboard.estatisticas"):
+            painel = obter_painel(obter_armazenamento(), usuario_id)
+        mostrar_metricas(usuario_id, sem_graficos=not painel["total"])
+        if painel["total"]:
+            mostrar_graficos(usuario_id)
+        
+        st.markdown("### Ações Rápidas")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("Cadastrar Novo TCC", type="primary", use_container_width=True):
+                st.session_state.current_page = "enviartcc"
+                st.rerun()
+        
+        with col2:
+            if st.button("Ver Todos os TCCs", use_container_width=True):
+                st.session_state.current_page = "exibirtccs"
+                st.rerun()
+
+@st.fragment(run_every=INTERVALO_ATUALIZACAO, key="metricas_dashboard")
+@perfil.cronometrado("dashboard.vigia")
+def mostrar_metricas(usuario_id, sem_graficos):
+    """Exibe os números do painel e confere, a cada INTERVALO_ATUALIZACAO, se o catálogo mudou.
+    
+    Cada rodada custa uma consulta ao registro de alterações e redesenha só
+    as métricas (o painel sai do cache de consultas enquanto nada muda).
+    """
+    versao = versao_catalogo()
+    if sem_graficos:
+        # O painel foi desenhado vazio: quando chegar o primeiro TCC ele é redesenhado inteiro (uma vez)
+        if catalogo_mudou(REGIAO_GRAFICOS, versao):
+            st.rerun()
+        return
+    
+    from vitrine.analises import obter_painel
+    
+    painel = obter_painel(obter_armazenamento(), usuario_id)
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Total de TCCs", painel["total"])
+    
+    with col2:
+        # Contar TCCs do usuário logado usando o ID do usuário
+        st.metric("Meus TCCs", painel["meus_tccs"])
+    
+    with col3:
+        st.metric("Cursos", painel["cursos_unicos"])
+    
+    with col4:
+        st.metric("Instituições", painel["instituicoes_unicas"])
+    
+    mostrar_aviso_novidades(REGIAO_GRAFICOS, versao, "Há TCCs novos ou alterados desde que os gráficos foram gerados.",
+                            origem="metricas_dashboard")
+
+@st.fragment(key=REGIAO_GRAFICOS)
+@perfil.cronometrado("dashboard.graficos")
+def mostrar_graficos(usuario_id):
+    """Exibe os TCCs por ano (no total e por curso) e os cursos, instituições e orientadores com mais TCCs"""
+    from vitrine.analises import obter_painel
+    
+    marcar_exibida(REGIAO_GRAFICOS, versao_catalogo())
+    painel = obter_painel(obter_armazenamento(), usuario_id)
+    st.markdown("### TCCs por ano")
+    tab_total, tab_curso = st.tabs(["Total", "Por curso"])
+    with tab_total:
+        st.bar_chart([{"Ano": str(ano), "TCCs": quantidade} for ano, quantidade in painel["por_ano"]],
+                     x="Ano", y="TCCs")
+    with tab_curso:
+        st.bar_chart([{"Ano": str(ano), "Curso": curso, "TCCs": quantidade}
+                      for ano, curso, quantidade in painel["por_ano_curso"]],
+                     x="Ano", y="TCCs", color="Curso")
+    
+    st.markdown("### Quem mais publica")
+    for aba, (chave, rotulo) in zip(
+        st.tabs(["Cursos", "Instituições", "Orientadores"]),
+        (("cursos", "Curso"), ("instituicoes", "Instituição"), ("orientadores", "Orientador")),
+    ):
+        with aba:
+            if painel[chave]:
+                st.bar_chart([{rotulo: valor, "TCCs": quantidade} for valor, quantidade in painel[chave]],
+                             x=rotulo, y="TCCs", horizontal=True, sort="-TCCs")
+            else:
+                st.caption("Nenhum dado informado ainda.")
+
+@perfil.cronometrado("pagina.login")
+def show_login():
+    """Exibe a página de login"""
+    st.title("Login - Vitrine Acadêmica")
+    
+    # Verifica se já está logado
+    if st.session_state.get("logged_in", False):
+        st.success(f"Bem-vinda, {st.session_state.get('usuario', 'Usuário')}!")
+        
+        col1, col2 = st.columns([1, 4])
+        with col1:
+            if st.button("Logout"):
+                st.session_state.logged_in = False
+                st.session_state.usuario = None
+                st.rerun()
+        return True
+    
+    # Formulário de login
+    st.markdown("### Entre com suas credenciais:")
+    
+    with st.form("login_form"):
+        col1, col2 = st.columns([2, 3])
+        
+        with col1:
+            usuario = st.text_input("Usuário:", placeholder="Digite seu usuário")
+            senha = st.text_input("Senha:", type="password", placeholder="Digite sua senha")
+            
+            submitted = st.form_submit_button("Entrar", type="primary", use_container_width=True)
+        
+        with col2:
+            # Verificar se existem usuários cadastrados
+            total_usuarios = obter_armazenamento().contar_usuarios()
+            if total_usuarios:
+                st.info(f"""
+                **Usuários cadastrados:** {total_usuarios}
+                
+                Use o nome de usuário e senha que você cadastrou no sistema.
+                """)
+            else:
+                st.warning("""
+                **Nenhum usuário cadastrado ainda.**
+                
+                Faça seu cadastro primeiro para poder fazer login.
+                """)
+                
+                if st.button("Ir para Cadastro", key="btn_cadastro_from_login"):
+                    st.session_state.current_page = "cadastro"
+                    st.rerun()
+    
+    if submitted:
+        # Validação baseada em usuários cadastrados
+        if not usuario or not senha:
+            st.error("Preencha todos os campos!")
+            return False
+        
+        # Verificar se existem usuários cadastrados
+        if not total_usuarios:
+            st.error("Nenhum usuário cadastrado no sistema!")
+            st.info("Cadastre-se primeiro antes de fazer login.")
+            return False
+        
+        # Buscar usuário nos cadastrados
+        usuario_encontrado = obter_armazenamento().autenticar(usuario, senha)
+        
+        if usuario_encontrado:
+            st.session_state.logged_in = True
+            st.session_state.usuario = usuario_encontrado.get("nome_completo", usuario)
+            st.session_state.usuario_logado = usuario_encontrado
+            st.success(f"Login realizado com sucesso! Bem-vindo(a), {usuario_encontrado.get('nome_completo', usuario)}!")
+            st.rerun()
+        else:
+            st.error("Usuário ou senha incorretos!")
+            st.warning("Verifique suas credenciais e tente novamente.")
+    
+    return False
+
+def main():
+    """Função principal da aplicação"""
+    inicializar_sessao()
+    
+    # O painel mostra a execução anterior: a atual só termina depois dele
+    execucao_anterior = st.session_state.get("ultima_execucao")
+    with perfil.execucao(perfilar=st.session_state.pop("perfilar_proximo_rerun", False)) as execucao:
+        st.session_state.ultima_execucao = execucao
+        
+        # Mostrar barra lateral
+        show_sidebar()
+        
+        # Mostrar conteúdo principal
+        show_main_content()
+        
+        # Painel de desempenho para administradores
+        usuario_logado = st.session_state.get("usuario_logado") or {}
+        if eh_admin(usuario_logado.get("usuario")):
+            from telas.desempenho import mostrar_painel_desempenho
+            mostrar_painel_desempenho(execucao_anterior)
+
+if __name__ == "__main__":
+    main() 
\ No newline at end of file
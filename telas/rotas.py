@@ -0,0 +1,23 @@
+import importlib
+
+# Página -> (módulo, função, exige login). O módulo de cada tela só é importado na primeira visita
+ROTAS = {
+    "login": ("telas.login", "show_login", False),
+    "cadastro": ("telas.cadastro", "show_cadastro", False),
+    "enviartcc": ("telas.enviartcc", "show_enviar_tcc", True),
+    "exibirtccs": ("telas.exibirtccs", "show_exibir_tccs", True),
+    "importartcc": ("telas.importartcc", "show_importar_tcc", True),
+}
+# Páginas sem rota própria caem no dashboard
+ROTA_PADRAO = ("telas.login", "show_dashboard", False)
+
+_funcoes = {}              # (módulo, função) -> função já importada
+
+
+def obter_rota(pagina):
+    """Retorna (função que desenha a página, exige login), importando o módulo na primeira vez"""
+    modulo, nome, exige_login = ROTAS.get(pagina, ROTA_PADRAO)
+    funcao = _funcoes.get((modulo, nome))
+    if funcao is None:
+        funcao = _funcoes[(modulo, nome)] = getattr(importlib.import_module(modulo), nome)
+    return funcao, exige_login
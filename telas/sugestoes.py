@@ -0,0 +1,46 @@
+import streamlit as st
+
+from vitrine.armazenamento import obter_armazenamento
+from vitrine.vocabulario import obter_indice_vocabulario
+
+
+def campo_com_sugestoes(rotulo, campo, valor="", key=None, placeholder=None):
+    """Campo de texto livre que sugere os valores já usados em `campo` ("curso", "instituicao" ou "orientador").
+
+    O texto digitado vai para o índice de vocabulário no servidor, que
+    devolve os nomes canônicos em que alguma palavra começa por ele (sem
+    diferença de acentos e maiúsculas, com abreviações expandidas), os
+    mais usados primeiro; clicar numa sugestão a copia para o campo. Aceita
+    valores novos. Como precisa redesenhar enquanto o usuário digita, não
+    pode ficar dentro de um st.form: quem envia o formulário lê o valor em
+    st.session_state[key]. Retorna o texto atual ("" se vazio).
+    """
+    if key not in st.session_state:
+        st.session_state[key] = valor
+    _mostrar_campo(rotulo, campo, key, placeholder)
+    return st.session_state[key]
+
+
+@st.fragment
+def _mostrar_campo(rotulo, campo, key, placeholder):
+    # Fragmento: digitar e escolher sugestões redesenha só este campo
+    texto = st.text_input(rotulo, key=key, placeholder=placeholder,
+                          help="Tecle Enter para ver os valores já usados que começam assim")
+    if not texto.strip():
+        return
+    sugestoes = obter_indice_vocabulario(obter_armazenamento()).sugerir(campo, texto)
+    if sugestoes and sugestoes != [" ".join(texto.split())]:
+        st.pills(f"Sugestões para {rotulo}", sugestoes, key=f"{key}_sugestoes", label_visibility="collapsed",
+                 on_change=_escolher_sugestao, args=(key,))
+
+
+def _escolher_sugestao(key):
+    escolhida = st.session_state[f"{key}_sugestoes"]
+    if escolhida:
+        st.session_state[key] = escolhida
+    st.session_state[f"{key}_sugestoes"] = None
+
+
+def canonizar(campo, valor):
+    """Nome canônico do valor digitado (ex.: "eng. civil" -> "Engenharia Civil", se essa grafia já existe)"""
+    return obter_indice_vocabulario(obter_armazenamento()).canonico(campo, valor)
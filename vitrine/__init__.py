@@ -0,0 +1 @@
+# Pacote vitrine - Camada de dados e serviços compartilhados pelas telas da Vitrine Acadêmica
@@ -0,0 +1,49 @@
+from vitrine.consultas import obter_cache_consultas
+
+# Quantos valores aparecem nos gráficos de cada dimensão; no gráfico por ano, os demais cursos viram "Outros"
+LIMITE_PAINEL = 10
+ROTULO_OUTROS = "Outros"
+
+
+def _montar_painel(armazenamento, limite):
+    total_por_ano = [(ano, quantidade) for _, ano, quantidade in armazenamento.agregados_por_ano()]
+    cursos = [(valor, quantidade) for valor, quantidade in armazenamento.agregados("curso") if valor]
+    instituicoes = [(valor, quantidade) for valor, quantidade in armazenamento.agregados("instituicao") if valor]
+    orientadores = [(valor, quantidade)
+                    for valor, quantidade in armazenamento.agregados("orientador", limite + 1) if valor][:limite]
+
+    # Por ano e curso, juntando os cursos fora dos mais frequentes
+    principais = {curso for curso, _ in cursos[:limite]}
+    por_ano_curso = {}
+    for curso, ano, quantidade in armazenamento.agregados_por_ano("curso"):
+        rotulo = curso if curso in principais else ROTULO_OUTROS
+        por_ano_curso[(ano, rotulo)] = por_ano_curso.get((ano, rotulo), 0) + quantidade
+
+    return {
+        "total": sum(quantidade for _, quantidade in total_por_ano),
+        "ano_mais_recente": total_por_ano[-1][0] if total_por_ano else None,
+        "cursos_unicos": len(cursos),
+        "instituicoes_unicas": len(instituicoes),
+        "por_ano": total_por_ano,
+        "por_ano_curso": [(ano, curso, quantidade) for (ano, curso), quantidade in sorted(por_ano_curso.items())],
+        "cursos": cursos[:limite],
+        "instituicoes": instituicoes[:limite],
+        "orientadores": orientadores,
+    }
+
+
+def obter_painel(armazenamento, usuario_id=None, limite=LIMITE_PAINEL):
+    """Retorna os números e séries do dashboard, lidos da tabela de agregados.
+
+    O custo depende de quantos anos, cursos, instituições e orientadores
+    existem, não de quantos TCCs. O resultado fica no cache de consultas
+    até a próxima alteração de TCC; "meus_tccs" é uma consulta à parte
+    (uma linha por ano do usuário), também em cache.
+    """
+    # Traz as escritas de outros processos antes de ler a versão
+    armazenamento.sincronizar()
+    cache = obter_cache_consultas(armazenamento)
+    painel = cache.obter(("painel", armazenamento.versao, limite), lambda: _montar_painel(armazenamento, limite))
+    meus_tccs = cache.obter(("painel_usuario", armazenamento.versao, usuario_id),
+                            lambda: armazenamento.contar_agregado("usuario_id", usuario_id or ""))
+    return {**painel, "meus_tccs": meus_tccs}
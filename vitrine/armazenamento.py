@@ -0,0 +1,930 @@
+import hashlib
+import hmac
+import json
+import logging
+import os
+import queue
+import secrets
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from vitrine.datas import agora_iso
+from vitrine.tags import extrair_tags
+from vitrine.usuarios import DiretorioUsuarios, normalizar_email, normalizar_usuario
+
+# Caminho padrão do banco (pode ser trocado pela variável de ambiente VITRINE_DB)
+DIRETORIO_RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CAMINHO_PADRAO = os.path.join(DIRETORIO_RAIZ, "dados", "vitrine.db")
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS usuarios (
+    usuario TEXT PRIMARY KEY,
+    nome_completo TEXT NOT NULL,
+    email TEXT NOT NULL,
+    senha_hash TEXT NOT NULL,
+    instituicao TEXT NOT NULL,
+    curso TEXT,
+    data_cadastro TEXT NOT NULL,
+    usuario_normalizado TEXT,
+    email_normalizado TEXT
+);
+
+CREATE TABLE IF NOT EXISTS tccs (
+    id INTEGER PRIMARY KEY,
+    titulo TEXT NOT NULL,
+    autor TEXT NOT NULL,
+    curso TEXT NOT NULL,
+    ano INTEGER NOT NULL,
+    orientador TEXT,
+    resumo TEXT NOT NULL,
+    palavras_chave TEXT,
+    instituicao TEXT,
+    data_cadastro TEXT NOT NULL,
+    usuario_cadastro TEXT,
+    usuario_id TEXT,
+    pdf_hash TEXT,
+    pdf_paginas INTEGER,
+    pdf_texto TEXT,
+    versao INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS idx_tccs_curso ON tccs(curso);
+CREATE INDEX IF NOT EXISTS idx_tccs_ano ON tccs(ano);
+CREATE INDEX IF NOT EXISTS idx_tccs_usuario_id ON tccs(usuario_id);
+
+CREATE TABLE IF NOT EXISTS sequencias (
+    nome TEXT PRIMARY KEY,
+    valor INTEGER NOT NULL
+);
+-- Bancos antigos começam a sequência depois do maior ID já usado
+INSERT OR IGNORE INTO sequencias (nome, valor) SELECT 'tccs', COALESCE(MAX(id), 0) FROM tccs;
+
+-- Registro das escritas em TCCs, para outros processos atualizarem seus índices em memória
+CREATE TABLE IF NOT EXISTS alteracoes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    tcc_id INTEGER NOT NULL,
+    evento TEXT NOT NULL
+);
+
+-- Fila de processamento dos PDFs (texto, páginas e miniatura), consumida em segundo plano
+CREATE TABLE IF NOT EXISTS tarefas_pdf (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    tcc_id INTEGER NOT NULL,
+    pdf_hash TEXT NOT NULL,
+    estado TEXT NOT NULL DEFAULT 'pendente',
+    tentativas INTEGER NOT NULL DEFAULT 0,
+    erro TEXT,
+    disponivel_em REAL NOT NULL DEFAULT 0,
+    atualizada_em REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_tarefas_pdf_estado ON tarefas_pdf(estado, disponivel_em);
+CREATE INDEX IF NOT EXISTS idx_tarefas_pdf_tcc_id ON tarefas_pdf(tcc_id);
+
+-- Palavras-chave normalizadas (ver vitrine.tags): cada tag é gravada uma vez e ligada aos TCCs
+CREATE TABLE IF NOT EXISTS tags (
+    id INTEGER PRIMARY KEY,
+    chave TEXT NOT NULL UNIQUE,
+    nome TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tccs_tags (
+    tcc_id INTEGER NOT NULL,
+    tag_id INTEGER NOT NULL,
+    PRIMARY KEY (tcc_id, tag_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_tccs_tags_tag_id ON tccs_tags(tag_id, tcc_id);
+"""
+
+# Criados depois da migração, que preenche as colunas normalizadas em bancos antigos
+ESQUEMA_INDICES_USUARIOS = """
+DROP INDEX IF EXISTS idx_usuarios_email;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_usuarios_usuario_normalizado ON usuarios(usuario_normalizado);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_usuarios_email_normalizado ON usuarios(email_normalizado);
+"""
+
+# Contagens de TCCs mantidas pelo próprio banco (gatilhos em tccs), por ano e por valor de cada dimensão.
+# A dimensão "total" (valor "") guarda só a contagem por ano
+DIMENSOES_AGREGADOS = ("curso", "instituicao", "orientador", "usuario_id")
+
+
+def _chaves_agregados(linha):
+    return [("'total'", "''")] + [(f"'{dimensao}'", f"COALESCE({linha}.{dimensao}, '')")
+                                  for dimensao in DIMENSOES_AGREGADOS]
+
+
+def _sql_agregados(sinal, linha):
+    """Comandos que somam `sinal` (+1 ou -1) às contagens da linha NEW ou OLD de tccs"""
+    return "".join(
+        f"INSERT INTO agregados (dimensao, valor, ano, quantidade) VALUES ({dimensao}, {valor}, {linha}.ano, {sinal}) "
+        f"ON CONFLICT (dimensao, valor, ano) DO UPDATE SET quantidade = quantidade + ({sinal});\n"
+        for dimensao, valor in _chaves_agregados(linha)
+    )
+
+
+def _sql_limpar_agregados(linha):
+    """Comandos que apagam as contagens zeradas da linha OLD de tccs (só as chaves dela, sem varrer a tabela)"""
+    return "".join(
+        f"DELETE FROM agregados WHERE dimensao = {dimensao} AND valor = {valor} AND ano = {linha}.ano "
+        f"AND quantidade <= 0;\n"
+        for dimensao, valor in _chaves_agregados(linha)
+    )
+
+
+# Criado numa transação junto com a carga inicial (ver _migrar_agregados)
+ESQUEMA_AGREGADOS = (
+    """CREATE TABLE agregados (
+        dimensao TEXT NOT NULL,
+        valor TEXT NOT NULL,
+        ano INTEGER NOT NULL,
+        quantidade INTEGER NOT NULL,
+        PRIMARY KEY (dimensao, valor, ano)
+    ) WITHOUT ROWID""",
+    f"""CREATE TRIGGER agregados_inserir AFTER INSERT ON tccs BEGIN
+        {_sql_agregados(1, "NEW")}
+    END""",
+    f"""CREATE TRIGGER agregados_excluir AFTER DELETE ON tccs BEGIN
+        {_sql_agregados(-1, "OLD")}
+        {_sql_limpar_agregados("OLD")}
+    END""",
+    f"""CREATE TRIGGER agregados_atualizar AFTER UPDATE OF ano, {", ".join(DIMENSOES_AGREGADOS)} ON tccs BEGIN
+        {_sql_agregados(-1, "OLD")}
+        {_sql_agregados(1, "NEW")}
+        {_sql_limpar_agregados("OLD")}
+    END""",
+)
+
+CAMPOS_TCC = (
+    "id", "titulo", "autor", "curso", "ano", "orientador", "resumo",
+    "palavras_chave", "instituicao", "data_cadastro", "usuario_cadastro", "usuario_id", "pdf_hash",
+)
+# Colunas acrescentadas depois da primeira versão do esquema (ver _migrar_tccs)
+COLUNAS_MIGRADAS_TCC = {
+    "pdf_hash": "TEXT", "pdf_paginas": "INTEGER", "pdf_texto": "TEXT", "versao": "INTEGER NOT NULL DEFAULT 1",
+}
+# Colunas lidas do banco: os campos do TCC, o que foi extraído do PDF em segundo plano
+# e a versão da linha (controle de concorrência)
+COLUNAS_TCC = CAMPOS_TCC + ("pdf_paginas", "pdf_texto", "versao")
+CAMPOS_EDITAVEIS_TCC = (
+    "titulo", "autor", "curso", "ano", "orientador", "resumo", "palavras_chave", "instituicao",
+)
+CAMPOS_USUARIO = ("usuario", "nome_completo", "email", "instituicao", "curso", "data_cadastro")
+
+# Consultas fixas: o sqlite3 mantém um cache de statements preparados por conexão,
+# então reutilizar sempre o mesmo texto evita recompilar o SQL a cada chamada
+SQL_INSERIR_TCC = (
+    f"INSERT INTO tccs ({', '.join(CAMPOS_TCC)}) "
+    f"VALUES ({', '.join(':' + c for c in CAMPOS_TCC)})"
+)
+# Escritas condicionais: só valem se a linha ainda estiver na versão que o usuário viu
+SQL_ATUALIZAR_TCC = (
+    f"UPDATE tccs SET {', '.join(f'{c} = :{c}' for c in CAMPOS_EDITAVEIS_TCC)}, versao = versao + 1 "
+    f"WHERE id = :id AND versao = :versao RETURNING {', '.join(COLUNAS_TCC)}"
+)
+SQL_EXCLUIR_TCC = (
+    f"DELETE FROM tccs WHERE id = :id AND (:versao IS NULL OR versao = :versao) "
+    f"RETURNING {', '.join(COLUNAS_TCC)}"
+)
+SQL_OBTER_TCC = f"SELECT {', '.join(COLUNAS_TCC)} FROM tccs WHERE id = ?"
+SQL_RESERVAR_IDS = "UPDATE sequencias SET valor = valor + ? WHERE nome = ? RETURNING valor"
+SQL_REGISTRAR_ALTERACAO = "INSERT INTO alteracoes (tcc_id, evento) VALUES (?, ?)"
+SQL_ULTIMA_ALTERACAO = "SELECT COALESCE(MAX(seq), 0) FROM alteracoes"
+SQL_PRIMEIRA_ALTERACAO = "SELECT MIN(seq) FROM alteracoes"
+SQL_IDS_ALTERADOS = "SELECT DISTINCT tcc_id FROM alteracoes WHERE seq > ?"
+SQL_PODAR_ALTERACOES = "DELETE FROM alteracoes WHERE seq <= ?"
+SQL_INSERIR_USUARIO = (
+    "INSERT INTO usuarios (usuario, nome_completo, email, senha_hash, instituicao, curso, data_cadastro, "
+    "usuario_normalizado, email_normalizado) "
+    "VALUES (:usuario, :nome_completo, :email, :senha_hash, :instituicao, :curso, :data_cadastro, "
+    ":usuario_normalizado, :email_normalizado)"
+)
+SQL_ENFILEIRAR_PDF = "INSERT INTO tarefas_pdf (tcc_id, pdf_hash, atualizada_em) VALUES (:id, :pdf_hash, :agora)"
+SQL_LIBERAR_TAREFAS_PDF = (
+    "UPDATE tarefas_pdf SET estado = 'pendente' WHERE estado = 'executando' AND atualizada_em < ?"
+)
+SQL_PEGAR_TAREFA_PDF = (
+    "UPDATE tarefas_pdf SET estado = 'executando', tentativas = tentativas + 1, atualizada_em = :agora "
+    "WHERE id = (SELECT id FROM tarefas_pdf WHERE estado = 'pendente' AND disponivel_em <= :agora "
+    "ORDER BY id LIMIT 1) RETURNING id, tcc_id, pdf_hash, tentativas"
+)
+SQL_FINALIZAR_TAREFA_PDF = (
+    "UPDATE tarefas_pdf SET estado = :estado, erro = :erro, disponivel_em = :disponivel_em, "
+    "atualizada_em = :agora WHERE id = :id"
+)
+# Não mexe na versão: os campos do PDF não são editáveis, então não conflitam com edições em andamento
+SQL_GRAVAR_PROCESSAMENTO_PDF = (
+    f"UPDATE tccs SET pdf_paginas = :paginas, pdf_texto = :texto WHERE id = :tcc_id AND pdf_hash = :pdf_hash "
+    f"RETURNING {', '.join(COLUNAS_TCC)}"
+)
+SQL_CRIAR_TAG = "INSERT OR IGNORE INTO tags (chave, nome) VALUES (?, ?)"
+SQL_LIGAR_TAG = "INSERT OR IGNORE INTO tccs_tags (tcc_id, tag_id) SELECT ?, id FROM tags WHERE chave = ?"
+SQL_DESLIGAR_TAGS = "DELETE FROM tccs_tags WHERE tcc_id = ?"
+# Converte datas gravadas no formato antigo ("14/03/2025" ou "14/03/2025 09:26") para ISO 8601
+SQL_MIGRAR_DATAS = (
+    "UPDATE {tabela} SET data_cadastro = substr(data_cadastro, 7, 4) || '-' || substr(data_cadastro, 4, 2) "
+    "|| '-' || substr(data_cadastro, 1, 2) || 'T' || CASE WHEN length(data_cadastro) >= 16 "
+    "THEN substr(data_cadastro, 12, 5) || ':00' ELSE '00:00:00' END "
+    "WHERE data_cadastro GLOB '[0-9][0-9]/[0-9][0-9]/[0-9][0-9][0-9][0-9]*'"
+)
+SQL_OBTER_USUARIO = "SELECT * FROM usuarios WHERE usuario_normalizado = ?"
+SQL_OBTER_USUARIO_POR_EMAIL = "SELECT * FROM usuarios WHERE email_normalizado = ?"
+SQL_CONTAR_USUARIOS = "SELECT COUNT(*) FROM usuarios"
+
+ITERACOES_SENHA = 120_000
+
+# Quantos IDs cada processo reserva de uma vez no contador persistido
+TAMANHO_BLOCO_IDS = 32
+
+# Quantas alterações o registro guarda; um processo mais atrasado que isso recarrega os índices
+LIMITE_REGISTRO_ALTERACOES = 50_000
+
+_log = logging.getLogger(__name__)
+
+
+def gerar_hash_senha(senha, sal=None):
+    """Gera o hash PBKDF2 da senha no formato algoritmo$iteracoes$sal$hash"""
+    sal = sal or secrets.token_hex(16)
+    digest = hashlib.pbkdf2_hmac("sha256", senha.encode("utf-8"), sal.encode("ascii"), ITERACOES_SENHA)
+    return f"pbkdf2_sha256${ITERACOES_SENHA}${sal}${digest.hex()}"
+
+
+def verificar_senha(senha, senha_hash):
+    """Confere a senha digitada com o hash armazenado"""
+    try:
+        _, iteracoes, sal, esperado = senha_hash.split("$")
+    except (AttributeError, ValueError):
+        return False
+    digest = hashlib.pbkdf2_hmac("sha256", senha.encode("utf-8"), sal.encode("ascii"), int(iteracoes))
+    return hmac.compare_digest(digest.hex(), esperado)
+
+
+class AlocadorIds:
+    """Entrega IDs crescentes a partir de um contador persistido (tabela sequencias).
+
+    O contador no banco é o maior ID já reservado e só cresce, então um ID
+    nunca é reutilizado, nem depois de excluir o último registro. Para não
+    escrever no banco a cada chamada, o processo reserva um bloco de IDs
+    numa única transação e vai entregando do bloco em memória, sob um lock.
+    IDs de um bloco não usado até o fim (ex.: reinício do servidor) ficam
+    como lacunas.
+    """
+
+    def __init__(self, armazenamento, nome, tamanho_bloco=TAMANHO_BLOCO_IDS):
+        self._armazenamento = armazenamento
+        self._nome = nome
+        self._tamanho_bloco = tamanho_bloco
+        self._proximo = 0
+        self._limite = 0           # primeiro ID fora do bloco reservado
+        self._lock = threading.Lock()
+
+    def _reservar_no_banco(self, quantidade):
+        """Avança o contador persistido e retorna o primeiro ID reservado"""
+        with self._armazenamento._transacao() as (con, _):
+            (ultimo,) = con.execute(SQL_RESERVAR_IDS, (quantidade, self._nome)).fetchone()
+        return ultimo - quantidade + 1
+
+    def proximo(self):
+        """Retorna um novo ID"""
+        with self._lock:
+            if self._proximo >= self._limite:
+                self._proximo = self._reservar_no_banco(self._tamanho_bloco)
+                self._limite = self._proximo + self._tamanho_bloco
+            tcc_id = self._proximo
+            self._proximo += 1
+            return tcc_id
+
+    def reservar(self, quantidade):
+        """Reserva `quantidade` IDs consecutivos de uma vez (para cargas em lote)"""
+        inicio = self._reservar_no_banco(quantidade)
+        return range(inicio, inicio + quantidade)
+
+
+class Armazenamento:
+    """Repositório de TCCs e usuários sobre um banco SQLite em modo WAL.
+
+    Uma única instância é compartilhada por todas as sessões do processo
+    (ver obter_armazenamento). As conexões ficam num pool: cada operação
+    pega uma conexão livre e a devolve ao terminar, e as escritas usam
+    transações BEGIN IMMEDIATE, que no modo WAL não bloqueiam os leitores.
+
+    Toda escrita em TCCs também entra na tabela alteracoes. É por ela que
+    um processo (ex.: a importação pela linha de comando) descobre o que
+    outro gravou e mantém seus índices em memória em dia (ver sincronizar).
+    """
+
+    def __init__(self, caminho=CAMINHO_PADRAO, tamanho_pool=8):
+        self.caminho = caminho
+        self.tamanho_pool = tamanho_pool
+        self._pool = queue.LifoQueue()
+        # Serializa commit + notificação, para os índices em memória verem as escritas na ordem do banco
+        self._escrita_lock = threading.RLock()
+        # Uma carga de índice por vez (a carga em si não segura o _escrita_lock, ver obter_indice)
+        self._carga_lock = threading.Lock()
+        self._ouvintes = []
+        self._indices = {}
+        self._fabricas = {}
+        self._diretorio = None
+        self._seq_aplicada = 0     # última alteração do registro já refletida nos índices
+        self._ultima_lida = 0
+        # Sobe a cada alteração de TCC refletida nos índices (local ou de outro processo)
+        self.versao = 0
+
+        diretorio = os.path.dirname(caminho)
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+
+        with self._conexao() as con:
+            self._migrar_tccs(con)
+            tem_tags = con.execute("SELECT 1 FROM sqlite_master WHERE name = 'tccs_tags'").fetchone()
+            con.executescript(ESQUEMA)
+            if not tem_tags:
+                self._migrar_tags(con)
+            for tabela in ("tccs", "usuarios"):
+                con.execute(SQL_MIGRAR_DATAS.format(tabela=tabela))
+            self._migrar_agregados(con)
+            self._migrar_usuarios(con)
+            con.executescript(ESQUEMA_INDICES_USUARIOS)
+            self._seq_aplicada = con.execute(SQL_ULTIMA_ALTERACAO).fetchone()[0]
+        self.ids_tcc = AlocadorIds(self, "tccs")
+
+    # ------------------------------------------------------------------
+    # Conexões e transações
+    # ------------------------------------------------------------------
+    def _abrir_conexao(self):
+        con = sqlite3.connect(
+            self.caminho,
+            timeout=30,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        con.row_factory = sqlite3.Row
+        con.execute("PRAGMA journal_mode=WAL")
+        con.execute("PRAGMA synchronous=NORMAL")
+        con.execute("PRAGMA busy_timeout=30000")
+        return con
+
+    @contextmanager
+    def _conexao(self):
+        """Empresta uma conexão do pool (abrindo uma nova se não houver livre)"""
+        try:
+            con = self._pool.get_nowait()
+        except queue.Empty:
+            con = self._abrir_conexao()
+        try:
+            yield con
+        finally:
+            if self._pool.qsize() < self.tamanho_pool:
+                self._pool.put(con)
+            else:
+                con.close()
+
+    @contextmanager
+    def _transacao(self):
+        """Executa o bloco numa transação de escrita, com rollback em caso de erro.
+
+        Entrega ao bloco a conexão e uma lista de eventos (evento, tcc). Os
+        eventos são gravados no registro de alterações junto com a escrita e,
+        depois do COMMIT, repassados aos índices e ouvintes, precedidos pelas
+        alterações de outros processos que ainda não tinham sido aplicadas.
+        """
+        eventos = []
+        with self._escrita_lock, self._conexao() as con:
+            con.execute("BEGIN IMMEDIATE")
+            try:
+                externos = self._eventos_externos(con)
+                yield con, eventos
+                if eventos:
+                    con.executemany(SQL_REGISTRAR_ALTERACAO, [(tcc["id"], evento) for evento, tcc in eventos])
+                    ultima = con.execute(SQL_ULTIMA_ALTERACAO).fetchone()[0]
+                    con.execute(SQL_PODAR_ALTERACOES, (ultima - LIMITE_REGISTRO_ALTERACOES,))
+                else:
+                    ultima = self._ultima_lida
+            except BaseException:
+                con.execute("ROLLBACK")
+                raise
+            con.execute("COMMIT")
+            self._aplicar(externos, ultima)
+            self._notificar(eventos)
+
+    def _eventos_externos(self, con):
+        """Lê as alterações gravadas por outros processos desde a última aplicada.
+
+        Retorna a lista de eventos a aplicar, ou None se o registro já foi
+        podado além desse ponto (aí os índices precisam ser recarregados).
+        Cada TCC alterado vira um único evento com o estado atual dele no
+        banco: "atualizado" se ainda existe, "excluido" (só com o ID) se não.
+        """
+        self._ultima_lida = con.execute(SQL_ULTIMA_ALTERACAO).fetchone()[0]
+        if self._ultima_lida <= self._seq_aplicada:
+            return []
+        return self._eventos_desde(con, self._seq_aplicada)
+
+    def _eventos_desde(self, con, seq):
+        """Um evento com o estado atual de cada TCC alterado depois de `seq` (None se o registro foi podado)"""
+        primeira = con.execute(SQL_PRIMEIRA_ALTERACAO).fetchone()[0]
+        if primeira is not None and primeira > seq + 1:
+            return None
+        ids = [linha[0] for linha in con.execute(SQL_IDS_ALTERADOS, (seq,))]
+        sql = f"SELECT {', '.join(COLUNAS_TCC)} FROM tccs WHERE id IN (SELECT value FROM json_each(?))"
+        atuais = {linha["id"]: dict(linha) for linha in con.execute(sql, (json.dumps(ids),))}
+        return [
+            ("atualizado", atuais[tcc_id]) if tcc_id in atuais else ("excluido", {"id": tcc_id})
+            for tcc_id in ids
+        ]
+
+    def _aplicar(self, externos, ultima):
+        """Aplica aos índices as alterações externas lidas por _eventos_externos"""
+        if externos is None:
+            self._recarregar_indices()
+        else:
+            self._notificar(externos)
+        self._seq_aplicada = max(self._seq_aplicada, ultima)
+
+    def _notificar(self, eventos):
+        for evento, tcc in eventos:
+            for indice in self._indices.values():
+                indice.aplicar_evento(evento, tcc)
+            for ouvinte in self._ouvintes:
+                ouvinte(evento, tcc)
+        # Só depois dos índices: quem ler a versão nova já encontra os índices atualizados
+        if eventos:
+            self.versao += 1
+
+    def _recarregar_indices(self):
+        for nome, fabrica in self._fabricas.items():
+            self._indices[nome] = self._carregar_indice(fabrica)
+        self.versao += 1
+
+    def _carregar_indice(self, fabrica):
+        indice = fabrica()
+        for tcc in self.listar_tccs():
+            indice.adicionar(tcc)
+        return indice
+
+    def _carregar_instantaneo(self, fabrica):
+        """Carrega um índice novo sem suspender as escritas; retorna (índice, última alteração já incluída).
+
+        Os TCCs vêm de uma transação de leitura, que no modo WAL é uma
+        fotografia consistente e não bloqueia ninguém. O que for gravado
+        depois dela fica para quem chama aplicar (ver obter_indice).
+        """
+        sql = f"SELECT {', '.join(COLUNAS_TCC)} FROM tccs ORDER BY id"
+        with self._conexao() as con:
+            con.execute("BEGIN")
+            try:
+                seq = con.execute(SQL_ULTIMA_ALTERACAO).fetchone()[0]
+                tccs = [dict(linha) for linha in con.execute(sql)]
+            finally:
+                con.execute("COMMIT")
+        indice = fabrica()
+        for tcc in tccs:
+            indice.adicionar(tcc)
+        return indice, seq
+
+    def sincronizar(self):
+        """Aplica aos índices em memória as escritas feitas por outros processos.
+
+        Custa uma consulta à chave primária do registro de alterações quando
+        não há nada novo, então pode ser chamada a cada execução da página.
+        """
+        with self._conexao() as con:
+            if con.execute(SQL_ULTIMA_ALTERACAO).fetchone()[0] <= self._seq_aplicada:
+                return
+            with self._escrita_lock:
+                con.execute("BEGIN")
+                try:
+                    externos = self._eventos_externos(con)
+                finally:
+                    con.execute("COMMIT")
+                self._aplicar(externos, self._ultima_lida)
+
+    def registrar_ouvinte(self, ouvinte):
+        """Registra uma função ouvinte(evento, tcc) chamada após cada escrita de TCC.
+
+        O evento é "inserido", "atualizado" ou "excluido"; escritas vindas de
+        outros processos chegam como "atualizado" ou "excluido" (só com o ID).
+        """
+        with self._escrita_lock:
+            self._ouvintes.append(ouvinte)
+
+    def obter_indice(self, nome, fabrica):
+        """Retorna o índice em memória `nome`, criando-o na primeira chamada.
+
+        fabrica() deve devolver um objeto com os métodos adicionar(tcc) e
+        aplicar_evento(evento, tcc). O índice é carregado com todos os TCCs
+        sem suspender as escritas (cargas grandes levam segundos); depois,
+        com elas suspensas, recebe do registro de alterações o que foi
+        gravado durante a carga e passa a receber as escritas seguintes,
+        então nenhuma se perde no meio. A cada chamada, alterações feitas por
+        outros processos são aplicadas antes.
+        """
+        self.sincronizar()
+        indice = self._indices.get(nome)
+        if indice is None:
+            with self._carga_lock:
+                indice = self._indices.get(nome)
+                if indice is None:
+                    indice, seq = self._carregar_instantaneo(fabrica)
+                    with self._escrita_lock, self._conexao() as con:
+                        con.execute("BEGIN")
+                        try:
+                            eventos = self._eventos_desde(con, seq)
+                        finally:
+                            con.execute("COMMIT")
+                        if eventos is None:
+                            # O registro foi podado durante a carga (escritas demais): carrega de novo
+                            indice = self._carregar_indice(fabrica)
+                        else:
+                            for evento, tcc in eventos:
+                                indice.aplicar_evento(evento, tcc)
+                        self._fabricas[nome] = fabrica
+                        self._indices[nome] = indice
+        return indice
+
+    def _migrar_tccs(self, con):
+        """Acrescenta as colunas novas em bancos criados antes delas existirem"""
+        colunas = {linha["name"] for linha in con.execute("PRAGMA table_info(tccs)")}
+        if not colunas:
+            return
+        for coluna, definicao in COLUNAS_MIGRADAS_TCC.items():
+            if coluna not in colunas:
+                con.execute(f"ALTER TABLE tccs ADD COLUMN {coluna} {definicao}")
+
+    def _migrar_tags(self, con):
+        """Monta a tabela de tags a partir das palavras-chave de TCCs gravados antes dela existir"""
+        con.execute("BEGIN")
+        try:
+            self._gravar_tags(con, con.execute("SELECT id, palavras_chave FROM tccs"))
+        except BaseException:
+            con.execute("ROLLBACK")
+            raise
+        con.execute("COMMIT")
+
+    def _migrar_agregados(self, con):
+        """Cria a tabela de agregados e seus gatilhos, já com as contagens dos TCCs existentes.
+
+        Tudo numa transação de escrita: nenhum TCC gravado por outro processo
+        entre a criação dos gatilhos e a carga é contado duas vezes (ou nenhuma).
+        """
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            if not con.execute("SELECT 1 FROM sqlite_master WHERE name = 'agregados'").fetchone():
+                for sql in ESQUEMA_AGREGADOS:
+                    con.execute(sql)
+                con.execute("INSERT INTO agregados SELECT 'total', '', ano, COUNT(*) FROM tccs GROUP BY ano")
+                for dimensao in DIMENSOES_AGREGADOS:
+                    con.execute(
+                        f"INSERT INTO agregados SELECT '{dimensao}', COALESCE({dimensao}, ''), ano, COUNT(*) "
+                        f"FROM tccs GROUP BY 2, 3"
+                    )
+        except BaseException:
+            con.execute("ROLLBACK")
+            raise
+        con.execute("COMMIT")
+
+    def _migrar_usuarios(self, con):
+        """Preenche as colunas normalizadas de contas criadas antes delas existirem"""
+        colunas = {linha["name"] for linha in con.execute("PRAGMA table_info(usuarios)")}
+        for coluna in ("usuario_normalizado", "email_normalizado"):
+            if coluna not in colunas:
+                con.execute(f"ALTER TABLE usuarios ADD COLUMN {coluna} TEXT")
+        pendentes = con.execute(
+            "SELECT rowid, usuario, email FROM usuarios "
+            "WHERE usuario_normalizado IS NULL OR email_normalizado IS NULL ORDER BY rowid"
+        ).fetchall()
+        if not pendentes:
+            return
+        # Bancos antigos aceitavam "Ana" e "ana" como contas diferentes. A conta mais antiga fica com o
+        # nome (ou e-mail) normalizado; nas outras a coluna fica NULL, fora dos índices UNIQUE, até
+        # um administrador juntar as contas. Elas são registradas no log a cada início.
+        usuarios = {linha[0] for linha in con.execute(
+            "SELECT usuario_normalizado FROM usuarios WHERE usuario_normalizado IS NOT NULL")}
+        emails = {linha[0] for linha in con.execute(
+            "SELECT email_normalizado FROM usuarios WHERE email_normalizado IS NOT NULL")}
+        for linha in pendentes:
+            usuario = normalizar_usuario(linha["usuario"])
+            email = normalizar_email(linha["email"])
+            if usuario in usuarios:
+                _log.warning("Conta '%s' repete o usuário de outra conta (sem diferença de maiúsculas); "
+                             "ela não consegue entrar até ser renomeada ou juntada à outra", linha["usuario"])
+                usuario = None
+            if email in emails:
+                _log.warning("Conta '%s' repete o e-mail %s de outra conta; o e-mail fica sem uso até "
+                             "as contas serem juntadas", linha["usuario"], linha["email"])
+                email = None
+            usuarios.add(usuario)
+            emails.add(email)
+            con.execute("UPDATE usuarios SET usuario_normalizado = ?, email_normalizado = ? WHERE rowid = ?",
+                        (usuario, email, linha["rowid"]))
+
+    def fechar(self):
+        """Fecha todas as conexões ociosas do pool"""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+    # ------------------------------------------------------------------
+    # TCCs
+    # ------------------------------------------------------------------
+    def _gravar_tags(self, con, tccs):
+        """Liga cada TCC às tags extraídas das suas palavras-chave, trocando as ligações anteriores"""
+        ids, tags, ligacoes = [], {}, []
+        for tcc in tccs:
+            ids.append((tcc["id"],))
+            for chave, nome in extrair_tags(tcc["palavras_chave"]):
+                tags.setdefault(chave, nome)
+                ligacoes.append((tcc["id"], chave))
+        con.executemany(SQL_DESLIGAR_TAGS, ids)
+        con.executemany(SQL_CRIAR_TAG, tags.items())
+        con.executemany(SQL_LIGAR_TAG, ligacoes)
+
+    def inserir_tcc(self, tcc):
+        """Insere um TCC e retorna seu ID (ID e data de cadastro são preenchidos aqui se faltarem)"""
+        dados = {campo: tcc.get(campo) for campo in CAMPOS_TCC}
+        if dados["id"] is None:
+            dados["id"] = self.ids_tcc.proximo()
+        dados["data_cadastro"] = dados["data_cadastro"] or agora_iso()
+        dados["versao"] = 1
+        with self._transacao() as (con, eventos):
+            con.execute(SQL_INSERIR_TCC, dados)
+            # O PDF entra na fila na mesma transação: não existe TCC com PDF sem tarefa
+            if dados["pdf_hash"]:
+                con.execute(SQL_ENFILEIRAR_PDF, {**dados, "agora": time.time()})
+            self._gravar_tags(con, [dados])
+            eventos.append(("inserido", dados))
+        return dados["id"]
+
+    def inserir_tccs(self, tccs):
+        """Insere vários TCCs numa única transação e retorna seus IDs"""
+        agora = agora_iso()
+        lote = [{**{campo: tcc.get(campo) for campo in CAMPOS_TCC}, "versao": 1} for tcc in tccs]
+        for dados in lote:
+            dados["data_cadastro"] = dados["data_cadastro"] or agora
+        sem_id = [dados for dados in lote if dados["id"] is None]
+        if sem_id:
+            for dados, tcc_id in zip(sem_id, self.ids_tcc.reservar(len(sem_id))):
+                dados["id"] = tcc_id
+        with self._transacao() as (con, eventos):
+            con.executemany(SQL_INSERIR_TCC, lote)
+            self._gravar_tags(con, lote)
+            eventos.extend(("inserido", dados) for dados in lote)
+        return [dados["id"] for dados in lote]
+
+    def obter_tcc(self, tcc_id):
+        """Retorna um TCC pelo ID, ou None se não existir"""
+        with self._conexao() as con:
+            linha = con.execute(SQL_OBTER_TCC, (tcc_id,)).fetchone()
+        return dict(linha) if linha else None
+
+    def atualizar_tcc(self, tcc_id, campos, versao=None):
+        """Atualiza os campos editáveis de um TCC e incrementa sua versão.
+
+        Com `versao`, a escrita só acontece se o TCC ainda estiver nessa
+        versão (a que o usuário tinha na tela). Retorna False se o TCC não
+        existir mais ou tiver sido alterado por outra pessoa nesse meio tempo.
+        """
+        with self._transacao() as (con, eventos):
+            atual = con.execute(SQL_OBTER_TCC, (tcc_id,)).fetchone()
+            if atual is None or (versao is not None and atual["versao"] != versao):
+                return False
+            dados = {campo: campos.get(campo, atual[campo]) for campo in CAMPOS_EDITAVEIS_TCC}
+            dados["id"] = tcc_id
+            dados["versao"] = atual["versao"]
+            linha = con.execute(SQL_ATUALIZAR_TCC, dados).fetchone()
+            if linha is None:
+                return False
+            self._gravar_tags(con, [linha])
+            eventos.append(("atualizado", dict(linha)))
+        return True
+
+    def excluir_tcc(self, tcc_id, versao=None):
+        """Exclui um TCC. Retorna False se ele não existir (ou, com `versao`, se tiver mudado de versão)"""
+        with self._transacao() as (con, eventos):
+            linha = con.execute(SQL_EXCLUIR_TCC, {"id": tcc_id, "versao": versao}).fetchone()
+            if linha is None:
+                return False
+            con.execute(SQL_DESLIGAR_TAGS, (tcc_id,))
+            eventos.append(("excluido", dict(linha)))
+        return True
+
+    # ------------------------------------------------------------------
+    # Processamento dos PDFs em segundo plano (ver vitrine.processamento)
+    # ------------------------------------------------------------------
+    def pegar_tarefa_pdf(self, tempo_maximo):
+        """Marca a próxima tarefa pendente como "executando" e a retorna, ou None se não houver.
+
+        Tarefas que estão "executando" há mais de `tempo_maximo` segundos
+        (o processo que as pegou morreu) voltam antes para a fila.
+        """
+        agora = time.time()
+        with self._transacao() as (con, _):
+            con.execute(SQL_LIBERAR_TAREFAS_PDF, (agora - tempo_maximo,))
+            linha = con.execute(SQL_PEGAR_TAREFA_PDF, {"agora": agora}).fetchone()
+        return dict(linha) if linha else None
+
+    def concluir_tarefa_pdf(self, tarefa, paginas, texto):
+        """Grava no TCC o que foi extraído do PDF e marca a tarefa como concluída"""
+        agora = time.time()
+        with self._transacao() as (con, eventos):
+            linha = con.execute(SQL_GRAVAR_PROCESSAMENTO_PDF, {
+                "paginas": paginas, "texto": texto, "tcc_id": tarefa["tcc_id"], "pdf_hash": tarefa["pdf_hash"],
+            }).fetchone()
+            con.execute(SQL_FINALIZAR_TAREFA_PDF, {
+                "id": tarefa["id"], "estado": "concluida", "erro": None, "disponivel_em": 0, "agora": agora,
+            })
+            # O TCC pode ter sido excluído enquanto o PDF era processado
+            if linha is not None:
+                eventos.append(("atualizado", dict(linha)))
+
+    def falhar_tarefa_pdf(self, tarefa, erro, tentar_de_novo_em=None):
+        """Registra a falha de uma tarefa; com tentar_de_novo_em (segundos), ela volta para a fila"""
+        agora = time.time()
+        with self._transacao() as (con, _):
+            con.execute(SQL_FINALIZAR_TAREFA_PDF, {
+                "id": tarefa["id"],
+                "estado": "falhou" if tentar_de_novo_em is None else "pendente",
+                "erro": erro,
+                "disponivel_em": agora + (tentar_de_novo_em or 0),
+                "agora": agora,
+            })
+
+    def estados_pdf(self, ids):
+        """Retorna {tcc_id: estado da tarefa mais recente do PDF} para os TCCs informados"""
+        ids = list(ids)
+        if not ids:
+            return {}
+        sql = (
+            "SELECT tcc_id, estado FROM tarefas_pdf WHERE id IN ("
+            "SELECT MAX(id) FROM tarefas_pdf WHERE tcc_id IN (SELECT value FROM json_each(?)) GROUP BY tcc_id)"
+        )
+        with self._conexao() as con:
+            return {linha["tcc_id"]: linha["estado"] for linha in con.execute(sql, (json.dumps(ids),))}
+
+    def _filtros_tccs(self, usuario_id=None, excluir_usuario_id=None, curso=None, ano=None, ids=None):
+        """Monta a cláusula WHERE e os parâmetros para os filtros da listagem"""
+        condicoes = []
+        parametros = []
+        if ids is not None:
+            # Um único parâmetro JSON evita o limite de variáveis do SQLite
+            condicoes.append("id IN (SELECT value FROM json_each(?))")
+            parametros.append(json.dumps(list(ids)))
+        if usuario_id is not None:
+            condicoes.append("usuario_id = ?")
+            parametros.append(usuario_id)
+        if excluir_usuario_id is not None:
+            condicoes.append("usuario_id IS NOT ?")
+            parametros.append(excluir_usuario_id)
+        if curso is not None:
+            condicoes.append("curso = ?")
+            parametros.append(curso)
+        if ano is not None:
+            condicoes.append("ano = ?")
+            parametros.append(ano)
+        where = " WHERE " + " AND ".join(condicoes) if condicoes else ""
+        return where, parametros
+
+    def listar_tccs(self, colunas=COLUNAS_TCC, **filtros):
+        """Lista os TCCs em ordem de cadastro (só as `colunas` pedidas), aplicando os filtros informados"""
+        where, parametros = self._filtros_tccs(**filtros)
+        sql = f"SELECT {', '.join(colunas)} FROM tccs{where} ORDER BY id"
+        with self._conexao() as con:
+            return [dict(linha) for linha in con.execute(sql, parametros)]
+
+    def ultima_alteracao(self):
+        """Número da última escrita de TCC no registro de alterações (de qualquer processo)"""
+        with self._conexao() as con:
+            return con.execute(SQL_ULTIMA_ALTERACAO).fetchone()[0]
+
+    def obter_resumos(self, ids):
+        """Retorna {id: resumo} dos TCCs informados (IDs inexistentes são ignorados)"""
+        ids = list(ids)
+        if not ids:
+            return {}
+        sql = "SELECT id, resumo FROM tccs WHERE id IN (SELECT value FROM json_each(?))"
+        with self._conexao() as con:
+            return dict(con.execute(sql, (json.dumps(ids),)).fetchall())
+
+    # ------------------------------------------------------------------
+    # Agregados (mantidos por gatilhos a cada escrita em tccs)
+    # ------------------------------------------------------------------
+    def agregados_por_ano(self, dimensao="total"):
+        """Retorna [(valor, ano, quantidade)] da dimensão, em ordem de ano"""
+        with self._conexao() as con:
+            return con.execute(
+                "SELECT valor, ano, quantidade FROM agregados WHERE dimensao = ? ORDER BY ano, valor", (dimensao,)
+            ).fetchall()
+
+    def agregados(self, dimensao, limite=None):
+        """Retorna [(valor, quantidade)] da dimensão somando todos os anos, dos mais frequentes aos menos"""
+        sql = ("SELECT valor, SUM(quantidade) AS total FROM agregados WHERE dimensao = ? "
+               "GROUP BY valor ORDER BY total DESC, valor LIMIT ?")
+        with self._conexao() as con:
+            return con.execute(sql, (dimensao, -1 if limite is None else limite)).fetchall()
+
+    def contar_agregado(self, dimensao, valor):
+        """Retorna quantos TCCs têm `valor` na dimensão (ex.: quantos são de um usuário)"""
+        with self._conexao() as con:
+            return con.execute(
+                "SELECT COALESCE(SUM(quantidade), 0) FROM agregados WHERE dimensao = ? AND valor = ?",
+                (dimensao, valor),
+            ).fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # Usuários
+    # ------------------------------------------------------------------
+    def _diretorio_usuarios(self):
+        """Retorna o diretório de contas, carregando-o do banco na primeira chamada"""
+        if self._diretorio is None:
+            with self._escrita_lock:
+                if self._diretorio is None:
+                    diretorio = DiretorioUsuarios()
+                    with self._conexao() as con:
+                        # Contas repetidas de bancos antigos (coluna normalizada NULL, ver _migrar_usuarios)
+                        # não entram pelo nome; as sem e-mail normalizado vêm antes, para a dona do e-mail
+                        # ficar com ele
+                        for linha in con.execute("SELECT * FROM usuarios WHERE usuario_normalizado IS NOT NULL "
+                                                 "ORDER BY email_normalizado IS NOT NULL"):
+                            diretorio.adicionar(dict(linha))
+                    self._diretorio = diretorio
+        return self._diretorio
+
+    def _registro_usuario(self, usuario=None, email=None):
+        """Busca a conta no diretório; se não estiver lá (criada por outro processo), no banco"""
+        diretorio = self._diretorio_usuarios()
+        if usuario is not None:
+            registro = diretorio.obter(usuario)
+            sql, chave = SQL_OBTER_USUARIO, normalizar_usuario(usuario)
+        else:
+            registro = diretorio.obter_por_email(email)
+            sql, chave = SQL_OBTER_USUARIO_POR_EMAIL, normalizar_email(email)
+        if registro is None:
+            with self._conexao() as con:
+                linha = con.execute(sql, (chave,)).fetchone()
+            if linha is not None:
+                registro = dict(linha)
+                diretorio.adicionar(registro)
+        return registro
+
+    def inserir_usuario(self, usuario, senha):
+        """Cadastra um usuário. Retorna False se o usuário ou o e-mail já existirem.
+
+        Usuário e e-mail são comparados na forma normalizada, então "Ana" e
+        "ana", ou "Ana@X.com" e "ana@x.com", contam como a mesma conta.
+        """
+        dados = {campo: usuario.get(campo) for campo in CAMPOS_USUARIO}
+        dados["senha_hash"] = gerar_hash_senha(senha)
+        dados["usuario_normalizado"] = normalizar_usuario(dados["usuario"])
+        dados["email_normalizado"] = normalizar_email(dados["email"])
+        dados["data_cadastro"] = dados["data_cadastro"] or agora_iso()
+        diretorio = self._diretorio_usuarios()
+        try:
+            with self._transacao() as (con, _):
+                con.execute(SQL_INSERIR_USUARIO, dados)
+        except sqlite3.IntegrityError:
+            return False
+        diretorio.adicionar(dados)
+        return True
+
+    def obter_usuario(self, usuario):
+        """Retorna os dados públicos de um usuário (sem a senha), ou None"""
+        registro = self._registro_usuario(usuario=usuario)
+        if registro is None:
+            return None
+        return {campo: registro[campo] for campo in CAMPOS_USUARIO}
+
+    def email_cadastrado(self, email):
+        """Indica se o e-mail já pertence a alguma conta"""
+        return self._registro_usuario(email=email) is not None
+
+    def autenticar(self, usuario, senha):
+        """Confere as credenciais e retorna os dados públicos do usuário, ou None"""
+        registro = self._registro_usuario(usuario=usuario)
+        if registro is None or not verificar_senha(senha, registro["senha_hash"]):
+            return None
+        return {campo: registro[campo] for campo in CAMPOS_USUARIO}
+
+    def contar_usuarios(self):
+        """Retorna o número de contas cadastradas.
+
+        Contado no banco: o diretório em memória só vê as contas criadas por
+        outro processo quando alguém as procura pelo nome ou e-mail.
+        """
+        with self._conexao() as con:
+            (total,) = con.execute(SQL_CONTAR_USUARIOS).fetchone()
+        return total
+
+
+_instancia = None
+_instancia_lock = threading.Lock()
+
+
+def obter_armazenamento():
+    """Retorna o repositório compartilhado pelo processo, criando-o na primeira chamada"""
+    global _instancia
+    if _instancia is None:
+        with _instancia_lock:
+            if _instancia is None:
+                _instancia = Armazenamento(os.environ.get("VITRINE_DB", CAMINHO_PADRAO))
+    return _instancia
@@ -0,0 +1,94 @@
+import hashlib
+import os
+import re
+import tempfile
+import unicodedata
+
+from vitrine.armazenamento import DIRETORIO_RAIZ
+
+# Os PDFs ficam na pasta static/ do app e são baixados direto do disco pelo servidor do
+# Streamlit (server.enableStaticServing), sem passar pelo Python a cada download
+DIRETORIO_PDFS = os.path.join(DIRETORIO_RAIZ, "static", "pdfs")
+URL_PDFS = "app/static/pdfs"
+
+TAMANHO_MAXIMO_PDF_MB = 30
+TAMANHO_MAXIMO_PDF = TAMANHO_MAXIMO_PDF_MB * 1024 * 1024
+# Tamanho de cada pedaço copiado do upload para o disco
+TAMANHO_PEDACO = 1024 * 1024
+ASSINATURA_PDF = b"%PDF-"
+
+
+def caminho_pdf(pdf_hash):
+    """Caminho no disco do PDF com esse hash (pastas pelos 2 primeiros caracteres)"""
+    return os.path.join(DIRETORIO_PDFS, pdf_hash[:2], pdf_hash + ".pdf")
+
+
+def caminho_miniatura(pdf_hash):
+    """Caminho no disco da miniatura (PNG da primeira página) do PDF com esse hash"""
+    return os.path.join(DIRETORIO_PDFS, pdf_hash[:2], pdf_hash + ".png")
+
+
+def url_miniatura(pdf_hash):
+    """URL relativa da miniatura do PDF com esse hash"""
+    return f"{URL_PDFS}/{pdf_hash[:2]}/{pdf_hash}.png"
+
+
+def url_pdf(pdf_hash):
+    """URL relativa para baixar o PDF com esse hash"""
+    return f"{URL_PDFS}/{pdf_hash[:2]}/{pdf_hash}.pdf"
+
+
+def nome_download(titulo):
+    """Nome de arquivo amigável para o download ("Análise de Dados" -> "analise-de-dados.pdf")"""
+    decomposto = unicodedata.normalize("NFKD", titulo or "")
+    ascii_ = "".join(c for c in decomposto if not unicodedata.combining(c)).lower()
+    return (re.sub(r"[^a-z0-9]+", "-", ascii_).strip("-")[:80] or "tcc") + ".pdf"
+
+
+def validar_pdf(arquivo):
+    """Confere tamanho e assinatura de um upload de PDF e retorna a lista de erros (vazia se ok)"""
+    tamanho = getattr(arquivo, "size", None)
+    if tamanho is not None and tamanho > TAMANHO_MAXIMO_PDF:
+        return [f"O PDF deve ter no máximo {TAMANHO_MAXIMO_PDF_MB} MB"]
+    inicio = arquivo.read(len(ASSINATURA_PDF))
+    arquivo.seek(0)
+    if inicio != ASSINATURA_PDF:
+        return ["O arquivo enviado não é um PDF válido"]
+    return []
+
+
+def armazenar_pdf(arquivo):
+    """Copia o PDF para o armazenamento por conteúdo, pedaço por pedaço, e retorna seu hash SHA-256.
+
+    O arquivo é gravado num temporário enquanto o hash é calculado e só
+    então ganha o nome definitivo; se um PDF idêntico já estiver guardado,
+    o temporário é descartado e o existente é reaproveitado.
+    """
+    os.makedirs(DIRETORIO_PDFS, exist_ok=True)
+    soma = hashlib.sha256()
+    tamanho = 0
+    descritor, temporario = tempfile.mkstemp(dir=DIRETORIO_PDFS, suffix=".parcial")
+    try:
+        with os.fdopen(descritor, "wb") as destino:
+            while True:
+                pedaco = arquivo.read(TAMANHO_PEDACO)
+                if not pedaco:
+                    break
+                tamanho += len(pedaco)
+                if tamanho > TAMANHO_MAXIMO_PDF:
+                    raise ValueError(f"O PDF deve ter no máximo {TAMANHO_MAXIMO_PDF_MB} MB")
+                soma.update(pedaco)
+                destino.write(pedaco)
+        pdf_hash = soma.hexdigest()
+        destino_final = caminho_pdf(pdf_hash)
+        if os.path.exists(destino_final):
+            os.remove(temporario)
+        else:
+            os.makedirs(os.path.dirname(destino_final), exist_ok=True)
+            os.chmod(temporario, 0o644)
+            os.replace(temporario, destino_final)
+        return pdf_hash
+    except BaseException:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        raise
@@ -0,0 +1,187 @@
+import bisect
+import heapq
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter
+
+# Campos indexados e o peso de cada um na contagem de termos
+PESOS_CAMPOS = {
+    "titulo": 3,
+    "palavras_chave": 2,
+    "autor": 2,
+    "orientador": 2,
+    "resumo": 1,
+    "pdf_texto": 1,     # início do texto do PDF, extraído em segundo plano (ver vitrine.processamento)
+}
+
+# Palavras muito frequentes em português que não ajudam a distinguir documentos
+STOPWORDS = frozenset("""
+a ao aos as com da das de do dos e em entre na nas no nos o os ou para pela pelas pelo pelos
+por que se sem sob sobre um uma umas uns
+""".split())
+
+# Parâmetros do BM25
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Quantos termos do vocabulário o último token da consulta pode expandir (busca por prefixo)
+MAX_EXPANSOES_PREFIXO = 64
+
+_RE_TOKEN = re.compile(r"\w+")
+
+
+def normalizar(texto):
+    """Remove acentos e converte para minúsculas ("Avaliação" -> "avaliacao")"""
+    if not texto:
+        return ""
+    decomposto = unicodedata.normalize("NFKD", str(texto))
+    return "".join(c for c in decomposto if not unicodedata.combining(c)).casefold()
+
+
+def tokenizar(texto):
+    """Quebra o texto normalizado em termos, descartando stopwords"""
+    return [t for t in _RE_TOKEN.findall(normalizar(texto)) if t not in STOPWORDS]
+
+
+class IndiceBusca:
+    """Índice invertido dos TCCs com ranqueamento BM25.
+
+    Guarda, para cada termo, os documentos em que ele aparece e a frequência
+    (já ponderada pelo campo). O índice é atualizado documento a documento,
+    então salvar, editar ou excluir um TCC custa só o tamanho daquele TCC.
+    """
+
+    def __init__(self):
+        self._postings = {}        # termo -> {tcc_id: frequência ponderada}
+        self._termos_doc = {}      # tcc_id -> Counter dos termos do documento
+        self._tamanho_doc = {}     # tcc_id -> soma das frequências
+        self._tamanho_total = 0
+        self._vocabulario = []     # termos em ordem, para expansão por prefixo
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._termos_doc)
+
+    def _termos(self, tcc):
+        termos = Counter()
+        for campo, peso in PESOS_CAMPOS.items():
+            for termo in tokenizar(tcc.get(campo)):
+                termos[termo] += peso
+        return termos
+
+    def adicionar(self, tcc):
+        """Indexa (ou reindexa) um TCC"""
+        with self._lock:
+            tcc_id = tcc["id"]
+            if tcc_id in self._termos_doc:
+                self.remover(tcc_id)
+            termos = self._termos(tcc)
+            for termo, freq in termos.items():
+                posting = self._postings.get(termo)
+                if posting is None:
+                    posting = self._postings[termo] = {}
+                    bisect.insort(self._vocabulario, termo)
+                posting[tcc_id] = freq
+            tamanho = sum(termos.values())
+            self._termos_doc[tcc_id] = termos
+            self._tamanho_doc[tcc_id] = tamanho
+            self._tamanho_total += tamanho
+
+    def remover(self, tcc_id):
+        """Remove um TCC do índice (não faz nada se ele não estiver indexado)"""
+        with self._lock:
+            termos = self._termos_doc.pop(tcc_id, None)
+            if termos is None:
+                return
+            for termo in termos:
+                posting = self._postings[termo]
+                del posting[tcc_id]
+                if not posting:
+                    del self._postings[termo]
+                    posicao = bisect.bisect_left(self._vocabulario, termo)
+                    del self._vocabulario[posicao]
+            self._tamanho_total -= self._tamanho_doc.pop(tcc_id)
+
+    def _expandir_prefixo(self, prefixo):
+        inicio = bisect.bisect_left(self._vocabulario, prefixo)
+        termos = []
+        for termo in self._vocabulario[inicio:inicio + MAX_EXPANSOES_PREFIXO]:
+            if not termo.startswith(prefixo):
+                break
+            termos.append(termo)
+        return termos
+
+    def aplicar_evento(self, evento, tcc):
+        """Mantém o índice em dia com uma escrita do armazenamento"""
+        if evento == "excluido":
+            self.remover(tcc["id"])
+        else:
+            self.adicionar(tcc)
+
+    def buscar(self, consulta, limite=None):
+        """Retorna [(tcc_id, pontuação)] dos TCCs que contêm todos os termos da consulta.
+
+        O último termo também casa por prefixo, para que a busca funcione
+        enquanto o usuário ainda está digitando. O resultado vem ordenado
+        pela pontuação BM25, da maior para a menor.
+        """
+        tokens = tokenizar(consulta)
+        if not tokens:
+            return []
+
+        with self._lock:
+            total_docs = len(self._termos_doc)
+            if not total_docs:
+                return []
+            media = self._tamanho_total / total_docs
+
+            # Cada grupo é a lista de termos aceitos para uma palavra da consulta
+            grupos = [[t] if t in self._postings else [] for t in tokens[:-1]]
+            grupos.append(self._expandir_prefixo(tokens[-1]))
+            if any(not grupo for grupo in grupos):
+                return []
+            # Começa pelo grupo mais raro: os seguintes só pontuam quem ainda é candidato
+            grupos.sort(key=lambda grupo: sum(len(self._postings[t]) for t in grupo))
+
+            # Parte constante do denominador do BM25, calculada uma vez por consulta
+            tamanhos = self._tamanho_doc
+            base = BM25_K1 * (1 - BM25_B)
+            por_tamanho = BM25_K1 * BM25_B / media
+
+            pontuacoes = None
+            for grupo in grupos:
+                parcial = {}
+                for termo in grupo:
+                    posting = self._postings[termo]
+                    idf = math.log(1 + (total_docs - len(posting) + 0.5) / (len(posting) + 0.5))
+                    fator = idf * (BM25_K1 + 1)
+                    if pontuacoes is None:
+                        itens = posting.items()
+                    else:
+                        itens = [(i, posting[i]) for i in pontuacoes if i in posting]
+                    if not parcial:
+                        parcial = {
+                            i: fator * f / (f + base + por_tamanho * tamanhos[i]) for i, f in itens
+                        }
+                        continue
+                    for tcc_id, freq in itens:
+                        ganho = fator * freq / (freq + base + por_tamanho * tamanhos[tcc_id])
+                        parcial[tcc_id] = parcial.get(tcc_id, 0.0) + ganho
+                if pontuacoes is not None:
+                    parcial = {i: p + pontuacoes[i] for i, p in parcial.items()}
+                pontuacoes = parcial
+                if not pontuacoes:
+                    return []
+
+        if limite:
+            ordem = heapq.nlargest(limite, pontuacoes, key=pontuacoes.__getitem__)
+        else:
+            ordem = sorted(pontuacoes, key=pontuacoes.__getitem__, reverse=True)
+        return [(tcc_id, pontuacoes[tcc_id]) for tcc_id in ordem]
+
+
+def obter_indice_busca(armazenamento):
+    """Retorna o índice de busca ligado ao armazenamento, montando-o na primeira chamada"""
+    return armazenamento.obter_indice("busca", IndiceBusca)
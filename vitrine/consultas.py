@@ -0,0 +1,259 @@
+import threading
+import weakref
+from collections import OrderedDict, deque
+
+from vitrine.busca import obter_indice_busca, tokenizar
+from vitrine.facetas import obter_indice_facetas
+from vitrine.ordenacao import obter_indice_ordenacao
+from vitrine.tags import extrair_tags, obter_indice_tags
+
+# Quantas combinações de filtros cada processo mantém em cache
+TAMANHO_CACHE_CONSULTAS = 256
+# Quantas escritas recentes o cache lembra para remendar resultados antigos em vez de recalculá-los
+LIMITE_REMENDOS = 64
+
+
+class CacheConsultas:
+    """Cache LRU de resultados de consultas, com contadores de acertos e faltas.
+
+    As chaves incluem a versão do armazenamento, então uma escrita invalida
+    tudo de uma vez sem varrer o cache: as entradas antigas simplesmente
+    deixam de ser pedidas e saem pela ponta menos usada.
+
+    Consultas feitas com obter_versionado ainda podem ser remendadas: o
+    cache guarda as últimas escritas (ver registrar_evento) e, se só
+    houve poucas desde a versão em cache, o resultado antigo é corrigido
+    com elas em vez de recalculado.
+    """
+
+    def __init__(self, capacidade=TAMANHO_CACHE_CONSULTAS):
+        self.capacidade = capacidade
+        self.acertos = 0
+        self.faltas = 0
+        self.remendos = 0
+        self._itens = OrderedDict()
+        self._versoes = {}         # consulta (chave sem a versão) -> versão mais recente em cache
+        self._eventos = deque()    # (versão, evento, tcc) das últimas escritas
+        self._descartados_ate = 0  # versão do evento mais novo que já saiu da fila
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._itens)
+
+    def obter(self, chave, calcular):
+        """Retorna o valor em cache para a chave, ou calcula com calcular() e guarda"""
+        with self._lock:
+            if chave in self._itens:
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return self._itens[chave]
+            self.faltas += 1
+        # Calculado fora do lock: consultas diferentes não esperam umas pelas outras
+        valor = calcular()
+        self._guardar(chave, valor)
+        return valor
+
+    def _guardar(self, chave, valor):
+        with self._lock:
+            self._itens[chave] = valor
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.capacidade:
+                antiga, _ = self._itens.popitem(last=False)
+                if isinstance(antiga, tuple) and self._versoes.get(antiga[1:]) == antiga[0]:
+                    del self._versoes[antiga[1:]]
+
+    def obter_versionado(self, versao, consulta, calcular, remendar):
+        """Retorna o valor da consulta na versão dada do armazenamento.
+
+        Numa falta, se a mesma consulta está em cache numa versão anterior
+        e todas as escritas desde então são conhecidas, chama
+        remendar(valor_antigo, eventos) com a lista de (evento, tcc); se ele
+        devolver None, o valor é recalculado com calcular().
+        """
+        chave = (versao,) + consulta
+        with self._lock:
+            if chave in self._itens:
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return self._itens[chave]
+            self.faltas += 1
+            anterior = self._versoes.get(consulta)
+            eventos = None
+            if anterior is not None and anterior < versao:
+                valor = self._itens[(anterior,) + consulta]
+                eventos = self._eventos_entre(anterior, versao)
+        valor = remendar(valor, eventos) if eventos is not None else None
+        if valor is None:
+            valor = calcular()
+        else:
+            self.remendos += 1
+        self._guardar(chave, valor)
+        with self._lock:
+            if self._versoes.get(consulta, 0) <= versao:
+                self._versoes[consulta] = versao
+        return valor
+
+    def registrar_evento(self, versao, evento, tcc):
+        """Guarda uma escrita de TCC que passa a valer na versão dada (ver obter_cache_consultas)"""
+        with self._lock:
+            self._eventos.append((versao, evento, tcc))
+            if len(self._eventos) > LIMITE_REMENDOS:
+                self._descartados_ate = self._eventos.popleft()[0]
+
+    def _eventos_entre(self, de, ate):
+        """Eventos das versões de+1 até ate, ou None se algum deles não é mais conhecido"""
+        if self._descartados_ate > de:
+            return None
+        eventos = [(evento, tcc) for versao, evento, tcc in self._eventos if de < versao <= ate]
+        versoes = {versao for versao, _, _ in self._eventos if de < versao <= ate}
+        # Uma versão sem eventos foi uma recarga dos índices: o resultado antigo não serve mais
+        if len(versoes) != ate - de:
+            return None
+        return eventos
+
+    def limpar(self):
+        """Esvazia o cache e zera os contadores"""
+        with self._lock:
+            self._itens.clear()
+            self._versoes.clear()
+            self.acertos = self.faltas = self.remendos = 0
+
+    def estatisticas(self):
+        """Retorna itens, capacidade, acertos, faltas e remendos"""
+        return {"itens": len(self._itens), "capacidade": self.capacidade,
+                "acertos": self.acertos, "faltas": self.faltas, "remendos": self.remendos}
+
+
+_caches = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def obter_cache_consultas(armazenamento):
+    """Retorna o cache de consultas ligado ao armazenamento, criando-o na primeira chamada"""
+    with _caches_lock:
+        cache = _caches.get(armazenamento)
+        if cache is None:
+            cache = _caches[armazenamento] = CacheConsultas()
+            # Os eventos chegam antes de a versão subir: valem a partir da versão seguinte
+            armazenamento.registrar_ouvinte(
+                lambda evento, tcc: cache.registrar_evento(armazenamento.versao + 1, evento, tcc))
+        return cache
+
+
+def _calcular_ids(armazenamento, usuario_id, excluir_usuario_id, curso, ano, busca, tags, ordenar_por, decrescente):
+    selecionados = obter_indice_facetas(armazenamento).filtrar(
+        usuario_id=usuario_id,
+        excluir_usuario_id=excluir_usuario_id,
+        curso=curso,
+        ano=ano,
+    )
+    if tags:
+        selecionados &= obter_indice_tags(armazenamento).filtrar(tags)
+    # Consulta só com stopwords ("de", "a da") não tem termos: é como não buscar
+    if busca and tokenizar(busca):
+        ranking = obter_indice_busca(armazenamento).buscar(busca)
+        selecionados = [tcc_id for tcc_id, _ in ranking if tcc_id in selecionados]
+        if not ordenar_por:
+            return tuple(selecionados)
+    if ordenar_por:
+        return tuple(obter_indice_ordenacao(armazenamento).ordenar(selecionados, ordenar_por, decrescente))
+    return tuple(sorted(selecionados))
+
+
+def _passa_nos_filtros(tcc, usuario_id, excluir_usuario_id, curso, ano, tags):
+    """Confere um único TCC contra os filtros de faceta e de tags (as mesmas regras dos índices)"""
+    if usuario_id is not None and tcc.get("usuario_id") != usuario_id:
+        return False
+    if excluir_usuario_id is not None and tcc.get("usuario_id") == excluir_usuario_id:
+        return False
+    if curso is not None and tcc.get("curso") != curso:
+        return False
+    if ano is not None and tcc.get("ano") != ano:
+        return False
+    if tags and not set(tags) <= {chave for chave, _ in extrair_tags(tcc.get("palavras_chave"))}:
+        return False
+    return True
+
+
+def _posicao(ids, chave, alvo, decrescente):
+    """Busca binária da posição de `alvo` em `ids`, ordenados pela função chave"""
+    inicio, fim = 0, len(ids)
+    while inicio < fim:
+        meio = (inicio + fim) // 2
+        atual = chave(ids[meio])
+        if (atual > alvo) if decrescente else (atual < alvo):
+            inicio = meio + 1
+        else:
+            fim = meio
+    return inicio
+
+
+def _remendar_ids(armazenamento, ids, argumentos, eventos):
+    """Aplica escritas recentes a um resultado de _calcular_ids já pronto.
+
+    Cada TCC alterado sai do resultado e, se ainda existe e passa nos
+    filtros, volta na posição da ordenação (busca binária), sem refazer a
+    consulta. Retorna None quando isso não é possível: com busca textual
+    a relevância muda a cada escrita (ela depende do tamanho do acervo), e
+    só exclusões numa lista ordenada por outro critério são remendadas.
+    """
+    usuario_id, excluir_usuario_id, curso, ano, busca, tags, ordenar_por, decrescente = argumentos
+    # Só o último estado de cada TCC importa
+    finais = {tcc["id"]: (evento, tcc) for evento, tcc in eventos}
+    com_busca = bool(busca and tokenizar(busca))
+    if com_busca and (not ordenar_por or any(evento != "excluido" for evento, _ in finais.values())):
+        return None
+
+    resultado = list(ids)
+    for tcc_id in finais:
+        # list.index varre em C; são poucos TCCs alterados (no máximo LIMITE_REMENDOS)
+        try:
+            del resultado[resultado.index(tcc_id)]
+        except ValueError:
+            pass
+    if ordenar_por:
+        indice = obter_indice_ordenacao(armazenamento)
+        chave = lambda tcc_id: (indice.chave(tcc_id, ordenar_por), tcc_id)
+    else:
+        chave = lambda tcc_id: tcc_id
+        decrescente = False
+    for tcc_id, (evento, tcc) in finais.items():
+        if evento == "excluido" or not _passa_nos_filtros(tcc, usuario_id, excluir_usuario_id, curso, ano, tags):
+            continue
+        resultado.insert(_posicao(resultado, chave, chave(tcc_id), decrescente), tcc_id)
+    return tuple(resultado)
+
+
+def filtrar_ids(armazenamento, usuario_id=None, excluir_usuario_id=None, curso=None, ano=None, busca=None,
+                tags=None, ordenar_por=None, decrescente=False, usar_cache=True):
+    """Retorna a tupla de IDs dos TCCs que passam nos filtros, na ordem da listagem.
+
+    É o mesmo caminho usado pela lista na tela e pela exportação: os filtros
+    de dono, curso e ano são interseções no índice de facetas, `tags` (chaves
+    normalizadas, ver vitrine.tags) exige todas as tags informadas e a busca
+    textual vem do índice invertido. Sem `ordenar_por` (um critério de
+    vitrine.ordenacao), a ordem é a de relevância com busca e a de cadastro
+    sem ela; com ele, a ordem sai das listas pré-ordenadas do índice. O
+    resultado fica no cache de consultas; depois de poucas alterações de
+    TCC ele é remendado com elas (ver _remendar_ids), então editar um TCC
+    não obriga a refazer a lista inteira. A página é só uma fatia dele.
+    """
+    tags = tuple(sorted(set(tags))) if tags else None
+    # A busca entra na chave já tokenizada: "Avaliação " e "avaliacao" são a mesma consulta; sem
+    # termos (vazia ou só stopwords) ela não filtra nada
+    termos = tuple(tokenizar(busca)) if busca else ()
+    if not termos:
+        busca = None
+    argumentos = (usuario_id, excluir_usuario_id, curso, ano, busca, tags, ordenar_por, decrescente)
+    if not usar_cache:
+        return _calcular_ids(armazenamento, *argumentos)
+
+    # Traz as escritas de outros processos antes de ler a versão
+    armazenamento.sincronizar()
+    consulta = (usuario_id, excluir_usuario_id, curso, ano, termos or None, tags, ordenar_por, bool(ordenar_por and decrescente))
+    return obter_cache_consultas(armazenamento).obter_versionado(
+        armazenamento.versao,
+        consulta,
+        lambda: _calcular_ids(armazenamento, *argumentos),
+        lambda ids, eventos: _remendar_ids(armazenamento, ids, argumentos, eventos),
+    )
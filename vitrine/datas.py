@@ -0,0 +1,20 @@
+import datetime
+
+# Datas são gravadas como texto ISO 8601 ("2025-03-14T09:26:53"), que ordena cronologicamente;
+# os formatos abaixo são só para exibição
+FORMATO_DATA = "%d/%m/%Y"
+FORMATO_DATA_HORA = "%d/%m/%Y %H:%M"
+
+
+def agora_iso():
+    """Data e hora atuais no formato gravado no banco"""
+    return datetime.datetime.now().isoformat(timespec="seconds")
+
+
+def formatar_data(valor, com_hora=False):
+    """Formata uma data gravada no banco para exibição ("2025-03-14T09:26:53" -> "14/03/2025")"""
+    try:
+        data = datetime.datetime.fromisoformat(valor)
+    except (TypeError, ValueError):
+        return valor or ""
+    return data.strftime(FORMATO_DATA_HORA if com_hora else FORMATO_DATA)
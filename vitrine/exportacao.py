@@ -0,0 +1,144 @@
+import csv
+import io
+import json
+import os
+import secrets
+import time
+
+from vitrine.armazenamento import CAMPOS_TCC, COLUNAS_TCC, DIRETORIO_RAIZ
+
+# Os arquivos ficam na pasta static/ do app, servida direto do disco pelo Streamlit
+# (server.enableStaticServing em .streamlit/config.toml), sem passar pela sessão
+DIRETORIO_EXPORTACOES = os.path.join(DIRETORIO_RAIZ, "static", "exportacoes")
+URL_EXPORTACOES = "app/static/exportacoes"
+# Arquivos exportados mais antigos que isso são apagados na exportação seguinte
+VALIDADE_EXPORTACAO_SEGUNDOS = 60 * 60
+
+FORMATOS_EXPORTACAO = {"CSV": "csv", "JSONL": "jsonl", "Parquet": "parquet"}
+TAMANHO_BLOCO_EXPORTACAO = 1000
+
+
+def gerar_registros(armazenamento, ids, tamanho_bloco=TAMANHO_BLOCO_EXPORTACAO, colunas=COLUNAS_TCC):
+    """Gera os TCCs dos IDs informados (com as `colunas` pedidas), lendo o banco um bloco por vez"""
+    for inicio in range(0, len(ids), tamanho_bloco):
+        bloco = ids[inicio:inicio + tamanho_bloco]
+        por_id = {tcc["id"]: tcc for tcc in armazenamento.listar_tccs(colunas, ids=bloco)}
+        for tcc_id in bloco:
+            if tcc_id in por_id:
+                yield por_id[tcc_id]
+
+
+def _em_blocos(registros, tamanho_bloco=TAMANHO_BLOCO_EXPORTACAO):
+    bloco = []
+    for registro in registros:
+        bloco.append(registro)
+        if len(bloco) >= tamanho_bloco:
+            yield bloco
+            bloco = []
+    if bloco:
+        yield bloco
+
+
+def gerar_csv(registros):
+    """Gera o CSV em pedaços de bytes (com BOM, para o Excel reconhecer o UTF-8)"""
+    buffer = io.StringIO()
+    escritor = csv.DictWriter(buffer, fieldnames=CAMPOS_TCC, extrasaction="ignore")
+    escritor.writeheader()
+    yield ("﻿" + buffer.getvalue()).encode("utf-8")
+    for bloco in _em_blocos(registros):
+        buffer.seek(0)
+        buffer.truncate()
+        escritor.writerows(bloco)
+        yield buffer.getvalue().encode("utf-8")
+
+
+def gerar_jsonl(registros):
+    """Gera o JSON Lines em pedaços de bytes"""
+    for bloco in _em_blocos(registros):
+        linhas = (json.dumps({campo: tcc.get(campo) for campo in CAMPOS_TCC}, ensure_ascii=False) for tcc in bloco)
+        yield ("\n".join(linhas) + "\n").encode("utf-8")
+
+
+class _SaidaEmPedacos:
+    """Destino de escrita que só acumula até ser drenado (usado pelo escritor Parquet)"""
+
+    closed = False
+
+    def __init__(self):
+        self._pedacos = []
+        self._posicao = 0
+
+    def write(self, dados):
+        self._pedacos.append(bytes(dados))
+        self._posicao += len(dados)
+        return len(dados)
+
+    def tell(self):
+        return self._posicao
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drenar(self):
+        dados = b"".join(self._pedacos)
+        self._pedacos.clear()
+        return dados
+
+
+def gerar_parquet(registros):
+    """Gera o Parquet em pedaços de bytes, um grupo de linhas por bloco de registros"""
+    # pyarrow já vem com o Streamlit, mas só é carregado quando alguém exporta Parquet
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    esquema = pa.schema([(campo, pa.int64() if campo in ("id", "ano") else pa.string()) for campo in CAMPOS_TCC])
+    saida = _SaidaEmPedacos()
+    escritor = pq.ParquetWriter(pa.PythonFile(saida, mode="w"), esquema, compression="zstd")
+    for bloco in _em_blocos(registros):
+        colunas = {campo: [tcc.get(campo) for tcc in bloco] for campo in CAMPOS_TCC}
+        escritor.write_table(pa.Table.from_pydict(colunas, schema=esquema))
+        yield saida.drenar()
+    escritor.close()
+    yield saida.drenar()
+
+
+GERADORES = {"csv": gerar_csv, "jsonl": gerar_jsonl, "parquet": gerar_parquet}
+
+
+def limpar_exportacoes_antigas(agora=None):
+    """Apaga os arquivos exportados que já passaram da validade"""
+    if not os.path.isdir(DIRETORIO_EXPORTACOES):
+        return
+    limite = (agora or time.time()) - VALIDADE_EXPORTACAO_SEGUNDOS
+    for nome in os.listdir(DIRETORIO_EXPORTACOES):
+        caminho = os.path.join(DIRETORIO_EXPORTACOES, nome)
+        try:
+            if os.path.getmtime(caminho) < limite:
+                os.remove(caminho)
+        except OSError:
+            pass
+
+
+def exportar_para_arquivo(armazenamento, ids, formato):
+    """Grava a exportação em disco, pedaço por pedaço, e retorna o nome do arquivo.
+
+    O nome leva um token aleatório, já que a pasta é servida publicamente.
+    O arquivo só aparece com o nome final quando está completo.
+    """
+    limpar_exportacoes_antigas()
+    os.makedirs(DIRETORIO_EXPORTACOES, exist_ok=True)
+    nome = f"tccs-{secrets.token_urlsafe(16)}.{formato}"
+    caminho = os.path.join(DIRETORIO_EXPORTACOES, nome)
+    temporario = caminho + ".parcial"
+    try:
+        with open(temporario, "wb") as arquivo:
+            for pedaco in GERADORES[formato](gerar_registros(armazenamento, ids)):
+                arquivo.write(pedaco)
+        os.replace(temporario, caminho)
+    finally:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+    return nome
@@ -0,0 +1,97 @@
+import threading
+
+# Campos usados como filtro na listagem de TCCs
+CAMPOS_FACETA = ("curso", "ano", "usuario_id")
+
+
+class IndiceFacetas:
+    """Índice em memória de curso, ano e dono de cada TCC.
+
+    Para cada campo guarda valor -> conjunto de IDs, então as opções dos
+    filtros, as contagens e as estatísticas saem direto do índice e os
+    filtros viram interseções de conjuntos. É atualizado a cada escrita
+    pelo armazenamento (ver Armazenamento.obter_indice).
+    """
+
+    def __init__(self):
+        self._ids = set()
+        self._facetas = {campo: {} for campo in CAMPOS_FACETA}
+        self._valores_doc = {}     # tcc_id -> valores de cada campo
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._ids)
+
+    def adicionar(self, tcc):
+        """Indexa (ou reindexa) um TCC"""
+        with self._lock:
+            tcc_id = tcc["id"]
+            if tcc_id in self._ids:
+                self.remover(tcc_id)
+            valores = tuple(tcc.get(campo) for campo in CAMPOS_FACETA)
+            for campo, valor in zip(CAMPOS_FACETA, valores):
+                self._facetas[campo].setdefault(valor, set()).add(tcc_id)
+            self._valores_doc[tcc_id] = valores
+            self._ids.add(tcc_id)
+
+    def remover(self, tcc_id):
+        """Remove um TCC do índice (não faz nada se ele não estiver indexado)"""
+        with self._lock:
+            valores = self._valores_doc.pop(tcc_id, None)
+            if valores is None:
+                return
+            for campo, valor in zip(CAMPOS_FACETA, valores):
+                ids = self._facetas[campo][valor]
+                ids.discard(tcc_id)
+                if not ids:
+                    del self._facetas[campo][valor]
+            self._ids.discard(tcc_id)
+
+    def aplicar_evento(self, evento, tcc):
+        """Mantém o índice em dia com uma escrita do armazenamento"""
+        if evento == "excluido":
+            self.remover(tcc["id"])
+        else:
+            self.adicionar(tcc)
+
+    def contagens(self, campo):
+        """Retorna {valor: quantidade de TCCs} para o campo"""
+        with self._lock:
+            return {valor: len(ids) for valor, ids in self._facetas[campo].items()}
+
+    def filtrar(self, usuario_id=None, excluir_usuario_id=None, curso=None, ano=None):
+        """Retorna o conjunto de IDs que passam em todos os filtros informados"""
+        with self._lock:
+            conjuntos = []
+            if usuario_id is not None:
+                conjuntos.append(self._facetas["usuario_id"].get(usuario_id, set()))
+            if curso is not None:
+                conjuntos.append(self._facetas["curso"].get(curso, set()))
+            if ano is not None:
+                conjuntos.append(self._facetas["ano"].get(ano, set()))
+
+            if conjuntos:
+                conjuntos.sort(key=len)
+                resultado = conjuntos[0].intersection(*conjuntos[1:])
+            else:
+                resultado = set(self._ids)
+
+            if excluir_usuario_id is not None:
+                resultado -= self._facetas["usuario_id"].get(excluir_usuario_id, set())
+            return resultado
+
+    def estatisticas(self, usuario_id=None):
+        """Retorna total de TCCs, ano mais recente, cursos únicos e TCCs do usuário"""
+        with self._lock:
+            anos = self._facetas["ano"]
+            return {
+                "total": len(self._ids),
+                "ano_mais_recente": max(anos) if anos else None,
+                "cursos_unicos": len(self._facetas["curso"]),
+                "meus_tccs": len(self._facetas["usuario_id"].get(usuario_id, ())),
+            }
+
+
+def obter_indice_facetas(armazenamento):
+    """Retorna o índice de facetas ligado ao armazenamento, montando-o na primeira chamada"""
+    return armazenamento.obter_indice("facetas", IndiceFacetas)
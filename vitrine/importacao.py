@@ -0,0 +1,259 @@
+"""Importação em lote de TCCs a partir de arquivos CSV ou JSONL.
+
+Uso pela linha de comando:
+
+    python -m vitrine.importacao catalogo.csv --usuario ana
+    python -m vitrine.importacao catalogo.jsonl --usuario ana --lote 1000
+
+O arquivo é lido linha a linha (nunca inteiro em memória), cada registro
+passa pelas mesmas regras do formulário de cadastro e os válidos são
+gravados em transações de `lote` registros. Registros com problema (linha
+de CSV ou JSON inválida, campo que não é texto nem número, erro ao gravar)
+entram no resumo de erros com o número do registro, sem interromper os
+demais. O texto deve estar em UTF-8; linhas que não estiverem são lidas
+como Windows-1252 (o Latin-1 do Excel).
+"""
+import argparse
+import codecs
+import csv
+import itertools
+import json
+import os
+import sqlite3
+import sys
+import time
+
+from vitrine.armazenamento import obter_armazenamento
+from vitrine.validacao import validar_tcc
+from vitrine.vocabulario import obter_indice_vocabulario
+
+CAMPOS_IMPORTACAO = (
+    "titulo", "autor", "curso", "ano", "orientador", "resumo", "palavras_chave", "instituicao",
+)
+TAMANHO_LOTE_PADRAO = 500
+# Quantos erros guardar com detalhes; os demais só entram na contagem
+MAX_ERROS_DETALHADOS = 1000
+
+
+def ler_csv(arquivo):
+    """Gera um dicionário por linha de um CSV (separador , ; ou tab detectado pelo cabeçalho)"""
+    cabecalho = arquivo.readline()
+    if not cabecalho:
+        return
+    try:
+        dialeto = csv.Sniffer().sniff(cabecalho, delimiters=",;\t")
+    except csv.Error:
+        dialeto = csv.excel
+    leitor = csv.DictReader(itertools.chain([cabecalho], arquivo), dialect=dialeto)
+    while True:
+        # Uma linha malformada vira um registro com erro, e a leitura segue na próxima
+        try:
+            registro = next(leitor)
+        except StopIteration:
+            return
+        except csv.Error as erro:
+            registro = {"_erro": f"CSV inválido: {erro}"}
+        yield registro
+
+
+def ler_jsonl(arquivo):
+    """Gera um dicionário por linha de um arquivo JSON Lines (linhas em branco são ignoradas)"""
+    for linha in arquivo:
+        linha = linha.strip()
+        if not linha:
+            continue
+        try:
+            registro = json.loads(linha)
+        except json.JSONDecodeError as erro:
+            registro = {"_erro": f"JSON inválido: {erro.msg}"}
+        if not isinstance(registro, dict):
+            registro = {"_erro": "Cada linha deve ser um objeto JSON"}
+        yield registro
+
+
+def ler_registros(arquivo, formato):
+    """Escolhe o leitor pelo formato ("csv" ou "jsonl")"""
+    if formato == "csv":
+        return ler_csv(arquivo)
+    if formato == "jsonl":
+        return ler_jsonl(arquivo)
+    raise ValueError(f"Formato não suportado: {formato}")
+
+
+def formato_do_arquivo(nome):
+    """Deduz o formato pela extensão do arquivo"""
+    extensao = os.path.splitext(nome)[1].lower()
+    return "jsonl" if extensao in (".jsonl", ".ndjson") else "csv"
+
+
+class TextoPorLinha:
+    """Leitura de texto linha a linha de um arquivo binário, em UTF-8 (com ou sem BOM).
+
+    Linhas que não são UTF-8 válido são lidas como Windows-1252 (e, nos
+    poucos bytes que ele não define, Latin-1), em vez de interromper a
+    importação; `linhas_convertidas` conta quantas foram. Não fecha o
+    arquivo binário (o upload do Streamlit continua dele).
+    """
+
+    def __init__(self, arquivo_binario):
+        self._arquivo = arquivo_binario
+        self._inicio = True
+        self.linhas_convertidas = 0
+
+    def readline(self):
+        linha = self._arquivo.readline()
+        if self._inicio:
+            self._inicio = False
+            if linha.startswith(codecs.BOM_UTF8):
+                linha = linha[len(codecs.BOM_UTF8):]
+        try:
+            return linha.decode("utf-8")
+        except UnicodeDecodeError:
+            self.linhas_convertidas += 1
+        try:
+            return linha.decode("cp1252")
+        except UnicodeDecodeError:
+            return linha.decode("latin-1")
+
+    def __iter__(self):
+        return iter(self.readline, "")
+
+
+def abrir_texto(arquivo_binario):
+    """Envolve um arquivo binário (ex.: upload do Streamlit) para leitura de texto linha a linha"""
+    return TextoPorLinha(arquivo_binario)
+
+
+def preparar_tcc(registro):
+    """Limpa um registro lido do arquivo e converte o ano para inteiro (e números em outros campos para texto)"""
+    tcc = {}
+    for campo in CAMPOS_IMPORTACAO:
+        valor = registro.get(campo)
+        if campo == "palavras_chave" and isinstance(valor, list) and all(isinstance(item, str) for item in valor):
+            valor = ", ".join(valor)
+        elif campo != "ano" and isinstance(valor, (int, float)) and not isinstance(valor, bool):
+            valor = str(valor)
+        tcc[campo] = valor.strip() if isinstance(valor, str) else valor
+    ano = tcc.get("ano")
+    if isinstance(ano, str):
+        try:
+            tcc["ano"] = int(ano)
+        except ValueError:
+            pass
+    elif isinstance(ano, float) and ano.is_integer():
+        tcc["ano"] = int(ano)
+    return tcc
+
+
+def campos_invalidos(tcc):
+    """Erros dos campos que não são texto nem número (ex.: listas ou objetos num JSON)"""
+    return [f"O campo {campo} deve ser texto ou número" for campo, valor in tcc.items()
+            if valor is not None and (isinstance(valor, bool) or not isinstance(valor, (str, int, float)))]
+
+
+def importar_tccs(armazenamento, registros, usuario_id, usuario_cadastro,
+                  tamanho_lote=TAMANHO_LOTE_PADRAO, ao_progresso=None):
+    """Valida e grava os registros em lotes.
+
+    `registros` pode ser qualquer iterável (de preferência um gerador, como
+    os de ler_registros). ao_progresso(resultado), se informado, é chamado
+    após cada lote gravado. Retorna um dicionário com as contagens, os
+    erros por registro [(número do registro, mensagens)] e o tempo gasto.
+    Curso, instituição e orientador que forem variantes de valores já
+    cadastrados são gravados com o nome canônico (ver vitrine.vocabulario).
+    """
+    resultado = {"linhas": 0, "importados": 0, "com_erro": 0, "erros": [], "segundos": 0.0}
+    inicio = time.perf_counter()
+    vocabulario = obter_indice_vocabulario(armazenamento)
+    lote = []
+    numeros = []    # número do registro de cada TCC do lote, para o resumo de erros
+
+    def registrar_erros(numero, erros):
+        resultado["com_erro"] += 1
+        if len(resultado["erros"]) < MAX_ERROS_DETALHADOS:
+            resultado["erros"].append((numero, erros))
+
+    def gravar_lote():
+        try:
+            armazenamento.inserir_tccs(lote)
+            resultado["importados"] += len(lote)
+        except sqlite3.Error:
+            # A transação do lote foi desfeita: grava um a um para saber quais registros falham
+            for numero, tcc in zip(numeros, lote):
+                try:
+                    armazenamento.inserir_tcc(tcc)
+                    resultado["importados"] += 1
+                except sqlite3.Error as erro:
+                    registrar_erros(numero, [f"Erro ao gravar: {erro}"])
+        resultado["segundos"] = time.perf_counter() - inicio
+        lote.clear()
+        numeros.clear()
+        if ao_progresso:
+            ao_progresso(resultado)
+
+    for numero, registro in enumerate(registros, start=1):
+        resultado["linhas"] = numero
+        tcc = preparar_tcc(registro)
+        erros = [registro["_erro"]] if "_erro" in registro else campos_invalidos(tcc) or validar_tcc(tcc)
+        if erros:
+            registrar_erros(numero, erros)
+            continue
+
+        vocabulario.canonizar(tcc)
+        tcc["usuario_cadastro"] = usuario_cadastro
+        tcc["usuario_id"] = usuario_id
+        lote.append(tcc)
+        numeros.append(numero)
+        if len(lote) >= tamanho_lote:
+            gravar_lote()
+
+    if lote:
+        gravar_lote()
+    resultado["segundos"] = time.perf_counter() - inicio
+    return resultado
+
+
+def main(argv=None):
+    """Ponto de entrada da linha de comando"""
+    parser = argparse.ArgumentParser(description="Importa TCCs de um arquivo CSV ou JSONL")
+    parser.add_argument("arquivo", help="caminho do arquivo .csv ou .jsonl")
+    parser.add_argument("--usuario", required=True, help="usuário que ficará como dono dos TCCs")
+    parser.add_argument("--formato", choices=["csv", "jsonl"], help="padrão: deduzido pela extensão")
+    parser.add_argument("--lote", type=int, default=TAMANHO_LOTE_PADRAO, help="registros por transação")
+    args = parser.parse_args(argv)
+
+    armazenamento = obter_armazenamento()
+    dono = armazenamento.obter_usuario(args.usuario)
+    if dono is None:
+        parser.error(f"usuário '{args.usuario}' não encontrado")
+
+    def mostrar_progresso(resultado):
+        taxa = resultado["linhas"] / resultado["segundos"] if resultado["segundos"] else 0
+        print(f"\r{resultado['importados']} importados, {resultado['com_erro']} com erro "
+              f"({taxa:,.0f} linhas/s)", end="", file=sys.stderr)
+
+    formato = args.formato or formato_do_arquivo(args.arquivo)
+    with open(args.arquivo, "rb") as arquivo:
+        texto = abrir_texto(arquivo)
+        resultado = importar_tccs(
+            armazenamento,
+            ler_registros(texto, formato),
+            usuario_id=dono["usuario"],
+            usuario_cadastro=dono["nome_completo"],
+            tamanho_lote=args.lote,
+            ao_progresso=mostrar_progresso,
+        )
+    print(file=sys.stderr)
+
+    for numero, erros in resultado["erros"]:
+        print(f"registro {numero}: {'; '.join(erros)}", file=sys.stderr)
+    if texto.linhas_convertidas:
+        print(f"{texto.linhas_convertidas} linha(s) não estavam em UTF-8 e foram lidas como Windows-1252",
+              file=sys.stderr)
+    print(f"{resultado['importados']} de {resultado['linhas']} registros importados "
+          f"em {resultado['segundos']:.1f}s ({resultado['com_erro']} com erro)")
+    return 1 if resultado["com_erro"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+import bisect
+import threading
+
+from vitrine.busca import normalizar
+
+# Critérios de ordenação da lista e a chave de cada TCC em cada um. Título e autor
+# comparam sem acentos e sem maiúsculas ("Ética" fica junto de "estudo", não depois de "Z")
+CHAVES_ORDENACAO = {
+    "ano": lambda tcc: tcc.get("ano") or 0,
+    "titulo": lambda tcc: normalizar(tcc.get("titulo")),
+    "autor": lambda tcc: normalizar(tcc.get("autor")),
+    "cadastro": lambda tcc: tcc.get("data_cadastro") or "",
+}
+# Acima de quantas inclusões pendentes vale mais reordenar a lista inteira do que inserir uma a uma
+LIMITE_INSERCOES = 64
+
+
+class IndiceOrdenacao:
+    """Listas de (chave, tcc_id) já ordenadas por cada critério de CHAVES_ORDENACAO.
+
+    Inclusões ficam pendentes e entram nas listas na próxima consulta: uma
+    a uma por busca binária, ou todas de uma vez quando são muitas (ex.: a
+    carga inicial ou uma importação em lote). Exclusões saem por busca
+    binária. Assim ordenar um resultado não exige reordenar o catálogo.
+    """
+
+    def __init__(self):
+        self._listas = {criterio: [] for criterio in CHAVES_ORDENACAO}
+        self._chaves = {}          # tcc_id -> chave em cada critério
+        self._pendentes = set()    # IDs com chave calculada que ainda não entraram nas listas
+        self._ordens = {}          # critério -> só os IDs da lista, refeito na primeira consulta após uma escrita
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._chaves)
+
+    def adicionar(self, tcc):
+        """Inclui (ou reposiciona) um TCC"""
+        with self._lock:
+            tcc_id = tcc["id"]
+            self.remover(tcc_id)
+            self._chaves[tcc_id] = {criterio: chave(tcc) for criterio, chave in CHAVES_ORDENACAO.items()}
+            self._pendentes.add(tcc_id)
+
+    def remover(self, tcc_id):
+        """Remove um TCC das listas (não faz nada se ele não estiver lá)"""
+        with self._lock:
+            chaves = self._chaves.pop(tcc_id, None)
+            if chaves is None:
+                return
+            if tcc_id in self._pendentes:
+                self._pendentes.discard(tcc_id)
+                return
+            for criterio, lista in self._listas.items():
+                item = (chaves[criterio], tcc_id)
+                del lista[bisect.bisect_left(lista, item)]
+            self._ordens.clear()
+
+    def aplicar_evento(self, evento, tcc):
+        """Mantém as listas em dia com uma escrita do armazenamento"""
+        if evento == "excluido":
+            self.remover(tcc["id"])
+        else:
+            self.adicionar(tcc)
+
+    def chave(self, tcc_id, criterio):
+        """Chave do TCC no critério (None se ele não estiver no índice)"""
+        chaves = self._chaves.get(tcc_id)
+        return chaves[criterio] if chaves else None
+
+    def _consolidar(self):
+        if not self._pendentes:
+            return
+        for criterio, lista in self._listas.items():
+            novos = [(self._chaves[tcc_id][criterio], tcc_id) for tcc_id in self._pendentes]
+            if len(novos) > LIMITE_INSERCOES:
+                lista.extend(novos)
+                lista.sort()
+            else:
+                for item in novos:
+                    bisect.insort(lista, item)
+        self._pendentes.clear()
+        self._ordens.clear()
+
+    def ordenar(self, ids, criterio, decrescente=False):
+        """Retorna a lista dos `ids` na ordem do critério (empates pelo ID).
+
+        Resultados grandes são lidos da lista já ordenada, filtrando quem
+        não está em `ids`; pequenos são ordenados direto pela chave guardada.
+        """
+        with self._lock:
+            self._consolidar()
+            ordem = self._ordens.get(criterio)
+            if ordem is None:
+                ordem = self._ordens[criterio] = [tcc_id for _, tcc_id in self._listas[criterio]]
+            if len(ids) * 8 > len(ordem):
+                selecionados = ids if isinstance(ids, (set, frozenset)) else set(ids)
+                ordenados = list(filter(selecionados.__contains__, ordem))
+            else:
+                chaves = self._chaves
+                ordenados = sorted(
+                    (tcc_id for tcc_id in ids if tcc_id in chaves),
+                    key=lambda tcc_id: (chaves[tcc_id][criterio], tcc_id),
+                )
+        if decrescente:
+            ordenados.reverse()
+        return ordenados
+
+
+def obter_indice_ordenacao(armazenamento):
+    """Retorna o índice de ordenação ligado ao armazenamento, montando-o na primeira chamada"""
+    return armazenamento.obter_indice("ordenacao", IndiceOrdenacao)
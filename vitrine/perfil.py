@@ -0,0 +1,144 @@
+import contextlib
+import cProfile
+import functools
+import io
+import json
+import marshal
+import os
+import pstats
+import threading
+import time
+from collections import deque
+
+# Quantas medições recentes de cada trecho entram no p50/p95
+JANELA_AMOSTRAS = 500
+# Quantas funções do cProfile mostrar no resumo em texto
+LINHAS_RESUMO_PERFIL = 30
+
+# Desligado por padrão: cada trecho custa só uma consulta a este dicionário
+_estado = {"ativo": os.environ.get("VITRINE_PERFIL") == "1"}
+_amostras = {}             # nome do trecho -> deque com as durações recentes (segundos)
+_lock = threading.Lock()
+# Cada sessão do Streamlit roda o script numa thread; a execução corrente fica por thread
+_local = threading.local()
+_NULO = contextlib.nullcontext()
+
+
+def ativo():
+    """Indica se a coleta de tempos está ligada"""
+    return _estado["ativo"]
+
+
+def definir_ativo(valor):
+    """Liga ou desliga a coleta de tempos para o processo inteiro"""
+    _estado["ativo"] = bool(valor)
+
+
+def limpar():
+    """Descarta as medições acumuladas"""
+    with _lock:
+        _amostras.clear()
+
+
+class _Trecho:
+    __slots__ = ("nome", "inicio", "trechos")
+
+    def __init__(self, nome):
+        self.nome = nome
+
+    def __enter__(self):
+        self.trechos = getattr(_local, "trechos", None)
+        if self.trechos is not None:
+            _local.profundidade += 1
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *excecao):
+        duracao = time.perf_counter() - self.inicio
+        with _lock:
+            amostras = _amostras.get(self.nome)
+            if amostras is None:
+                amostras = _amostras[self.nome] = deque(maxlen=JANELA_AMOSTRAS)
+            amostras.append(duracao)
+        if self.trechos is not None:
+            _local.profundidade -= 1
+            self.trechos.append({
+                "nome": self.nome,
+                "inicio_ms": (self.inicio - _local.inicio) * 1000,
+                "duracao_ms": duracao * 1000,
+                "profundidade": _local.profundidade,
+            })
+        return False
+
+
+def trecho(nome):
+    """Context manager que mede o bloco com o nome dado (não faz nada se a coleta estiver desligada)"""
+    if not _estado["ativo"]:
+        return _NULO
+    return _Trecho(nome)
+
+
+def cronometrado(nome):
+    """Decorador que mede cada chamada da função como um trecho"""
+    def decorador(funcao):
+        @functools.wraps(funcao)
+        def envolvida(*args, **kwargs):
+            if not _estado["ativo"]:
+                return funcao(*args, **kwargs)
+            with _Trecho(nome):
+                return funcao(*args, **kwargs)
+        return envolvida
+    return decorador
+
+
+@contextlib.contextmanager
+def execucao(perfilar=False):
+    """Agrupa os trechos de uma execução do script (um rerun).
+
+    Devolve um dicionário preenchido ao final do bloco, mesmo quando ele é
+    interrompido por st.rerun(): "trechos" (na ordem em que terminaram) e,
+    com perfilar=True, "perfil" (bytes no formato do cProfile/pstats) e
+    "perfil_texto" (as funções mais caras).
+    """
+    resultado = {"trechos": [], "perfil": None, "perfil_texto": None}
+    _local.trechos = resultado["trechos"] if _estado["ativo"] else None
+    _local.inicio = time.perf_counter()
+    _local.profundidade = 0
+    perfil = cProfile.Profile() if perfilar else None
+    try:
+        if perfil:
+            perfil.enable()
+        with trecho("rerun"):
+            yield resultado
+    finally:
+        if perfil:
+            perfil.disable()
+            perfil.create_stats()
+            resultado["perfil"] = marshal.dumps(perfil.stats)
+            texto = io.StringIO()
+            pstats.Stats(perfil, stream=texto).sort_stats("cumulative").print_stats(LINHAS_RESUMO_PERFIL)
+            resultado["perfil_texto"] = texto.getvalue()
+        _local.trechos = None
+
+
+def estatisticas():
+    """Retorna [{nome, amostras, p50_ms, p95_ms, ultimo_ms}] dos trechos, do maior p95 para o menor"""
+    with _lock:
+        copias = {nome: list(amostras) for nome, amostras in _amostras.items()}
+    linhas = []
+    for nome, duracoes in copias.items():
+        ordenadas = sorted(duracoes)
+        linhas.append({
+            "nome": nome,
+            "amostras": len(ordenadas),
+            "p50_ms": ordenadas[len(ordenadas) // 2] * 1000,
+            "p95_ms": ordenadas[min(len(ordenadas) - 1, int(len(ordenadas) * 0.95))] * 1000,
+            "ultimo_ms": duracoes[-1] * 1000,
+        })
+    linhas.sort(key=lambda linha: linha["p95_ms"], reverse=True)
+    return linhas
+
+
+def trechos_jsonl(trechos):
+    """Converte os trechos de uma execução em JSON Lines"""
+    return "".join(json.dumps(t, ensure_ascii=False) + "\n" for t in trechos)
@@ -0,0 +1,171 @@
+"""Processamento dos PDFs dos TCCs em segundo plano.
+
+Extrair o texto, contar as páginas e desenhar a miniatura da primeira
+página leva segundos, então nada disso roda na thread do Streamlit que
+atende o usuário. As tarefas ficam na tabela tarefas_pdf (pendente,
+executando, concluida, falhou); uma thread por processo as distribui para
+um pool de processos, e o resultado entra no catálogo e na busca pelos
+eventos de escrita do armazenamento.
+
+Também pode rodar sozinho, para esvaziar a fila sem o app no ar:
+
+    python -m vitrine.processamento
+"""
+import concurrent.futures
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+from vitrine.armazenamento import obter_armazenamento
+from vitrine.arquivos import caminho_miniatura, caminho_pdf
+
+PROCESSOS_PDF = int(os.environ.get("VITRINE_PROCESSOS_PDF", "2"))
+MAX_TENTATIVAS = 3
+# Espera antes de cada nova tentativa: 10 s, 20 s, ...
+ESPERA_NOVA_TENTATIVA = 10
+# Tarefas "executando" há mais tempo que isso são consideradas abandonadas e voltam para a fila
+TEMPO_MAXIMO_TAREFA = 10 * 60
+# De quanto em quanto tempo procurar tarefas criadas por outros processos
+INTERVALO_CONSULTA = 2.0
+# Só o início do texto vai para a busca: é onde ficam resumo, palavras-chave e introdução
+LIMITE_TEXTO_PDF = 20_000
+LARGURA_MINIATURA = 240
+
+_log = logging.getLogger(__name__)
+
+
+def processar_pdf(pdf_hash):
+    """Conta as páginas, extrai o início do texto e gera a miniatura (roda num processo do pool)"""
+    # Importado aqui: só os processos do pool precisam do pypdfium2
+    import pypdfium2
+
+    documento = pypdfium2.PdfDocument(caminho_pdf(pdf_hash))
+    try:
+        paginas = len(documento)
+        partes = []
+        tamanho = 0
+        for indice in range(paginas):
+            if tamanho >= LIMITE_TEXTO_PDF:
+                break
+            pagina = documento[indice]
+            texto_pagina = pagina.get_textpage()
+            texto = texto_pagina.get_text_range()
+            texto_pagina.close()
+            pagina.close()
+            partes.append(texto)
+            tamanho += len(texto)
+
+        # PDFs iguais compartilham a miniatura (mesmo hash)
+        miniatura = caminho_miniatura(pdf_hash)
+        if paginas and not os.path.exists(miniatura):
+            pagina = documento[0]
+            imagem = pagina.render(scale=LARGURA_MINIATURA / pagina.get_width()).to_pil()
+            pagina.close()
+            temporario = f"{miniatura}.{os.getpid()}.parcial"
+            imagem.save(temporario, format="PNG")
+            os.replace(temporario, miniatura)
+    finally:
+        documento.close()
+    return {"paginas": paginas, "texto": "\n".join(partes)[:LIMITE_TEXTO_PDF]}
+
+
+class ProcessadorPDFs:
+    """Consome a fila de tarefas de PDF com um pool de processos.
+
+    Uma thread de fundo pega uma tarefa por vez no banco (só quando há um
+    processo livre), entrega ao pool e, quando ele termina, grava o
+    resultado ou a falha. Falhas voltam para a fila até MAX_TENTATIVAS.
+    """
+
+    def __init__(self, armazenamento, processos=PROCESSOS_PDF):
+        self._armazenamento = armazenamento
+        self._processos = processos
+        self._pool = None
+        self._vagas = threading.Semaphore(processos)
+        self._acordar = threading.Event()
+        self._thread = threading.Thread(target=self._laco, name="processador-pdfs", daemon=True)
+        self._thread.start()
+
+    def acordar(self):
+        """Avisa que há tarefa nova na fila (sem esperar a próxima consulta periódica)"""
+        self._acordar.set()
+
+    def _executor(self):
+        if self._pool is None:
+            # spawn: fazer fork de um processo com as threads do Streamlit não é seguro
+            self._pool = concurrent.futures.ProcessPoolExecutor(
+                self._processos, mp_context=multiprocessing.get_context("spawn"))
+        return self._pool
+
+    def _laco(self):
+        while True:
+            self._vagas.acquire()
+            try:
+                tarefa = self._armazenamento.pegar_tarefa_pdf(TEMPO_MAXIMO_TAREFA)
+            except Exception:
+                _log.exception("Erro ao buscar tarefas de PDF")
+                tarefa = None
+            if tarefa is None:
+                self._vagas.release()
+                self._acordar.wait(INTERVALO_CONSULTA)
+                self._acordar.clear()
+                continue
+
+            try:
+                futuro = self._executor().submit(processar_pdf, tarefa["pdf_hash"])
+            except Exception as erro:
+                # Pool quebrado ou encerrado: a tarefa segue o caminho normal de falha
+                self._pool = None
+                futuro = concurrent.futures.Future()
+                futuro.set_exception(erro)
+            futuro.add_done_callback(lambda futuro, tarefa=tarefa: self._terminar(tarefa, futuro))
+
+    def _terminar(self, tarefa, futuro):
+        try:
+            try:
+                resultado = futuro.result()
+            except Exception as erro:
+                if isinstance(erro, BrokenProcessPool):
+                    # Um processo do pool morreu: o pool inteiro fica inutilizável e é recriado
+                    self._pool = None
+                mensagem = f"{type(erro).__name__}: {erro}"
+                _log.warning("Falha ao processar o PDF do TCC %s: %s", tarefa["tcc_id"], mensagem)
+                espera = ESPERA_NOVA_TENTATIVA * tarefa["tentativas"] if tarefa["tentativas"] < MAX_TENTATIVAS else None
+                self._armazenamento.falhar_tarefa_pdf(tarefa, mensagem, tentar_de_novo_em=espera)
+            else:
+                self._armazenamento.concluir_tarefa_pdf(tarefa, resultado["paginas"], resultado["texto"])
+        except Exception:
+            _log.exception("Erro ao gravar o resultado da tarefa de PDF %s", tarefa["id"])
+        finally:
+            self._vagas.release()
+            self._acordar.set()
+
+
+_processadores = {}
+_processadores_lock = threading.Lock()
+
+
+def obter_processador(armazenamento):
+    """Retorna o processador de PDFs ligado ao armazenamento, iniciando-o na primeira chamada"""
+    with _processadores_lock:
+        processador = _processadores.get(armazenamento)
+        if processador is None:
+            processador = _processadores[armazenamento] = ProcessadorPDFs(armazenamento)
+        return processador
+
+
+def main():
+    """Processa a fila até ser interrompido (Ctrl+C)"""
+    logging.basicConfig(level=logging.INFO)
+    obter_processador(obter_armazenamento())
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
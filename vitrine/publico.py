@@ -0,0 +1,359 @@
+"""Catálogo público: uma fotografia do acervo em HTML e JSON estáticos.
+
+Visitantes sem conta não abrem sessão do Streamlit: leem páginas já
+prontas em static/catalogo/, servidas direto do disco pelo servidor
+(server.enableStaticServing), como os PDFs. Uma thread de fundo gera a
+fotografia de novo depois das escritas de TCC, juntando as escritas de
+alguns segundos numa geração só.
+
+Cada geração fica numa pasta própria e só passa a valer quando está
+completa (static/catalogo/index.html aponta para ela). A anterior é
+mantida para quem estava navegando nela.
+
+Só o banco padrão publica em static/catalogo/ sozinho: com VITRINE_DB
+apontando para outro banco (benchmarks, testes) o gerador fica desligado,
+a não ser que VITRINE_CATALOGO_PUBLICO indique a pasta de destino (vazia
+ou "0" desliga sempre). Também pode rodar sozinho, para gerar a
+fotografia sem o app no ar:
+
+    python -m vitrine.publico
+    python -m vitrine.publico --diretorio /srv/catalogo
+"""
+import argparse
+import html
+import json
+import logging
+import math
+import os
+import posixpath
+import re
+import shutil
+import sys
+import threading
+import time
+from collections import defaultdict
+
+from vitrine.armazenamento import CAMINHO_PADRAO, DIRETORIO_RAIZ, obter_armazenamento
+from vitrine.arquivos import url_pdf
+from vitrine.datas import formatar_data
+
+# Pasta servida pelo Streamlit; VITRINE_CATALOGO_PUBLICO troca o destino do gerador (vazia ou "0" desliga)
+DIRETORIO_CATALOGO_PUBLICO = os.path.join(DIRETORIO_RAIZ, "static", "catalogo")
+VARIAVEL_CATALOGO_PUBLICO = "VITRINE_CATALOGO_PUBLICO"
+URL_CATALOGO_PUBLICO = "app/static/catalogo/index.html"
+TCCS_POR_PAGINA_PUBLICA = 50
+# Espera depois de uma escrita antes de gerar, para juntar as escritas seguintes (ex.: uma importação)
+ESPERA_GERACAO = 5.0
+# Quantas gerações ficam no disco (a atual e as anteriores, para quem estava navegando nelas)
+GERACOES_MANTIDAS = 2
+# Campos publicados (sem usuário nem texto do PDF) e os que entram na busca do catálogo público
+CAMPOS_PUBLICOS = ("id", "titulo", "autor", "curso", "ano", "orientador", "resumo", "palavras_chave",
+                   "instituicao", "data_cadastro", "pdf_hash")
+CAMPOS_BUSCA_PUBLICA = ("titulo", "autor", "orientador", "palavras_chave", "curso")
+# A busca é dividida em arquivos pelos 2 primeiros caracteres do termo: o navegador só baixa os que usa
+TAMANHO_PREFIXO_BUSCA = 2
+
+# Nome da pasta de uma geração: "<última alteração incluída>-<time_ns da geração>"
+_RE_GERACAO = re.compile(r"\d+-\d+")
+
+_log = logging.getLogger(__name__)
+
+_ESTILO = """
+body { font-family: system-ui, sans-serif; max-width: 60rem; margin: 0 auto; padding: 1rem; color: #222; }
+header { display: flex; flex-wrap: wrap; gap: 1rem; align-items: center; justify-content: space-between; }
+form input { padding: .4rem; width: 18rem; }
+article { border: 1px solid #ddd; border-radius: .5rem; padding: .75rem 1rem; margin: .75rem 0; }
+article h2 { font-size: 1.1rem; margin: 0 0 .3rem; }
+.meta { color: #555; font-size: .9rem; }
+nav.paginas { display: flex; gap: 1rem; justify-content: center; margin: 1.5rem 0; }
+"""
+
+# Mesma normalização de vitrine.busca.tokenizar, para a consulta bater com os termos do índice
+_SCRIPT_BUSCA = """
+const STOPWORDS = new Set(%(stopwords)s);
+const POR_PAGINA = %(por_pagina)d, PREFIXO = %(prefixo)d, LIMITE = 100;
+function tokenizar(texto) {
+  const normal = texto.normalize("NFKD").replace(/\\p{M}/gu, "").toLowerCase();
+  return (normal.match(/[\\p{L}\\p{N}_]+/gu) || []).filter(t => !STOPWORDS.has(t));
+}
+const arquivos = {};
+function carregar(caminho) {
+  if (!arquivos[caminho]) arquivos[caminho] = fetch(caminho).then(r => r.ok ? r.json() : null);
+  return arquivos[caminho];
+}
+async function posicoes(termo, prefixo) {
+  const parte = await carregar("busca/" + encodeURIComponent(termo.slice(0, PREFIXO)) + ".json");
+  if (!parte) return new Set();
+  const termos = prefixo ? Object.keys(parte).filter(t => t.startsWith(termo)) : [termo];
+  return new Set(termos.flatMap(t => parte[t] || []));
+}
+function escapar(texto) {
+  const div = document.createElement("div");
+  div.textContent = texto == null ? "" : String(texto);
+  return div.innerHTML;
+}
+async function buscar() {
+  const consulta = new URLSearchParams(location.search).get("q") || "";
+  document.getElementById("q").value = consulta;
+  const termos = tokenizar(consulta);
+  const saida = document.getElementById("resultados");
+  if (!termos.length) { saida.innerHTML = "<p>Digite um termo para buscar.</p>"; return; }
+  // O último termo vale como prefixo (quem ainda está digitando a palavra)
+  const conjuntos = await Promise.all(termos.map((t, i) => posicoes(t, i === termos.length - 1)));
+  conjuntos.sort((a, b) => a.size - b.size);
+  const achados = [...conjuntos[0]].filter(p => conjuntos.every(c => c.has(p))).sort((a, b) => a - b);
+  const itens = await Promise.all(achados.slice(0, LIMITE).map(async p => {
+    const pagina = Math.floor(p / POR_PAGINA) + 1;
+    const dados = await carregar("pagina-" + pagina + ".json");
+    return [pagina, dados[p %% POR_PAGINA]];
+  }));
+  saida.innerHTML = "<p>" + achados.length + " TCC(s) encontrado(s)" +
+    (achados.length > LIMITE ? " (mostrando os " + LIMITE + " mais recentes)" : "") + ".</p>" +
+    itens.map(([pagina, tcc]) =>
+      "<article><h2><a href='pagina-" + pagina + ".html#tcc-" + tcc.id + "'>" + escapar(tcc.titulo) + "</a></h2>" +
+      "<div class='meta'>" + escapar(tcc.autor) + " · " + escapar(tcc.curso) + " · " + tcc.ano + "</div></article>"
+    ).join("");
+}
+buscar();
+"""
+
+
+def _nome_pagina(numero, extensao="html"):
+    return f"pagina-{numero}.{extensao}"
+
+
+def _cabecalho(titulo):
+    # As páginas ficam em app/static/catalogo/<geração>/: subir 4 níveis volta para a raiz do app
+    return (
+        "<!DOCTYPE html><html lang='pt-BR'><head><meta charset='utf-8'>"
+        "<meta name='viewport' content='width=device-width, initial-scale=1'>"
+        f"<title>{html.escape(titulo)}</title><style>{_ESTILO}</style></head><body>"
+        "<header><h1><a href='pagina-1.html'>Vitrine Acadêmica de TCCs</a></h1>"
+        "<form action='busca.html'><input type='search' id='q' name='q' placeholder='Título, autor, orientador...'>"
+        " <button>Buscar</button></form><a href='../../../../'>Entrar</a></header>"
+    )
+
+
+def _cartao(tcc, url_base):
+    linhas = [f"<article id='tcc-{tcc['id']}'><h2>{html.escape(tcc['titulo'])}</h2>",
+              f"<div class='meta'>{html.escape(tcc['autor'])} · {html.escape(tcc['curso'])} · {tcc['ano']}"]
+    for rotulo, campo in (("Orientador", "orientador"), ("Instituição", "instituicao")):
+        if tcc.get(campo):
+            linhas.append(f" · {rotulo}: {html.escape(tcc[campo])}")
+    linhas.append("</div>")
+    if tcc.get("palavras_chave"):
+        linhas.append(f"<p><b>Palavras-chave:</b> {html.escape(tcc['palavras_chave'])}</p>")
+    linhas.append(f"<p>{html.escape(tcc['resumo'] or '')}</p>")
+    if tcc.get("pdf_hash"):
+        linhas.append(f"<p><a href='{posixpath.relpath(url_pdf(tcc['pdf_hash']), url_base)}'>Baixar PDF</a></p>")
+    linhas.append(f"<div class='meta'>Cadastrado em {formatar_data(tcc['data_cadastro'])}</div></article>")
+    return "".join(linhas)
+
+
+def _navegacao(numero, total_paginas):
+    links = []
+    if numero > 1:
+        links.append(f"<a href='{_nome_pagina(numero - 1)}'>← Anterior</a>")
+    links.append(f"<span>Página {numero} de {total_paginas}</span>")
+    if numero < total_paginas:
+        links.append(f"<a href='{_nome_pagina(numero + 1)}'>Próxima →</a>")
+    return f"<nav class='paginas'>{''.join(links)}</nav>"
+
+
+def _gravar(caminho, conteudo):
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        arquivo.write(conteudo)
+
+
+def _gravar_json(caminho, dados):
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(dados, arquivo, ensure_ascii=False, separators=(",", ":"))
+
+
+def gerar_catalogo_publico(armazenamento, diretorio=DIRETORIO_CATALOGO_PUBLICO, por_pagina=TCCS_POR_PAGINA_PUBLICA):
+    """Gera uma nova fotografia do catálogo público e a publica. Retorna o nome da geração.
+
+    Os TCCs saem dos mais recentes para os mais antigos, `por_pagina` por
+    página (HTML para ler e JSON para a busca). O índice de busca guarda,
+    para cada termo dos campos de CAMPOS_BUSCA_PUBLICA, as posições dos
+    TCCs na ordem das páginas.
+    """
+    # Importados aqui: só a geração (numa thread de fundo) precisa da busca e das consultas
+    from vitrine.busca import STOPWORDS, tokenizar
+    from vitrine.consultas import filtrar_ids
+    from vitrine.exportacao import gerar_registros
+
+    alteracao = armazenamento.ultima_alteracao()
+    ids = filtrar_ids(armazenamento, ordenar_por="cadastro", decrescente=True)
+    geracao = f"{alteracao}-{time.time_ns()}"
+    pasta = os.path.join(diretorio, geracao)
+    temporaria = pasta + ".parcial"
+    url_base = posixpath.join(posixpath.dirname(URL_CATALOGO_PUBLICO), geracao)
+    total_paginas = max(1, math.ceil(len(ids) / por_pagina))
+
+    os.makedirs(temporaria)
+    try:
+        postings = defaultdict(list)
+        registros = gerar_registros(armazenamento, ids, tamanho_bloco=por_pagina, colunas=CAMPOS_PUBLICOS)
+        posicao = 0
+        for numero in range(1, total_paginas + 1):
+            pagina = []
+            for tcc in registros:
+                pagina.append(tcc)
+                if len(pagina) == por_pagina:
+                    break
+            for tcc in pagina:
+                termos = set()
+                for campo in CAMPOS_BUSCA_PUBLICA:
+                    termos.update(tokenizar(tcc.get(campo)))
+                for termo in termos:
+                    postings[termo].append(posicao)
+                posicao += 1
+
+            _gravar_json(os.path.join(temporaria, _nome_pagina(numero, "json")), [
+                {**{campo: tcc[campo] for campo in CAMPOS_PUBLICOS if campo != "pdf_hash"},
+                 "pdf": posixpath.relpath(url_pdf(tcc["pdf_hash"]), url_base) if tcc["pdf_hash"] else None}
+                for tcc in pagina
+            ])
+            _gravar(os.path.join(temporaria, _nome_pagina(numero)), "".join([
+                _cabecalho(f"Vitrine Acadêmica de TCCs - página {numero}"),
+                f"<p>{len(ids)} TCC(s) no catálogo.</p>" if numero == 1 else "",
+                "".join(_cartao(tcc, url_base) for tcc in pagina) or "<p>Nenhum TCC cadastrado ainda.</p>",
+                _navegacao(numero, total_paginas),
+                "</body></html>",
+            ]))
+
+        # Índice de busca, um arquivo por prefixo
+        os.makedirs(os.path.join(temporaria, "busca"))
+        partes = defaultdict(dict)
+        for termo, posicoes in postings.items():
+            partes[termo[:TAMANHO_PREFIXO_BUSCA]][termo] = posicoes
+        for prefixo, parte in partes.items():
+            _gravar_json(os.path.join(temporaria, "busca", f"{prefixo}.json"), parte)
+        _gravar(os.path.join(temporaria, "busca.html"), "".join([
+            _cabecalho("Busca - Vitrine Acadêmica de TCCs"),
+            "<div id='resultados'><p>Buscando...</p></div><script>",
+            _SCRIPT_BUSCA % {"stopwords": json.dumps(sorted(STOPWORDS)), "por_pagina": por_pagina,
+                             "prefixo": TAMANHO_PREFIXO_BUSCA},
+            "</script></body></html>",
+        ]))
+        _gravar_json(os.path.join(temporaria, "geracao.json"),
+                     {"alteracao": alteracao, "tccs": len(ids), "paginas": total_paginas, "gerada_em": time.time()})
+        os.rename(temporaria, pasta)
+    except BaseException:
+        shutil.rmtree(temporaria, ignore_errors=True)
+        raise
+
+    # Publica: o index.html da raiz passa a apontar para a nova geração
+    indice = os.path.join(diretorio, "index.html")
+    _gravar(indice + ".parcial", (
+        "<!DOCTYPE html><html lang='pt-BR'><head><meta charset='utf-8'>"
+        f"<meta http-equiv='refresh' content='0; url={geracao}/pagina-1.html'>"
+        "<title>Vitrine Acadêmica de TCCs</title></head>"
+        f"<body><a href='{geracao}/pagina-1.html'>Abrir o catálogo</a></body></html>"
+    ))
+    os.replace(indice + ".parcial", indice)
+    _gravar_json(os.path.join(diretorio, "atual.json"), {"geracao": geracao, "alteracao": alteracao})
+    _apagar_geracoes_antigas(diretorio)
+    return geracao
+
+
+def _apagar_geracoes_antigas(diretorio):
+    # Só pastas com o nome de uma geração (<alteração>-<ns>); qualquer outra coisa na pasta fica como está
+    geracoes = sorted(
+        (nome for nome in os.listdir(diretorio)
+         if _RE_GERACAO.fullmatch(nome) and os.path.isdir(os.path.join(diretorio, nome))),
+        key=lambda nome: int(nome.split("-")[1]),
+    )
+    for nome in geracoes[:-GERACOES_MANTIDAS]:
+        shutil.rmtree(os.path.join(diretorio, nome), ignore_errors=True)
+
+
+def alteracao_publicada(diretorio=DIRETORIO_CATALOGO_PUBLICO):
+    """Última escrita de TCC refletida na fotografia publicada (None se ainda não há fotografia)"""
+    try:
+        with open(os.path.join(diretorio, "atual.json"), encoding="utf-8") as arquivo:
+            return json.load(arquivo)["alteracao"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+class GeradorCatalogoPublico:
+    """Mantém a fotografia do catálogo público em dia, gerando-a numa thread de fundo.
+
+    Escuta as escritas do armazenamento; depois de uma escrita, espera
+    ESPERA_GERACAO segundos (para juntar as seguintes) e gera de novo.
+    Na partida, só gera se a fotografia no disco estiver atrasada.
+    """
+
+    def __init__(self, armazenamento, diretorio=DIRETORIO_CATALOGO_PUBLICO):
+        self._armazenamento = armazenamento
+        self._diretorio = diretorio
+        self._pendente = threading.Event()
+        if alteracao_publicada(diretorio) != armazenamento.ultima_alteracao():
+            self._pendente.set()
+        armazenamento.registrar_ouvinte(lambda evento, tcc: self._pendente.set())
+        self._thread = threading.Thread(target=self._laco, name="catalogo-publico", daemon=True)
+        self._thread.start()
+
+    def _laco(self):
+        while True:
+            self._pendente.wait()
+            time.sleep(ESPERA_GERACAO)
+            self._pendente.clear()
+            try:
+                inicio = time.perf_counter()
+                geracao = gerar_catalogo_publico(self._armazenamento, self._diretorio)
+                _log.info("Catálogo público gerado (%s) em %.1f s", geracao, time.perf_counter() - inicio)
+            except Exception:
+                _log.exception("Erro ao gerar o catálogo público")
+
+
+def diretorio_catalogo_publico(caminho_banco):
+    """Pasta em que o gerador do banco `caminho_banco` publica a fotografia (None: gerador desligado)"""
+    destino = os.environ.get(VARIAVEL_CATALOGO_PUBLICO)
+    if destino is not None:
+        return os.path.abspath(destino) if destino.strip() not in ("", "0") else None
+    # Outro banco (temporário, de testes) não pode sobrescrever a fotografia do banco de verdade
+    if os.path.abspath(caminho_banco) == os.path.abspath(CAMINHO_PADRAO):
+        return DIRETORIO_CATALOGO_PUBLICO
+    return None
+
+
+def catalogo_publicado():
+    """Indica se há uma fotografia na pasta servida pelo Streamlit (para mostrar o link)"""
+    return os.path.exists(os.path.join(DIRETORIO_CATALOGO_PUBLICO, "index.html"))
+
+
+_geradores = {}
+_geradores_lock = threading.Lock()
+
+
+def obter_gerador_catalogo(armazenamento):
+    """Retorna o gerador do catálogo público ligado ao armazenamento, iniciando-o na primeira chamada.
+
+    Retorna None se o gerador estiver desligado para esse banco (ver diretorio_catalogo_publico).
+    """
+    with _geradores_lock:
+        if armazenamento not in _geradores:
+            diretorio = diretorio_catalogo_publico(armazenamento.caminho)
+            _geradores[armazenamento] = diretorio and GeradorCatalogoPublico(armazenamento, diretorio)
+        return _geradores[armazenamento]
+
+
+def main(argv=None):
+    """Ponto de entrada da linha de comando: gera a fotografia do catálogo público uma vez"""
+    parser = argparse.ArgumentParser(description="Gera o catálogo público em HTML estático")
+    parser.add_argument("--diretorio", help=f"pasta de destino (padrão: {DIRETORIO_CATALOGO_PUBLICO})")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    diretorio = os.path.abspath(args.diretorio) if args.diretorio else DIRETORIO_CATALOGO_PUBLICO
+    inicio = time.perf_counter()
+    geracao = gerar_catalogo_publico(obter_armazenamento(), diretorio)
+    print(f"Catálogo público gerado em {time.perf_counter() - inicio:.1f} s: {os.path.join(diretorio, geracao)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+import threading
+from collections.abc import Sequence
+
+# Campos com poucos valores distintos: cada valor é guardado uma única vez e compartilhado
+CAMPOS_INTERNADOS = ("curso", "orientador", "instituicao", "usuario_cadastro", "usuario_id")
+
+
+class RegistroTCC:
+    """Metadados de um TCC em memória, sem o dicionário por instância.
+
+    Não guarda o resumo nem o texto extraído do PDF (os campos mais
+    pesados): o resumo é lido do banco só para os cartões visíveis. Aceita
+    tcc["campo"] e tcc.get("campo") como um dicionário, para ser usado no
+    lugar dos dicts vindos do banco.
+    """
+
+    __slots__ = (
+        "id", "titulo", "autor", "curso", "ano", "orientador", "palavras_chave",
+        "instituicao", "data_cadastro", "usuario_cadastro", "usuario_id", "pdf_hash",
+        "pdf_paginas", "versao",
+    )
+
+    def __init__(self, **campos):
+        for campo in self.__slots__:
+            setattr(self, campo, campos.get(campo))
+
+    def __getitem__(self, campo):
+        try:
+            return getattr(self, campo)
+        except AttributeError:
+            raise KeyError(campo) from None
+
+    def get(self, campo, padrao=None):
+        valor = getattr(self, campo, None)
+        return padrao if valor is None else valor
+
+    def como_dict(self, **extras):
+        """Converte para dicionário, acrescentando campos extras (ex.: resumo)"""
+        dados = {campo: getattr(self, campo) for campo in self.__slots__}
+        dados.update(extras)
+        return dados
+
+    def __repr__(self):
+        return f"RegistroTCC(id={self.id!r}, titulo={self.titulo!r})"
+
+
+class VisaoTCCs(Sequence):
+    """Janela somente leitura sobre uma lista de IDs do catálogo.
+
+    Fatiar uma visão devolve outra visão sobre a mesma lista (sem copiar os
+    IDs) e os registros só são buscados quando acessados, então paginar o
+    resultado de um filtro não cria cópia nenhuma do catálogo.
+    """
+
+    __slots__ = ("_catalogo", "_ids", "_inicio", "_fim")
+
+    def __init__(self, catalogo, ids, inicio=0, fim=None):
+        self._catalogo = catalogo
+        self._ids = ids
+        self._inicio = inicio
+        self._fim = len(ids) if fim is None else fim
+
+    def __len__(self):
+        return max(0, self._fim - self._inicio)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            inicio, fim, passo = indice.indices(len(self))
+            if passo != 1:
+                raise ValueError("VisaoTCCs só aceita fatias contínuas")
+            return VisaoTCCs(self._catalogo, self._ids, self._inicio + inicio, self._inicio + max(inicio, fim))
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError(indice)
+        return self._catalogo.obter(self._ids[self._inicio + indice])
+
+    def __iter__(self):
+        obter = self._catalogo.obter
+        for posicao in range(self._inicio, self._fim):
+            registro = obter(self._ids[posicao])
+            if registro is not None:
+                yield registro
+
+    def ids(self):
+        """Retorna os IDs da janela"""
+        return self._ids[self._inicio:self._fim]
+
+
+class CatalogoCompacto:
+    """Catálogo em memória de todos os TCCs, compartilhado pelas sessões do processo.
+
+    Cada TCC vira um RegistroTCC com os textos repetidos (curso,
+    instituição, dono...) internados numa tabela única. Mantido em dia pelos
+    eventos de escrita do armazenamento (ver Armazenamento.obter_indice).
+    """
+
+    def __init__(self):
+        self._registros = {}       # tcc_id -> RegistroTCC
+        self._valores = {}         # tabela de internação: valor -> a instância compartilhada
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._registros)
+
+    def _internar(self, valor):
+        if valor is None:
+            return None
+        return self._valores.setdefault(valor, valor)
+
+    def adicionar(self, tcc):
+        """Inclui (ou substitui) um TCC no catálogo"""
+        campos = {campo: tcc.get(campo) for campo in RegistroTCC.__slots__}
+        with self._lock:
+            for campo in CAMPOS_INTERNADOS:
+                campos[campo] = self._internar(campos[campo])
+            self._registros[campos["id"]] = RegistroTCC(**campos)
+
+    def remover(self, tcc_id):
+        """Remove um TCC do catálogo (não faz nada se ele não estiver lá)"""
+        with self._lock:
+            self._registros.pop(tcc_id, None)
+
+    def aplicar_evento(self, evento, tcc):
+        """Mantém o catálogo em dia com uma escrita do armazenamento"""
+        if evento == "excluido":
+            self.remover(tcc["id"])
+        else:
+            self.adicionar(tcc)
+
+    def obter(self, tcc_id):
+        """Retorna o registro do TCC, ou None"""
+        return self._registros.get(tcc_id)
+
+    def visao(self, ids):
+        """Retorna uma VisaoTCCs sobre a lista de IDs (a lista não é copiada)"""
+        return VisaoTCCs(self, ids)
+
+
+def obter_catalogo(armazenamento):
+    """Retorna o catálogo compacto ligado ao armazenamento, montando-o na primeira chamada"""
+    return armazenamento.obter_indice("registros", CatalogoCompacto)
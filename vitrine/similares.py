@@ -0,0 +1,213 @@
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+
+from vitrine.busca import tokenizar
+
+# Campos que descrevem o assunto do trabalho e o peso de cada um na contagem de termos
+PESOS_SIMILARIDADE = {
+    "titulo": 2,
+    "palavras_chave": 2,
+    "resumo": 1,
+}
+# Espera antes de remontar a matriz, para juntar as escritas de uma importação em lote
+ESPERA_REMONTAGEM = 1.0
+# Quantas listas de relacionados guardar por matriz montada
+MAX_RELACIONADOS_EM_CACHE = 512
+
+
+class MatrizTfidf:
+    """Fotografia imutável da matriz TF-IDF, guardada por coluna (termo -> documentos).
+
+    Cada coluna lista as linhas (documentos) em que o termo aparece e o
+    peso TF-IDF dele em cada uma, com as linhas já normalizadas (norma L2
+    igual a 1). Assim a similaridade de cosseno de um documento com todos
+    os outros é uma soma das colunas dos termos dele.
+    """
+
+    def __init__(self, ids, idf, inicio_coluna, linhas, valores):
+        self.ids = ids                       # linha -> tcc_id
+        self.linha_de = {tcc_id: linha for linha, tcc_id in enumerate(ids.tolist())}
+        self.idf = idf                       # termo -> idf (termos criados depois ficam de fora)
+        self.inicio_coluna = inicio_coluna   # a coluna t ocupa linhas[inicio_coluna[t]:inicio_coluna[t + 1]]
+        self.linhas = linhas
+        self.valores = valores
+        self.relacionados = {}               # (tcc_id, limite) -> [(tcc_id, similaridade)]
+
+
+class IndiceSimilares:
+    """Índice de TCCs parecidos pelo título, palavras-chave e resumo.
+
+    Cada documento é guardado como vetor de termos (IDs do vocabulário e
+    frequências com escala logarítmica), atualizado a cada escrita. A
+    matriz TF-IDF usada nas consultas é remontada em segundo plano depois
+    das escritas; enquanto isso as consultas usam a matriz anterior, e um
+    TCC novo já pode ser consultado, vetorizado com o IDF dela.
+    """
+
+    def __init__(self):
+        self._vocabulario = {}     # termo -> coluna da matriz
+        self._docs = {}            # tcc_id -> (colunas, frequências) do documento
+        self._matriz = None
+        self._sujo = False
+        self._remontando = False
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._docs)
+
+    def _vetor(self, tcc):
+        termos = Counter()
+        for campo, peso in PESOS_SIMILARIDADE.items():
+            for termo in tokenizar(tcc.get(campo)):
+                termos[termo] += peso
+        colunas = np.fromiter(
+            (self._vocabulario.setdefault(termo, len(self._vocabulario)) for termo in termos),
+            dtype=np.int32, count=len(termos),
+        )
+        frequencias = 1 + np.log(np.fromiter(termos.values(), dtype=np.float32, count=len(termos)))
+        return colunas, frequencias
+
+    def adicionar(self, tcc):
+        """Guarda (ou substitui) o vetor de termos de um TCC"""
+        with self._lock:
+            self._docs[tcc["id"]] = self._vetor(tcc)
+            self._alterado(tcc["id"])
+
+    def remover(self, tcc_id):
+        """Remove um TCC do índice (não faz nada se ele não estiver lá)"""
+        with self._lock:
+            if self._docs.pop(tcc_id, None) is not None:
+                self._alterado(tcc_id)
+
+    def _alterado(self, tcc_id):
+        # As listas em cache valem até a matriz ser remontada; só as do próprio TCC (vetor novo) saem já
+        self._sujo = True
+        if self._matriz is not None:
+            for chave in list(self._matriz.relacionados):
+                if chave[0] == tcc_id:
+                    self._matriz.relacionados.pop(chave, None)
+
+    def aplicar_evento(self, evento, tcc):
+        """Mantém o índice em dia com uma escrita do armazenamento e agenda a remontagem da matriz"""
+        if evento == "excluido":
+            self.remover(tcc["id"])
+        else:
+            self.adicionar(tcc)
+        with self._lock:
+            if self._remontando:
+                return
+            self._remontando = True
+        threading.Thread(target=self._remontar_em_segundo_plano, name="vitrine-similares", daemon=True).start()
+
+    def _remontar_em_segundo_plano(self):
+        try:
+            while True:
+                time.sleep(ESPERA_REMONTAGEM)
+                self._remontar()
+                # Conferir e desligar num passo só: uma escrita que chegue depois disso inicia outra thread
+                with self._lock:
+                    if not self._sujo:
+                        self._remontando = False
+                        return
+        except BaseException:
+            with self._lock:
+                self._remontando = False
+            raise
+
+    def _remontar(self):
+        """Monta a matriz TF-IDF com os vetores atuais e troca a matriz usada nas consultas"""
+        with self._lock:
+            self._sujo = False
+            docs = list(self._docs.items())
+            total_termos = len(self._vocabulario)
+
+        ids = np.array([tcc_id for tcc_id, _ in docs], dtype=np.int64)
+        tamanhos = np.fromiter((len(colunas) for _, (colunas, _) in docs), dtype=np.int64, count=len(docs))
+        colunas = np.concatenate([c for _, (c, _) in docs]) if docs else np.zeros(0, np.int32)
+        valores = np.concatenate([f for _, (_, f) in docs]) if docs else np.zeros(0, np.float32)
+        linhas = np.repeat(np.arange(len(docs), dtype=np.int32), tamanhos)
+
+        # IDF suavizado: termos que aparecem em quase todos os documentos pesam perto de 1
+        frequencia_doc = np.bincount(colunas, minlength=total_termos)
+        idf = (np.log((1 + len(docs)) / (1 + frequencia_doc)) + 1).astype(np.float32)
+        valores = valores * idf[colunas]
+        normas = np.sqrt(np.bincount(linhas, weights=valores * valores, minlength=len(docs)))
+        valores = (valores / np.maximum(normas, 1e-12)[linhas]).astype(np.float32)
+
+        # Reordena por termo: a coluna de cada termo vira uma fatia contígua
+        ordem = np.argsort(colunas, kind="stable")
+        inicio_coluna = np.zeros(total_termos + 1, dtype=np.int64)
+        np.cumsum(frequencia_doc, out=inicio_coluna[1:])
+        self._matriz = MatrizTfidf(ids, idf, inicio_coluna, linhas[ordem], valores[ordem])
+
+    def _matriz_atual(self):
+        if self._matriz is None:
+            self._remontar()
+        return self._matriz
+
+    def relacionados(self, tcc_id, limite=5):
+        """Retorna [(tcc_id, similaridade)] dos TCCs mais parecidos, do mais ao menos parecido.
+
+        A similaridade é o cosseno entre os vetores TF-IDF (entre 0 e 1). O
+        próprio TCC e os que não têm nenhum termo em comum ficam de fora.
+        """
+        matriz = self._matriz_atual()
+        chave = (tcc_id, limite)
+        resultado = matriz.relacionados.get(chave)
+        if resultado is not None:
+            # Excluídos depois que a lista foi guardada ficam de fora
+            return [par for par in resultado if par[0] in self._docs]
+
+        vetor = self._docs.get(tcc_id)
+        if vetor is None:
+            return []
+        colunas, frequencias = vetor
+        conhecidas = colunas < len(matriz.idf)
+        colunas = colunas[conhecidas]
+        pesos = frequencias[conhecidas] * matriz.idf[colunas]
+        norma = np.sqrt(np.dot(pesos, pesos))
+        if not norma:
+            return []
+        pesos /= norma
+
+        # Junta as colunas dos termos do documento numa só lista de (linha, peso) e soma por linha
+        inicios = matriz.inicio_coluna[colunas]
+        tamanhos = matriz.inicio_coluna[colunas + 1] - inicios
+        deslocamentos = np.repeat(inicios - np.cumsum(tamanhos) + tamanhos, tamanhos)
+        posicoes = deslocamentos + np.arange(tamanhos.sum())
+        pontuacoes = np.bincount(
+            matriz.linhas[posicoes],
+            weights=matriz.valores[posicoes] * np.repeat(pesos, tamanhos),
+            minlength=len(matriz.ids),
+        )
+        propria = matriz.linha_de.get(tcc_id)
+        if propria is not None:
+            pontuacoes[propria] = 0
+
+        # Pega alguns a mais: TCCs excluídos depois da montagem da matriz são descartados
+        candidatos = min(len(pontuacoes), limite + 16)
+        if not candidatos:
+            return []
+        melhores = np.argpartition(-pontuacoes, candidatos - 1)[:candidatos]
+        melhores = melhores[np.argsort(-pontuacoes[melhores], kind="stable")]
+        resultado = []
+        for linha in melhores.tolist():
+            similaridade = float(pontuacoes[linha])
+            if similaridade <= 0 or len(resultado) == limite:
+                break
+            outro_id = int(matriz.ids[linha])
+            if outro_id in self._docs:
+                resultado.append((outro_id, min(similaridade, 1.0)))
+
+        if len(matriz.relacionados) >= MAX_RELACIONADOS_EM_CACHE:
+            matriz.relacionados.clear()
+        matriz.relacionados[chave] = resultado
+        return resultado
+
+
+def obter_indice_similares(armazenamento):
+    """Retorna o índice de similares ligado ao armazenamento, montando-o na primeira chamada"""
+    return armazenamento.obter_indice("similares", IndiceSimilares)
@@ -0,0 +1,141 @@
+import math
+import re
+import threading
+
+from vitrine.busca import normalizar
+
+# Siglas e traduções comuns que devem virar a mesma palavra-chave (chave normalizada -> nome canônico)
+SINONIMOS_TAGS = {
+    "ia": "Inteligência Artificial",
+    "ai": "Inteligência Artificial",
+    "artificial intelligence": "Inteligência Artificial",
+    "ml": "Aprendizado de Máquina",
+    "machine learning": "Aprendizado de Máquina",
+    "deep learning": "Aprendizado Profundo",
+    "ti": "Tecnologia da Informação",
+    "iot": "Internet das Coisas",
+    "internet of things": "Internet das Coisas",
+}
+# Quantas palavras-chave entram na nuvem
+TAMANHO_NUVEM = 40
+
+_RE_SEPARADOR = re.compile(r"[,;]")
+_RE_ESPACOS = re.compile(r"\s+")
+
+
+def normalizar_tag(nome):
+    """Chave de comparação de uma palavra-chave ("  Inteligência  artificial " -> "inteligencia artificial")"""
+    return _RE_ESPACOS.sub(" ", normalizar(nome)).strip()
+
+
+def extrair_tags(palavras_chave):
+    """Quebra o texto de palavras-chave em [(chave, nome)], sem repetições e na ordem digitada.
+
+    Aceita vírgula ou ponto e vírgula como separador. Siglas conhecidas
+    ("IA", "ML"...) viram o nome canônico (ver SINONIMOS_TAGS).
+    """
+    tags = {}
+    for parte in _RE_SEPARADOR.split(palavras_chave or ""):
+        nome = _RE_ESPACOS.sub(" ", parte).strip()
+        chave = normalizar_tag(nome)
+        if not chave:
+            continue
+        if chave in SINONIMOS_TAGS:
+            nome = SINONIMOS_TAGS[chave]
+            chave = normalizar_tag(nome)
+        tags.setdefault(chave, nome)
+    return list(tags.items())
+
+
+class IndiceTags:
+    """Índice em memória das palavras-chave: tag -> conjunto de IDs de TCC.
+
+    Cada tag é guardada pela chave normalizada, com o nome de exibição da
+    primeira vez em que apareceu, então "IA", "ia " e "Inteligência
+    Artificial" caem na mesma entrada. Filtrar por várias tags é uma
+    interseção de conjuntos, e a nuvem de tags fica calculada até a
+    próxima escrita.
+    """
+
+    def __init__(self):
+        self._postings = {}        # chave -> {tcc_id}
+        self._nomes = {}           # chave -> nome de exibição
+        self._tags_doc = {}        # tcc_id -> chaves do TCC
+        self._nuvem = None
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._postings)
+
+    def adicionar(self, tcc):
+        """Indexa (ou reindexa) as palavras-chave de um TCC"""
+        with self._lock:
+            tcc_id = tcc["id"]
+            self.remover(tcc_id)
+            tags = extrair_tags(tcc.get("palavras_chave"))
+            for chave, nome in tags:
+                self._postings.setdefault(chave, set()).add(tcc_id)
+                self._nomes.setdefault(chave, nome)
+            if tags:
+                self._tags_doc[tcc_id] = tuple(chave for chave, _ in tags)
+            self._nuvem = None
+
+    def remover(self, tcc_id):
+        """Remove um TCC do índice (não faz nada se ele não estiver indexado)"""
+        with self._lock:
+            for chave in self._tags_doc.pop(tcc_id, ()):
+                ids = self._postings[chave]
+                ids.discard(tcc_id)
+                if not ids:
+                    del self._postings[chave]
+                    del self._nomes[chave]
+            self._nuvem = None
+
+    def aplicar_evento(self, evento, tcc):
+        """Mantém o índice em dia com uma escrita do armazenamento"""
+        if evento == "excluido":
+            self.remover(tcc["id"])
+        else:
+            self.adicionar(tcc)
+
+    def nome(self, chave):
+        """Nome de exibição de uma tag (a própria chave se ela não existir mais)"""
+        return self._nomes.get(chave, chave)
+
+    def contagens(self):
+        """Retorna {chave: quantidade de TCCs} de todas as tags"""
+        with self._lock:
+            return {chave: len(ids) for chave, ids in self._postings.items()}
+
+    def filtrar(self, chaves):
+        """Retorna o conjunto de IDs dos TCCs que têm todas as tags informadas"""
+        with self._lock:
+            conjuntos = sorted((self._postings.get(chave, set()) for chave in chaves), key=len)
+            if not conjuntos:
+                return set()
+            return conjuntos[0].intersection(*conjuntos[1:])
+
+    def nuvem(self):
+        """Retorna [(chave, nome, quantidade, peso)] das tags mais usadas, em ordem alfabética.
+
+        O peso vai de 0 (menos usada da nuvem) a 1 (mais usada), em escala
+        logarítmica, para definir o tamanho da fonte.
+        """
+        with self._lock:
+            if self._nuvem is None:
+                mais_usadas = sorted(self._postings.items(), key=lambda item: (-len(item[1]), item[0]))
+                contagens = [(chave, len(ids)) for chave, ids in mais_usadas[:TAMANHO_NUVEM]]
+                if contagens:
+                    maximo = math.log(contagens[0][1])
+                    minimo = math.log(contagens[-1][1])
+                    faixa = (maximo - minimo) or 1
+                self._nuvem = sorted(
+                    (chave, self._nomes[chave], quantidade, (math.log(quantidade) - minimo) / faixa)
+                    for chave, quantidade in contagens
+                )
+            return self._nuvem
+
+
+def obter_indice_tags(armazenamento):
+    """Retorna o índice de tags ligado ao armazenamento, montando-o na primeira chamada"""
+    return armazenamento.obter_indice("tags", IndiceTags)
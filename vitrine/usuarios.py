@@ -0,0 +1,53 @@
+import os
+import threading
+import unicodedata
+
+
+def normalizar_usuario(usuario):
+    """Forma canônica do nome de usuário usada nas comparações ("  Ana " -> "ana")"""
+    return unicodedata.normalize("NFKC", usuario or "").strip().casefold()
+
+
+def normalizar_email(email):
+    """Forma canônica do e-mail usada nas comparações ("Ana@UFMS.br " -> "ana@ufms.br")"""
+    return unicodedata.normalize("NFKC", email or "").strip().casefold()
+
+
+def eh_admin(usuario):
+    """Indica se o usuário está na lista de administradores (variável de ambiente VITRINE_ADMINS, separada por vírgulas)"""
+    admins = {normalizar_usuario(nome) for nome in os.environ.get("VITRINE_ADMINS", "").split(",")}
+    admins.discard("")
+    return normalizar_usuario(usuario) in admins
+
+
+class DiretorioUsuarios:
+    """Diretório em memória das contas, indexado por usuário e por e-mail normalizados.
+
+    Login, checagem de duplicidade no cadastro e busca do dono de um TCC
+    viram consultas a dicionários. A unicidade de verdade é garantida pelos
+    índices UNIQUE do banco; o diretório só espelha o que já foi gravado.
+    """
+
+    def __init__(self):
+        self._por_usuario = {}     # usuário normalizado -> registro completo da conta
+        self._por_email = {}       # e-mail normalizado -> usuário normalizado
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._por_usuario)
+
+    def adicionar(self, registro):
+        """Inclui (ou substitui) uma conta no diretório"""
+        chave = normalizar_usuario(registro["usuario"])
+        with self._lock:
+            self._por_usuario[chave] = registro
+            self._por_email[normalizar_email(registro["email"])] = chave
+
+    def obter(self, usuario):
+        """Retorna o registro da conta, ou None"""
+        return self._por_usuario.get(normalizar_usuario(usuario))
+
+    def obter_por_email(self, email):
+        """Retorna o registro da conta dona do e-mail, ou None"""
+        chave = self._por_email.get(normalizar_email(email))
+        return self._por_usuario.get(chave) if chave is not None else None
@@ -0,0 +1,24 @@
+import datetime
+
+# Regras do formulário de TCC, compartilhadas com a importação em lote
+CAMPOS_OBRIGATORIOS_TCC = ("titulo", "autor", "curso", "resumo")
+ANO_MINIMO = 2000
+
+
+def ano_maximo():
+    """Maior ano aceito para um TCC (o ano que vem)"""
+    return datetime.datetime.now().year + 1
+
+
+def validar_tcc(tcc):
+    """Valida os dados de um TCC e retorna a lista de erros (vazia se estiver tudo certo)"""
+    erros = []
+    if any(not str(tcc.get(campo) or "").strip() for campo in CAMPOS_OBRIGATORIOS_TCC):
+        erros.append("Preencha todos os campos obrigatórios (*)")
+
+    ano = tcc.get("ano")
+    if not isinstance(ano, int) or isinstance(ano, bool):
+        erros.append("Ano inválido")
+    elif not ANO_MINIMO <= ano <= ano_maximo():
+        erros.append(f"O ano deve estar entre {ANO_MINIMO} e {ano_maximo()}")
+    return erros
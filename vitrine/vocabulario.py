@@ -0,0 +1,316 @@
+"""Vocabulário de curso, instituição e orientador: sugestões e unificação de variantes.
+
+Além do índice usado pelas telas, tem uma rotina para gravar nos TCCs já
+cadastrados o nome canônico de cada valor (uma vez, para os dados de antes
+da unificação, ou depois de uma importação antiga):
+
+    python -m vitrine.vocabulario --simular
+    python -m vitrine.vocabulario
+"""
+import argparse
+import heapq
+import re
+import sys
+import threading
+
+from vitrine.armazenamento import obter_armazenamento
+from vitrine.busca import normalizar
+
+# Campos de texto livre com sugestões e unificação de variantes
+CAMPOS_VOCABULARIO = ("curso", "instituicao", "orientador")
+# Abreviações comuns, expandidas na chave de comparação ("Eng. Civil" = "Engenharia Civil")
+ABREVIACOES = {
+    "eng": "engenharia",
+    "adm": "administracao",
+    "admin": "administracao",
+    "cienc": "ciencia",
+    "ciencias": "ciencia",
+    "comp": "computacao",
+    "sist": "sistemas",
+    "tec": "tecnologia",
+    "tecn": "tecnologia",
+    "univ": "universidade",
+    "fed": "federal",
+    "est": "estadual",
+}
+# Palavras que não distinguem valores: conectivos e, no orientador, títulos ("Prof. Dr. Ana" = "Ana")
+IGNORADAS = frozenset(("de", "da", "do", "das", "dos", "e"))
+TITULOS = frozenset(("prof", "profa", "professor", "professora", "dr", "dra", "doutor", "doutora",
+                     "me", "ma", "msc", "mestre", "phd"))
+# Quantas sugestões cada nó da árvore guarda prontas (pedidos maiores percorrem a subárvore)
+LIMITE_SUGESTOES = 10
+
+_RE_PALAVRA = re.compile(r"\w+")
+
+
+def chave_vocabulario(campo, texto, parcial=False):
+    """Chave de comparação de um valor ("Eng. de Computação" -> "engenharia computacao").
+
+    Com `parcial`, o texto é o início do que o usuário está digitando: a
+    última palavra fica como está, já que pode ser só o começo de outra.
+    """
+    normal = normalizar(texto)
+    palavras = _RE_PALAVRA.findall(normal)
+    incompleta = palavras.pop() if parcial and palavras and normal[-1:].isalnum() else None
+    ignoradas = IGNORADAS | TITULOS if campo == "orientador" else IGNORADAS
+    chave = [ABREVIACOES.get(palavra, palavra) for palavra in palavras if palavra not in ignoradas]
+    if incompleta:
+        chave.append(incompleta)
+    return " ".join(chave)
+
+
+class _No:
+    __slots__ = ("filhos", "chaves", "melhores")
+
+    def __init__(self):
+        self.filhos = {}
+        self.chaves = set()     # chaves que terminam neste nó
+        self.melhores = None    # as LIMITE_SUGESTOES chaves mais frequentes da subárvore (None: a recalcular)
+
+
+class ArvoreSugestoes:
+    """Árvore de prefixos das chaves de um campo, com as mais frequentes de cada prefixo prontas.
+
+    Cada chave entra pelo começo de cada palavra, então "civ" acha
+    "engenharia civil". A lista de um nó sai das listas dos filhos, e
+    quando uma contagem sobe as listas do caminho são ajustadas na hora;
+    quando desce, só as listas em que a chave aparecia são descartadas e
+    refeitas na próxima consulta.
+    """
+
+    def __init__(self):
+        self._raiz = _No()
+        self._consultada = False    # até a primeira consulta não há listas prontas para manter
+        self.contagens = {}
+
+    def _caminhos(self, chave):
+        inicios = [0] + [posicao + 1 for posicao, letra in enumerate(chave) if letra == " "]
+        for inicio in inicios:
+            no = self._raiz
+            nos = [no]
+            for letra in chave[inicio:]:
+                no = no.filhos.setdefault(letra, _No())
+                nos.append(no)
+            yield nos
+
+    def _ordem(self, chave):
+        return (-self.contagens[chave], chave)
+
+    def alterar(self, chave, diferenca):
+        """Soma `diferenca` à contagem da chave (com zero ela sai da árvore)"""
+        existia = chave in self.contagens
+        contagem = self.contagens.get(chave, 0) + diferenca
+        if contagem > 0:
+            self.contagens[chave] = contagem
+        else:
+            self.contagens.pop(chave, None)
+        if existia and contagem > 0 and not self._consultada:
+            return
+        for nos in self._caminhos(chave):
+            if contagem > 0:
+                nos[-1].chaves.add(chave)
+            else:
+                nos[-1].chaves.discard(chave)
+            for no in nos:
+                if no.melhores is None:
+                    continue
+                if diferenca < 0 and chave in no.melhores:
+                    no.melhores = None
+                elif diferenca > 0 and contagem > 0:
+                    if chave not in no.melhores:
+                        no.melhores.append(chave)
+                    no.melhores.sort(key=self._ordem)
+                    del no.melhores[LIMITE_SUGESTOES:]
+
+    def _melhores(self, no):
+        # Pós-ordem sem recursão (chaves longas fariam caminhos fundos), descendo só onde falta a lista
+        pilha = [(no, False)]
+        while pilha:
+            atual, filhos_prontos = pilha.pop()
+            if filhos_prontos:
+                candidatas = set(atual.chaves)
+                for filho in atual.filhos.values():
+                    candidatas.update(filho.melhores)
+                atual.melhores = heapq.nsmallest(LIMITE_SUGESTOES, candidatas, key=self._ordem)
+            elif atual.melhores is None:
+                pilha.append((atual, True))
+                pilha.extend((filho, False) for filho in atual.filhos.values() if filho.melhores is None)
+        return no.melhores
+
+    def _subarvore(self, no):
+        encontradas = set()
+        pilha = [no]
+        while pilha:
+            atual = pilha.pop()
+            encontradas.update(atual.chaves)
+            pilha.extend(atual.filhos.values())
+        return encontradas
+
+    def sugerir(self, prefixo, limite=LIMITE_SUGESTOES):
+        """Chaves que têm uma palavra começando por `prefixo`, das mais frequentes para as menos"""
+        if limite > LIMITE_SUGESTOES:
+            # Listas longas (ex.: as opções de um campo) não ficam guardadas nos nós
+            candidatas = self.contagens if not prefixo else self._subarvore(self._no(prefixo) or _No())
+            return heapq.nsmallest(limite, candidatas, key=self._ordem)
+        no = self._no(prefixo)
+        if no is None:
+            return []
+        self._consultada = True
+        return self._melhores(no)[:limite]
+
+    def _no(self, prefixo):
+        no = self._raiz
+        for letra in prefixo:
+            no = no.filhos.get(letra)
+            if no is None:
+                return None
+        return no
+
+
+class IndiceVocabulario:
+    """Valores já usados em curso, instituição e orientador, para sugerir e unificar o que é digitado.
+
+    Valores com a mesma chave (ver chave_vocabulario) são variantes de um
+    só: "Eng. Civil", "Engenharia Civil" e "engenharia civil". O nome
+    canônico é a variante mais usada, e as sugestões vêm de uma árvore de
+    prefixos por campo, ordenadas pelo número de TCCs.
+    """
+
+    def __init__(self):
+        self._arvores = {campo: ArvoreSugestoes() for campo in CAMPOS_VOCABULARIO}
+        self._variantes = {campo: {} for campo in CAMPOS_VOCABULARIO}    # chave -> {nome: quantidade}
+        self._chaves = {campo: {} for campo in CAMPOS_VOCABULARIO}       # nome em uso -> chave
+        self._valores_doc = {}     # tcc_id -> (chave, nome) de cada campo
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._valores_doc)
+
+    def adicionar(self, tcc):
+        """Indexa (ou reindexa) os valores de um TCC"""
+        with self._lock:
+            tcc_id = tcc["id"]
+            self.remover(tcc_id)
+            valores = []
+            for campo in CAMPOS_VOCABULARIO:
+                nome = " ".join((tcc.get(campo) or "").split())
+                chave = self._chaves[campo].get(nome)
+                if chave is None:
+                    chave = chave_vocabulario(campo, nome)
+                if chave:
+                    self._chaves[campo][nome] = chave
+                    variantes = self._variantes[campo].setdefault(chave, {})
+                    variantes[nome] = variantes.get(nome, 0) + 1
+                    self._arvores[campo].alterar(chave, 1)
+                valores.append((chave, nome))
+            self._valores_doc[tcc_id] = tuple(valores)
+
+    def remover(self, tcc_id):
+        """Remove os valores de um TCC (não faz nada se ele não estiver indexado)"""
+        with self._lock:
+            valores = self._valores_doc.pop(tcc_id, None)
+            if valores is None:
+                return
+            for campo, (chave, nome) in zip(CAMPOS_VOCABULARIO, valores):
+                if not chave:
+                    continue
+                variantes = self._variantes[campo][chave]
+                variantes[nome] -= 1
+                if not variantes[nome]:
+                    del variantes[nome]
+                    del self._chaves[campo][nome]
+                if not variantes:
+                    del self._variantes[campo][chave]
+                self._arvores[campo].alterar(chave, -1)
+
+    def aplicar_evento(self, evento, tcc):
+        """Mantém o índice em dia com uma escrita do armazenamento"""
+        if evento == "excluido":
+            self.remover(tcc["id"])
+        else:
+            self.adicionar(tcc)
+
+    def _nome(self, campo, chave):
+        variantes = self._variantes[campo][chave]
+        return max(variantes, key=lambda nome: (variantes[nome], nome))
+
+    def sugerir(self, campo, texto="", limite=LIMITE_SUGESTOES):
+        """Nomes canônicos dos valores em que alguma palavra começa pelo `texto` digitado (vazio: os mais usados)"""
+        with self._lock:
+            chaves = self._arvores[campo].sugerir(chave_vocabulario(campo, texto, parcial=True), limite)
+            return [self._nome(campo, chave) for chave in chaves]
+
+    def canonico(self, campo, valor):
+        """Nome canônico do valor, se ele for variante de um já usado; senão o próprio valor, sem espaços sobrando"""
+        nome = " ".join((valor or "").split())
+        with self._lock:
+            chave = chave_vocabulario(campo, nome)
+            if chave in self._variantes[campo]:
+                return self._nome(campo, chave)
+        return nome
+
+    def divergentes(self):
+        """{tcc_id: {campo: nome canônico}} dos TCCs gravados com uma variante que não é a canônica"""
+        with self._lock:
+            canonicos = {campo: {} for campo in CAMPOS_VOCABULARIO}
+            divergentes = {}
+            for tcc_id, valores in self._valores_doc.items():
+                for campo, (chave, nome) in zip(CAMPOS_VOCABULARIO, valores):
+                    if not chave:
+                        continue
+                    canonico = canonicos[campo].get(chave)
+                    if canonico is None:
+                        canonico = canonicos[campo][chave] = self._nome(campo, chave)
+                    if nome != canonico:
+                        divergentes.setdefault(tcc_id, {})[campo] = canonico
+            return divergentes
+
+    def canonizar(self, registro):
+        """Troca, no dicionário, os valores dos campos de CAMPOS_VOCABULARIO pelos nomes canônicos"""
+        for campo in CAMPOS_VOCABULARIO:
+            if registro.get(campo):
+                registro[campo] = self.canonico(campo, registro[campo])
+        return registro
+
+
+def obter_indice_vocabulario(armazenamento):
+    """Retorna o índice de vocabulário ligado ao armazenamento, montando-o na primeira chamada"""
+    return armazenamento.obter_indice("vocabulario", IndiceVocabulario)
+
+
+def unificar_variantes(armazenamento):
+    """Grava o nome canônico nos TCCs que usam outra variante ("Eng. Civil" -> "Engenharia Civil").
+
+    Cada TCC passa por atualizar_tcc, então agregados, filtros e índices
+    (inclusive este) ficam em dia. Retorna quantos TCCs foram alterados.
+    """
+    armazenamento.sincronizar()
+    alterados = 0
+    for tcc_id, campos in obter_indice_vocabulario(armazenamento).divergentes().items():
+        if armazenamento.atualizar_tcc(tcc_id, campos):
+            alterados += 1
+    return alterados
+
+
+def main(argv=None):
+    """Ponto de entrada da linha de comando: unifica as variantes já gravadas"""
+    parser = argparse.ArgumentParser(description="Grava o nome canônico de curso, instituição e orientador nos TCCs")
+    parser.add_argument("--simular", action="store_true", help="só lista o que seria alterado")
+    args = parser.parse_args(argv)
+
+    armazenamento = obter_armazenamento()
+    if args.simular:
+        armazenamento.sincronizar()
+        divergentes = obter_indice_vocabulario(armazenamento).divergentes()
+        for tcc_id, campos in sorted(divergentes.items()):
+            tcc = armazenamento.obter_tcc(tcc_id)
+            for campo, nome in campos.items():
+                print(f"TCC {tcc_id}: {campo} \"{tcc[campo]}\" -> \"{nome}\"")
+        print(f"{len(divergentes)} TCC(s) seriam alterados")
+        return 0
+    print(f"{unificar_variantes(armazenamento)} TCC(s) alterados")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())